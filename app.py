@@ -10,7 +10,14 @@ import plotly.graph_objects as go
 from datetime import datetime, timedelta
 import requests
 import os
+import time
 from weather_api import WeatherAPI
+from key_pool import parse_keys
+from forecast_charts import build_forecast_view, build_comparison_view
+from config import (
+    APP_WEATHER_CACHE_TTL, APP_FORECAST_VIEW_TTL, PREFETCH_ENABLED, DEBUG_PANEL_ENABLED, OPENWEATHER_API_KEYS
+)
+from metrics import METRICS, span, start_trace
 from korean_locations import get_popular_korean_locations
 from location_service import render_location_component, parse_location_data
 
@@ -22,11 +29,183 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# 이번 재실행의 단계별 소요 시간 기록 (사이드바 성능 디버그 패널에 표시)
+rerun_trace = start_trace('rerun')
+
 # API 키 설정 (환경변수 또는 Streamlit secrets 사용)
 API_KEY = st.secrets.get("OPENWEATHER_API_KEY", os.getenv("OPENWEATHER_API_KEY", "bed963520292a4fcf7ee4f9110312c6a"))
+# 키 여러 개를 나눠 쓰려면 secrets의 OPENWEATHER_API_KEYS(목록 또는 쉼표로 구분한 문자열) 또는 환경변수 사용
+API_KEYS = tuple(parse_keys(st.secrets.get("OPENWEATHER_API_KEYS", OPENWEATHER_API_KEYS))) or (API_KEY,)
+
+
+# 사이드바 '인기 지역 선택'의 지역 버튼
+SEOUL_AREAS = ["강남구", "홍대", "명동", "잠실동", "압구정동", "이태원"]
+OTHER_AREAS = ["해운대구", "제주", "춘천", "강릉", "부산", "대구"]
+
+
+@st.cache_resource
+def get_weather_api(api_keys):
+    """
+    WeatherAPI 인스턴스를 만듭니다. (모든 세션과 재실행에서 연결 풀, 캐시, 키 풀을 공유)
+    인기 지역은 백그라운드에서 캐시 만료 전에 미리 갱신해 선택하면 바로 표시됩니다.
+    """
+    api = WeatherAPI(api_keys)
+    if PREFETCH_ENABLED:
+        api.start_prefetch(get_popular_korean_locations() + SEOUL_AREAS + OTHER_AREAS)
+    return api
+
+
+class IncompleteWeatherData(Exception):
+    """
+    현재 날씨나 예보 중 하나라도 가져오지 못했거나 지난 데이터로 대신한 경우
+    (실패/지난 결과를 캐시하지 않기 위해 사용, 서버가 회복되면 다음 실행에서 새 데이터 표시)
+    """
 
-# WeatherAPI 인스턴스 생성
-weather_api = WeatherAPI(API_KEY)
+    def __init__(self, current_weather, forecast_data):
+        super().__init__("날씨 데이터를 모두 가져오지 못했습니다.")
+        self.current_weather = current_weather
+        self.forecast_data = forecast_data
+
+
+def _stale_age(current_weather, forecast_data):
+    """서버 지연/오류로 지난 데이터를 받았다면 가장 오래된 데이터의 경과 시간(초), 아니면 None"""
+    ages = []
+    if current_weather is not None:
+        ages.append(current_weather.get('stale_seconds'))
+    if isinstance(forecast_data, pd.DataFrame):
+        ages.append(forecast_data.attrs.get('stale_seconds'))
+    ages = [age for age in ages if age is not None]
+    return max(ages) if ages else None
+
+
+def _show_stale_warning(age, location=None):
+    target = f"'{location}' " if location else ""
+    st.warning(f"⏳ 날씨 서버 응답이 늦어 {target}{age / 60:.0f}분 전 데이터를 표시합니다. 잠시 후 새 데이터로 바뀝니다.")
+
+
+def _complete_bundle(current_weather, forecast_data):
+    if current_weather is None or forecast_data is None or _stale_age(current_weather, forecast_data) is not None:
+        raise IncompleteWeatherData(current_weather, forecast_data)
+    # 조회 시각은 예보 화면 캐시 키로 사용 (새로 조회하면 화면도 다시 생성)
+    return current_weather, forecast_data, time.time()
+
+
+@st.cache_data(ttl=APP_WEATHER_CACHE_TTL, show_spinner=False)
+def fetch_weather(city_name):
+    """지역명으로 현재 날씨와 예보를 가져옵니다. (위치별로 캐시)"""
+    return _complete_bundle(*weather_api.get_weather_bundle(city_name, as_frame=True))
+
+
+@st.cache_data(ttl=APP_WEATHER_CACHE_TTL, show_spinner=False)
+def fetch_weather_by_coords(lat, lon):
+    """좌표로 현재 날씨와 예보를 가져옵니다. (위치별로 캐시)"""
+    return _complete_bundle(*weather_api.get_weather_bundle_by_coords(lat, lon, as_frame=True))
+
+
+@st.cache_data(ttl=APP_FORECAST_VIEW_TTL, show_spinner=False)
+def load_forecast_view(location_key, fetched_at, _forecast_data):
+    """
+    예보 DataFrame, 일별 데이터, 차트를 만듭니다.
+    예보 데이터 자체는 해싱하지 않고 (위치, 조회 시각)을 캐시 키로 사용합니다.
+    """
+    return build_forecast_view(_forecast_data)
+
+
+class IncompleteComparisonData(Exception):
+    """비교할 지역 중 일부의 날씨를 가져오지 못했거나 지난 데이터로 대신한 경우 (캐시하지 않기 위해 사용)"""
+
+    def __init__(self, bundles, errors):
+        super().__init__("일부 지역의 날씨 데이터를 가져오지 못했습니다.")
+        self.bundles = bundles
+        self.errors = errors
+
+
+@st.cache_data(ttl=APP_WEATHER_CACHE_TTL, show_spinner=False)
+def fetch_comparison(locations):
+    """여러 지역의 현재 날씨와 예보를 동시에 가져옵니다. (지역 목록별로 캐시)"""
+    results, errors = {}, {}
+    for item in weather_api.get_weather_bundle_many(locations, as_frame=True):
+        if item['error']:
+            errors[item['query']] = item['error']
+        else:
+            results[item['query']] = item['result']
+    
+    # 완료 순서와 관계없이 선택한 순서대로 표시
+    bundles = {location: results[location] for location in locations if location in results}
+    if errors or any(_stale_age(*bundle) is not None for bundle in bundles.values()):
+        raise IncompleteComparisonData(bundles, errors)
+    return bundles, time.time()
+
+
+@st.cache_data(ttl=APP_FORECAST_VIEW_TTL, show_spinner=False)
+def load_comparison_view(locations, fetched_at, _bundles):
+    """지역 비교용 통합 DataFrame과 차트를 만듭니다. ((지역 목록, 조회 시각)을 캐시 키로 사용)"""
+    return build_comparison_view(_bundles)
+
+
+def render_chart(fig):
+    """Plotly 차트를 표시합니다. (표시에 걸린 시간을 'app.render' 단계로 기록)"""
+    with span('app.render'):
+        st.plotly_chart(fig, use_container_width=True, config={'displayModeBar': False})
+
+
+def render_debug_panel(trace):
+    """사이드바에 이번 재실행의 단계별 소요 시간, 캐시/외부 API 통계, 내보내기 버튼을 표시합니다."""
+    with st.sidebar.expander("🔍 성능 디버그", expanded=True):
+        st.caption(f"이번 실행: {trace.duration * 1000:.1f}ms (캐시된 단계는 기록되지 않음)")
+        
+        breakdown = pd.DataFrame(
+            sorted(trace.breakdown().items(), key=lambda item: -item[1]),
+            columns=['단계', 'ms']
+        )
+        st.dataframe(breakdown, hide_index=True, use_container_width=True)
+        
+        spans = trace.rows()
+        if spans:
+            st.markdown("**단계 순서**")
+            st.dataframe(pd.DataFrame([
+                {
+                    '단계': '　' * record['depth'] + record['name'],
+                    '시작(ms)': record['start_ms'],
+                    'ms': record['duration_ms'],
+                    '정보': ', '.join(f"{key}={value}" for key, value in record['labels'].items())
+                }
+                for record in spans
+            ]), hide_index=True, use_container_width=True)
+        
+        key_stats = weather_api.key_pool.stats()
+        if len(key_stats) > 1:
+            st.markdown("**API 키별 사용량**")
+            st.dataframe(pd.DataFrame([
+                {
+                    '키': label,
+                    '상태': '사용' if stats['available'] else f"제외 ({stats['evicted_for']:.0f}초)",
+                    '요청': stats['requests'],
+                    '오류': stats['errors'],
+                    '401': stats['unauthorized'],
+                    '429': stats['rate_limited'],
+                    '분당': stats['quota']['minute']
+                }
+                for label, stats in key_stats.items()
+            ]), hide_index=True, use_container_width=True)
+        
+        counters = [row for row in METRICS.snapshot() if row['type'] != 'histogram']
+        if counters:
+            st.markdown("**누적 통계 (프로세스 전체)**")
+            st.dataframe(pd.DataFrame([
+                {'항목': row['name'], '레이블': ', '.join(f"{k}={v}" for k, v in row['labels'].items()),
+                 '값': row['value']}
+                for row in counters
+            ]), hide_index=True, use_container_width=True)
+        
+        st.download_button("Prometheus 형식", METRICS.to_prometheus(),
+                           file_name="weather_metrics.prom", mime="text/plain")
+        st.download_button("JSON lines", METRICS.to_json_lines() + "\n" + trace.to_json_lines(),
+                           file_name="weather_metrics.jsonl", mime="application/x-ndjson")
+
+
+# WeatherAPI 인스턴스 (공유 리소스)
+weather_api = get_weather_api(API_KEYS)
 
 # CSS 스타일링
 st.markdown("""
@@ -71,9 +250,12 @@ st.sidebar.header("🔍 지역 검색")
 # 검색 방법 선택
 search_method = st.sidebar.radio(
     "검색 방법을 선택하세요:",
-    ["직접 입력", "인기 지역 선택", "📍 현재 위치"]
+    ["직접 입력", "인기 지역 선택", "📍 현재 위치", "🆚 지역 비교"]
 )
 
+# 지역 비교 모드에서 선택한 지역 목록
+compare_locations = []
+
 if search_method == "직접 입력":
     city_input = st.sidebar.text_input(
         "지역명을 입력하세요:", 
@@ -85,7 +267,11 @@ if search_method == "직접 입력":
     # 실시간 검색 제안 (입력이 있을 때만)
     if city_input and len(city_input) > 1:
         with st.sidebar.expander("💡 검색 제안", expanded=False):
-            search_results = weather_api.search_locations(city_input, limit=5)
+            # 입력이 바뀐 경우에만 검색 (다른 위젯 조작으로 인한 재실행 시 이전 결과 재사용)
+            if st.session_state.get('suggestion_query') != city_input:
+                st.session_state.suggestion_query = city_input
+                st.session_state.suggestion_results = weather_api.search_locations(city_input, limit=5)
+            search_results = st.session_state.suggestion_results
             
             if search_results:
                 st.write("다음 지역들을 찾았습니다:")
@@ -114,18 +300,16 @@ elif search_method == "인기 지역 선택":
             selected_city = city
     
     st.sidebar.subheader("🏘️ 서울 주요 구역")
-    seoul_areas = ["강남구", "홍대", "명동", "잠실동", "압구정동", "이태원"]
     cols = st.sidebar.columns(2)
     
-    for i, area in enumerate(seoul_areas):
+    for i, area in enumerate(SEOUL_AREAS):
         if cols[i % 2].button(area, key=f"seoul_area_{area}"):
             selected_city = area
     
     st.sidebar.subheader("🌊 기타 인기 지역")
-    other_areas = ["해운대구", "제주", "춘천", "강릉", "부산", "대구"]
     cols = st.sidebar.columns(2)
     
-    for i, area in enumerate(other_areas):
+    for i, area in enumerate(OTHER_AREAS):
         if cols[i % 2].button(area, key=f"other_area_{area}"):
             selected_city = area
     
@@ -166,6 +350,26 @@ elif search_method == "📍 현재 위치":
         # 기본값으로 서울 설정
         city_input = "서울"
 
+elif search_method == "🆚 지역 비교":
+    st.sidebar.subheader("🆚 지역 비교")
+    
+    selected_locations = st.sidebar.multiselect(
+        "비교할 지역을 선택하세요:",
+        options=get_popular_korean_locations(),
+        default=["서울", "부산", "제주"]
+    )
+    extra_locations = st.sidebar.text_input(
+        "추가 지역 (쉼표로 구분):",
+        placeholder="예: 강남구, Tokyo"
+    )
+    
+    compare_locations = list(selected_locations)
+    for location in extra_locations.split(","):
+        location = location.strip()
+        if location and location not in compare_locations:
+            compare_locations.append(location)
+    city_input = None
+
 # 검색 팁 표시
 with st.sidebar.expander("💭 검색 팁", expanded=False):
     st.markdown("""
@@ -198,166 +402,192 @@ with st.sidebar.expander("💭 검색 팁", expanded=False):
     """)
 
 # 메인 앱 로직
-if city_input:
+if search_method == "🆚 지역 비교":
+    if compare_locations:
+        with st.spinner(f"{len(compare_locations)}개 지역의 날씨 정보를 가져오는 중..."):
+            # 모든 지역을 동시에 조회 (지역 목록별 캐시)
+            try:
+                with span('app.fetch'):
+                    bundles, fetched_at = fetch_comparison(tuple(compare_locations))
+            except IncompleteComparisonData as e:
+                bundles, fetched_at = e.bundles, None
+                for location, error in e.errors.items():
+                    # 오류 내용은 서버 로그에만 남김 (화면에는 일반 안내만 표시)
+                    print(f"'{location}' 비교 조회 중 오류 발생: {error}")
+                    st.warning(f"'{location}' 날씨 정보를 가져오지 못했습니다. 지역명을 확인하거나 잠시 후 다시 시도해주세요.")
+                for location, bundle in e.bundles.items():
+                    age = _stale_age(*bundle)
+                    if age is not None:
+                        _show_stale_warning(age, location)
+        
+        if bundles:
+            # 통합 DataFrame과 지표별 차트 생성 (지역 수와 관계없이 차트는 지표당 하나)
+            with span('app.view'):
+                if fetched_at is None:
+                    view = build_comparison_view(bundles)
+                else:
+                    view = load_comparison_view(tuple(compare_locations), fetched_at, bundles)
+            figures = view['figures']
+            
+            st.subheader("🌡️ 현재 날씨 비교")
+            st.dataframe(view['summary'], use_container_width=True)
+            
+            st.subheader("📈 예보 비교")
+            render_chart(figures['temperature'])
+            
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                render_chart(figures['pop'])
+            
+            with col2:
+                render_chart(figures['wind_speed'])
+    else:
+        st.info("👈 사이드바에서 비교할 지역을 선택해주세요.")
+
+elif city_input:
     # 현재 위치 날씨인지 확인
     if city_input == "current_location" and hasattr(st.session_state, 'current_lat'):
         lat = st.session_state.current_lat
         lon = st.session_state.current_lon
         
+        location_key = ('coords', lat, lon)
+        
         with st.spinner(f"현재 위치 ({lat:.4f}, {lon:.4f})의 날씨 정보를 가져오는 중..."):
-            # 좌표 기반 현재 날씨 정보 가져오기
-            current_weather = weather_api.get_current_weather_by_coords(lat, lon)
+            # 좌표 기반 현재 날씨와 예보를 함께 가져오기 (위치별 캐시)
+            try:
+                with span('app.fetch'):
+                    current_weather, forecast_data, fetched_at = fetch_weather_by_coords(lat, lon)
+            except IncompleteWeatherData as e:
+                current_weather, forecast_data, fetched_at = e.current_weather, e.forecast_data, None
     else:
+        location_key = ('name', city_input)
+        
         with st.spinner(f"{city_input}의 날씨 정보를 가져오는 중..."):
-            # 일반 도시명 기반 현재 날씨 정보 가져오기
-            current_weather = weather_api.get_current_weather(city_input)
+            # 일반 도시명 기반 현재 날씨와 예보를 함께 가져오기 (좌표 조회 1회, 위치별 캐시)
+            try:
+                with span('app.fetch'):
+                    current_weather, forecast_data, fetched_at = fetch_weather(city_input)
+            except IncompleteWeatherData as e:
+                current_weather, forecast_data, fetched_at = e.current_weather, e.forecast_data, None
+    
+    stale_age = _stale_age(current_weather, forecast_data)
+    if stale_age is not None:
+        _show_stale_warning(stale_age)
+    
+    if current_weather:
+        # 현재 날씨 표시
+        location_info = f"{current_weather['city']}, {current_weather['country']}"
         
-        if current_weather:
-            # 현재 날씨 표시
-            location_info = f"{current_weather['city']}, {current_weather['country']}"
-            
-            # 현재 위치인 경우 좌표 정보도 표시
-            if city_input == "current_location" and 'coordinates' in current_weather:
-                coords = current_weather['coordinates']
-                location_info += f" (📍 {coords['lat']:.4f}, {coords['lon']:.4f})"
-            
-            st.success(f"✅ {location_info}의 날씨 정보를 성공적으로 가져왔습니다!")
+        # 현재 위치인 경우 좌표 정보도 표시
+        if city_input == "current_location" and 'coordinates' in current_weather:
+            coords = current_weather['coordinates']
+            location_info += f" (📍 {coords['lat']:.4f}, {coords['lon']:.4f})"
+        
+        st.success(f"✅ {location_info}의 날씨 정보를 성공적으로 가져왔습니다!")
+        
+        # 현재 날씨 카드
+        col1, col2, col3 = st.columns([2, 1, 1])
+        
+        with col1:
+            st.markdown(f"""
+            <div class="weather-card">
+                <h2>현재 날씨</h2>
+                <div style="display: flex; align-items: center; justify-content: center; gap: 20px;">
+                    <img src="{weather_api.get_weather_icon_url(current_weather['weather_icon'])}" 
+                         style="width: 100px; height: 100px;">
+                    <div>
+                        <h1 style="margin: 0; font-size: 4rem;">{current_weather['temperature']}°C</h1>
+                        <p style="margin: 0; font-size: 1.2rem;">{current_weather['weather_description']}</p>
+                        <p style="margin: 0; opacity: 0.8;">체감온도: {current_weather['feels_like']}°C</p>
+                    </div>
+                </div>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with col2:
+            st.metric("습도", f"{current_weather['humidity']}%", delta=None)
+            st.metric("기압", f"{current_weather['pressure']} hPa", delta=None)
+            st.metric("가시거리", f"{current_weather['visibility']} km", delta=None)
+        
+        with col3:
+            st.metric("풍속", f"{current_weather['wind_speed']} m/s", delta=None)
+            st.metric("구름", f"{current_weather['clouds']}%", delta=None)
+            st.metric("일출", current_weather['sunrise'], delta=None)
+            st.metric("일몰", current_weather['sunset'], delta=None)
+        
+        # 5일 예보 표시
+        st.subheader("📅 5일 날씨 예보")
+        
+        if forecast_data is not None:
+            # 데이터프레임과 차트 생성 (같은 위치/조회 결과면 재실행 시 재사용)
+            with span('app.view'):
+                if fetched_at is None:
+                    view = build_forecast_view(forecast_data)
+                else:
+                    view = load_forecast_view(location_key, fetched_at, forecast_data)
+            daily_data = view['daily']
+            figures = view['figures']
             
-            # 현재 날씨 카드
-            col1, col2, col3 = st.columns([2, 1, 1])
+            # 온도 차트
+            col1, col2 = st.columns(2)
             
             with col1:
-                st.markdown(f"""
-                <div class="weather-card">
-                    <h2>현재 날씨</h2>
-                    <div style="display: flex; align-items: center; justify-content: center; gap: 20px;">
-                        <img src="{weather_api.get_weather_icon_url(current_weather['weather_icon'])}" 
-                             style="width: 100px; height: 100px;">
-                        <div>
-                            <h1 style="margin: 0; font-size: 4rem;">{current_weather['temperature']}°C</h1>
-                            <p style="margin: 0; font-size: 1.2rem;">{current_weather['weather_description']}</p>
-                            <p style="margin: 0; opacity: 0.8;">체감온도: {current_weather['feels_like']}°C</p>
-                        </div>
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
+                # 시간별 온도 변화 차트
+                render_chart(figures['temperature'])
             
             with col2:
-                st.metric("습도", f"{current_weather['humidity']}%", delta=None)
-                st.metric("기압", f"{current_weather['pressure']} hPa", delta=None)
-                st.metric("가시거리", f"{current_weather['visibility']} km", delta=None)
+                # 습도 차트
+                render_chart(figures['humidity'])
             
-            with col3:
-                st.metric("풍속", f"{current_weather['wind_speed']} m/s", delta=None)
-                st.metric("구름", f"{current_weather['clouds']}%", delta=None)
-                st.metric("일출", current_weather['sunrise'], delta=None)
-                st.metric("일몰", current_weather['sunset'], delta=None)
+            # 일별 예보 카드
+            st.subheader("📊 일별 예보")
+            cols = st.columns(5)
             
-            # 5일 예보 가져오기
-            st.subheader("📅 5일 날씨 예보")
+            for i, (_, day) in enumerate(daily_data.iterrows()):
+                if i < 5:  # 5일간만 표시
+                    with cols[i]:
+                        date_obj = datetime.strptime(day['date'], '%Y-%m-%d')
+                        day_name = date_obj.strftime('%m/%d\n%a')
+                        
+                        st.markdown(f"""
+                        <div class="forecast-card">
+                            <h4>{day_name}</h4>
+                            <img src="{weather_api.get_weather_icon_url(day['weather_icon'])}" 
+                                 style="width: 60px; height: 60px;">
+                            <p style="margin: 5px 0; font-weight: bold;">
+                                {int(day['temp_max'])}° / {int(day['temp_min'])}°
+                            </p>
+                            <p style="margin: 0; font-size: 0.8rem; color: #666;">
+                                {day['weather_description']}
+                            </p>
+                            <p style="margin: 0; font-size: 0.8rem; color: #1f77b4;">
+                                강수: {int(day['pop'])}%
+                            </p>
+                        </div>
+                        """, unsafe_allow_html=True)
             
-            # 현재 위치인지 확인하여 적절한 API 호출
-            if city_input == "current_location" and hasattr(st.session_state, 'current_lat'):
-                forecast_data = weather_api.get_5day_forecast_by_coords(
-                    st.session_state.current_lat, 
-                    st.session_state.current_lon
-                )
-            else:
-                forecast_data = weather_api.get_5day_forecast(city_input)
+            # 상세 예보 테이블
+            with st.expander("📋 상세 예보 보기"):
+                st.dataframe(view['table'], use_container_width=True)
             
-            if forecast_data:
-                # 데이터프레임 생성
-                df = pd.DataFrame(forecast_data)
-                df['datetime'] = pd.to_datetime(df['datetime'])
-                
-                # 일별 데이터 그룹화 (최고/최저 온도)
-                daily_data = df.groupby('date').agg({
-                    'temp_max': 'max',
-                    'temp_min': 'min',
-                    'humidity': 'mean',
-                    'weather_description': 'first',
-                    'weather_icon': 'first',
-                    'pop': 'max'
-                }).reset_index()
-                
-                # 온도 차트
-                col1, col2 = st.columns(2)
-                
-                with col1:
-                    # 시간별 온도 변화 차트
-                    fig_temp = px.line(df, x='datetime', y='temperature', 
-                                     title='시간별 온도 변화',
-                                     labels={'temperature': '온도 (°C)', 'datetime': '시간'})
-                    fig_temp.update_layout(height=400)
-                    st.plotly_chart(fig_temp, use_container_width=True, config={'displayModeBar': False})
-                
-                with col2:
-                    # 습도 차트
-                    fig_humidity = px.bar(df, x='time', y='humidity',
-                                        title='시간별 습도',
-                                        labels={'humidity': '습도 (%)', 'time': '시간'})
-                    fig_humidity.update_layout(height=400)
-                    st.plotly_chart(fig_humidity, use_container_width=True, config={'displayModeBar': False})
-                
-                # 일별 예보 카드
-                st.subheader("📊 일별 예보")
-                cols = st.columns(5)
-                
-                for i, (_, day) in enumerate(daily_data.iterrows()):
-                    if i < 5:  # 5일간만 표시
-                        with cols[i]:
-                            date_obj = datetime.strptime(day['date'], '%Y-%m-%d')
-                            day_name = date_obj.strftime('%m/%d\n%a')
-                            
-                            st.markdown(f"""
-                            <div class="forecast-card">
-                                <h4>{day_name}</h4>
-                                <img src="{weather_api.get_weather_icon_url(day['weather_icon'])}" 
-                                     style="width: 60px; height: 60px;">
-                                <p style="margin: 5px 0; font-weight: bold;">
-                                    {int(day['temp_max'])}° / {int(day['temp_min'])}°
-                                </p>
-                                <p style="margin: 0; font-size: 0.8rem; color: #666;">
-                                    {day['weather_description']}
-                                </p>
-                                <p style="margin: 0; font-size: 0.8rem; color: #1f77b4;">
-                                    강수: {int(day['pop'])}%
-                                </p>
-                            </div>
-                            """, unsafe_allow_html=True)
-                
-                # 상세 예보 테이블
-                with st.expander("📋 상세 예보 보기"):
-                    # 표시할 컬럼 선택
-                    display_df = df[['datetime', 'temperature', 'feels_like', 'humidity', 
-                                   'pressure', 'weather_description', 'wind_speed', 'pop']].copy()
-                    display_df.columns = ['날짜/시간', '온도(°C)', '체감온도(°C)', '습도(%)', 
-                                        '기압(hPa)', '날씨', '풍속(m/s)', '강수확률(%)']
-                    st.dataframe(display_df, use_container_width=True)
-                
-                # 풍속과 풍향 정보
-                st.subheader("💨 바람 정보")
-                col1, col2 = st.columns(2)
-                
-                with col1:
-                    # 풍속 차트
-                    fig_wind = px.line(df, x='datetime', y='wind_speed',
-                                     title='시간별 풍속 변화',
-                                     labels={'wind_speed': '풍속 (m/s)', 'datetime': '시간'})
-                    st.plotly_chart(fig_wind, use_container_width=True, config={'displayModeBar': False})
-                
-                with col2:
-                    # 강수 확률 차트
-                    fig_pop = px.bar(df, x='time', y='pop',
-                                   title='시간별 강수 확률',
-                                   labels={'pop': '강수 확률 (%)', 'time': '시간'})
-                    st.plotly_chart(fig_pop, use_container_width=True, config={'displayModeBar': False})
+            # 풍속과 풍향 정보
+            st.subheader("💨 바람 정보")
+            col1, col2 = st.columns(2)
             
-            else:
-                st.error("5일 예보 데이터를 가져올 수 없습니다.")
+            with col1:
+                # 풍속 차트
+                render_chart(figures['wind'])
+            
+            with col2:
+                # 강수 확률 차트
+                render_chart(figures['pop'])
         
         else:
-            st.error(f"'{city_input}' 도시의 날씨 정보를 찾을 수 없습니다. 도시 이름을 확인해주세요.")
+            st.error("5일 예보 데이터를 가져올 수 없습니다.")
+    
+    else:
+        st.error(f"'{city_input}' 도시의 날씨 정보를 찾을 수 없습니다. 도시 이름을 확인해주세요.")
 
 else:
     st.info("👈 사이드바에서 도시 이름을 입력하거나 인기 도시를 선택해주세요.")
@@ -388,4 +618,9 @@ st.markdown(
     </div>
     """, 
     unsafe_allow_html=True
-)
\ No newline at end of file
+)
+
+# 성능 디버그 패널 (사이드바 맨 아래, 이번 재실행 기준)
+rerun_trace.finish()
+if DEBUG_PANEL_ENABLED and st.sidebar.checkbox("🔍 성능 디버그 패널 표시", key="show_debug_panel"):
+    render_debug_panel(rerun_trace)
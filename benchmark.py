@@ -0,0 +1,302 @@
+"""
+성능 측정 스크립트
+fake_openweather.py 로컬 서버를 띄워 실제 API 호출(요청 한도) 없이 WeatherAPI와 앱 변환 과정을 측정합니다.
+항목별 처리량(ops/s)과 p50/p95/p99 지연 시간을 출력하고, 저장된 기준값(baseline)과 비교합니다.
+
+    python benchmark.py                                # 측정 후 기준값과 비교
+    python benchmark.py --latency 0.05 --error-rate 0.02
+    python benchmark.py --only forecast_parse app_forecast_view
+    python benchmark.py --save-baseline                # 현재 결과를 기준값으로 저장
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from config import (
+    HTTP_POOL_SIZE, HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT,
+    HTTP_MAX_RETRIES, HTTP_BACKOFF_FACTOR, HTTP_BACKOFF_MAX
+)
+from fake_openweather import DEFAULT_FIXTURES_DIR, start_server
+from forecast_charts import build_comparison_view, build_forecast_view
+from forecast_parser import parse_forecast_frame
+from http_client import HTTPClient
+from weather_api import WeatherAPI
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_BASELINE_PATH = os.path.join(BASE_DIR, "benchmark_baseline.json")
+
+# 자동완성 입력 예시 (초성, 부분 입력, 상위 지역 포함, 영문)
+SEARCH_QUERIES = ["ㅅㅇ", "강남", "해운", "부산 중", "제주", "ㄱㄴㄱ", "Busan", "춘천"]
+
+# 비교 화면 측정에 사용할 지역 수
+COMPARISON_LOCATIONS = 5
+
+# 측정 항목: 이름 -> (설명, 준비 함수). 준비 함수는 api를 받아 op(i)를 반환합니다.
+# op(i)가 None이나 빈 값을 반환하면 오류로 셉니다.
+SCENARIOS = {}
+
+
+def scenario(name, description):
+    def register(setup):
+        SCENARIOS[name] = (description, setup)
+        return setup
+    return register
+
+
+def _coords(i):
+    """반복마다 응답 캐시 격자(0.01도)가 겹치지 않는 좌표를 만듭니다. (항상 서버까지 요청)"""
+    return 33.0 + (i % 500) * 0.02, 126.0 + (i // 500) * 0.02
+
+
+@scenario("geocode_cold", "get_coordinates: 캐시에 없는 지역명 (/geo/1.0/direct 요청)")
+def _geocode_cold(api):
+    return lambda i: api.get_coordinates(f"Benchtown {i}")[0]
+
+
+@scenario("geocode_warm", "get_coordinates: 지오코딩 캐시 적중")
+def _geocode_warm(api):
+    api.get_coordinates("Tokyo")
+    return lambda i: api.get_coordinates("Tokyo")[0]
+
+
+@scenario("search_local", "search_locations: 한국 지역 저장소 (API 검색 제외)")
+def _search_local(api):
+    # 로컬 결과가 부족한 검색어도 API 검색으로 넘어가지 않도록 해 서버 지연과 관계없이 로컬 검색만 측정
+    api._get_remote_suggestions = lambda query, limit: []
+    return lambda i: api.search_locations(SEARCH_QUERIES[i % len(SEARCH_QUERIES)])
+
+
+@scenario("search_remote", "search_locations: 로컬에 없는 검색어 (API 검색)")
+def _search_remote(api):
+    return lambda i: api.search_locations(f"Benchville {i}")
+
+
+@scenario("current_cold", "get_current_weather_by_coords: /weather 요청 + 파싱")
+def _current_cold(api):
+    return lambda i: api.get_current_weather_by_coords(*_coords(i))
+
+
+@scenario("forecast_cold", "get_5day_forecast_by_coords: /forecast 요청 + DataFrame 변환")
+def _forecast_cold(api):
+    return lambda i: api.get_5day_forecast_by_coords(*_coords(i), as_frame=True)
+
+
+@scenario("bundle_cold", "get_weather_bundle_by_coords: 현재 날씨와 예보 동시 요청")
+def _bundle_cold(api):
+    return lambda i: all(part is not None for part in api.get_weather_bundle_by_coords(*_coords(i)))
+
+
+@scenario("forecast_parse", "parse_forecast_frame: /forecast 응답 -> DataFrame (네트워크 없음)")
+def _forecast_parse(api):
+    with open(os.path.join(DEFAULT_FIXTURES_DIR, "forecast.json"), encoding="utf-8") as f:
+        data = json.load(f)
+    return lambda i: parse_forecast_frame(data)
+
+
+@scenario("app_forecast_view", "build_forecast_view: 앱의 예보 표/일별 데이터/차트 생성")
+def _app_forecast_view(api):
+    frame = api.get_5day_forecast_by_coords(37.5665, 126.978, as_frame=True)
+    return lambda i: build_forecast_view(frame)
+
+
+@scenario("app_comparison_view", f"build_comparison_view: 지역 {COMPARISON_LOCATIONS}곳 비교 화면 생성")
+def _app_comparison_view(api):
+    bundles = {
+        f"지역 {n}": api.get_weather_bundle_by_coords(*_coords(10000 + n), as_frame=True)
+        for n in range(COMPARISON_LOCATIONS)
+    }
+    return lambda i: build_comparison_view(bundles)
+
+
+def make_api(server, rate_limited=False):
+    """
+    측정용 WeatherAPI를 만듭니다.
+    기본적으로 호스트별 속도 제한을 끄고 측정합니다. (제한이 있으면 처리량이 제한값으로 고정됨)
+    """
+    http_client = None
+    if not rate_limited:
+        http_client = HTTPClient(
+            pool_size=HTTP_POOL_SIZE,
+            connect_timeout=HTTP_CONNECT_TIMEOUT,
+            read_timeout=HTTP_READ_TIMEOUT,
+            max_retries=HTTP_MAX_RETRIES,
+            backoff_factor=HTTP_BACKOFF_FACTOR,
+            backoff_max=HTTP_BACKOFF_MAX
+        )
+    return WeatherAPI("benchmark", http_client=http_client, **server.api_urls())
+
+
+def percentile(sorted_ms, q):
+    return float(np.percentile(sorted_ms, q)) if len(sorted_ms) else 0.0
+
+
+def run_scenario(api, setup, iterations, concurrency, warmup=3):
+    """
+    op(i)를 iterations번 실행하고 통계를 반환합니다.
+    concurrency가 1보다 크면 그만큼의 스레드로 동시에 실행합니다.
+    """
+    op = setup(api)
+    for i in range(warmup):
+        op(-1 - i)
+
+    def timed(i):
+        started = time.perf_counter()
+        try:
+            ok = op(i)
+            ok = ok is not None and ok is not False and not (isinstance(ok, list) and not ok)
+        except Exception:
+            ok = False
+        return (time.perf_counter() - started) * 1000, ok
+
+    started = time.perf_counter()
+    if concurrency > 1:
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="benchmark") as executor:
+            samples = list(executor.map(timed, range(iterations)))
+    else:
+        samples = [timed(i) for i in range(iterations)]
+    elapsed = time.perf_counter() - started
+
+    latencies = np.sort(np.array([ms for ms, _ in samples]))
+    return {
+        'ops': iterations,
+        'errors': sum(1 for _, ok in samples if not ok),
+        'throughput': round(iterations / elapsed, 1) if elapsed else 0.0,
+        'p50': round(percentile(latencies, 50), 3),
+        'p95': round(percentile(latencies, 95), 3),
+        'p99': round(percentile(latencies, 99), 3)
+    }
+
+
+def run(names=None, iterations=100, concurrency=1, latency=0.0, jitter=0.0,
+        error_rate=0.0, seed=0, rate_limited=False):
+    """
+    측정 항목을 차례로 실행합니다. 항목마다 새 서버와 WeatherAPI를 사용해 캐시를 공유하지 않습니다.
+
+    Returns:
+        dict: {'meta': 측정 조건, 'results': {항목: 통계}}
+    """
+    names = names or list(SCENARIOS)
+    results = {}
+    for name in names:
+        _, setup = SCENARIOS[name]
+        server = start_server(latency=latency, jitter=jitter, error_rate=error_rate, seed=seed)
+        api = make_api(server, rate_limited)
+        try:
+            results[name] = run_scenario(api, setup, iterations, concurrency)
+        finally:
+            api.close()
+            server.shutdown()
+            server.server_close()
+        print(f"  {name} 완료", file=sys.stderr)
+
+    return {
+        'meta': {
+            'iterations': iterations,
+            'concurrency': concurrency,
+            'latency': latency,
+            'jitter': jitter,
+            'error_rate': error_rate,
+            'rate_limited': rate_limited,
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'created': time.strftime('%Y-%m-%d %H:%M:%S')
+        },
+        'results': results
+    }
+
+
+def compare(results, baseline, tolerance=0.2):
+    """
+    기준값과 비교합니다. p95가 tolerance(비율) 이상 늘었거나 처리량이 그만큼 줄면 느려진 것으로 봅니다.
+
+    Returns:
+        dict: {항목: {'p50': 변화율, 'p95': 변화율, 'p99': 변화율, 'throughput': 변화율, 'regressed': bool}}
+    """
+    comparison = {}
+    for name, current in results.items():
+        base = baseline.get(name)
+        if not base:
+            continue
+        changes = {}
+        for metric in ('p50', 'p95', 'p99', 'throughput'):
+            changes[metric] = (current[metric] - base[metric]) / base[metric] if base[metric] else 0.0
+        changes['regressed'] = changes['p95'] > tolerance or changes['throughput'] < -tolerance
+        comparison[name] = changes
+    return comparison
+
+
+def format_report(report, comparison=None):
+    """결과 표를 문자열로 만듭니다."""
+    meta = report['meta']
+    lines = [
+        f"반복 {meta['iterations']}회, 동시 실행 {meta['concurrency']}, "
+        f"서버 지연 {meta['latency'] * 1000:.0f}ms(+{meta['jitter'] * 1000:.0f}ms), 오류율 {meta['error_rate']:.0%}",
+        "",
+        f"{'항목':<20}{'ops/s':>10}{'p50(ms)':>10}{'p95(ms)':>10}{'p99(ms)':>10}{'오류':>4}"
+    ]
+    for name, stats in report['results'].items():
+        line = (f"{name:<22}{stats['throughput']:>10.1f}{stats['p50']:>10.2f}"
+                f"{stats['p95']:>10.2f}{stats['p99']:>10.2f}{stats['errors']:>6}")
+        if comparison and name in comparison:
+            changes = comparison[name]
+            line += f"   p95 {changes['p95']:+.0%}, ops/s {changes['throughput']:+.0%}"
+            if changes['regressed']:
+                line += "  ⚠️ 느려짐"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="WeatherAPI 성능 측정 (로컬 대체 서버 사용)")
+    parser.add_argument("--only", nargs="+", choices=list(SCENARIOS), help="측정할 항목")
+    parser.add_argument("--iterations", type=int, default=100, help="항목별 반복 횟수")
+    parser.add_argument("--concurrency", type=int, default=1, help="동시 실행 스레드 수")
+    parser.add_argument("--latency", type=float, default=0.0, help="서버 응답 지연 (초)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="추가 임의 지연 최대값 (초)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="서버 오류 응답 비율 (0~1)")
+    parser.add_argument("--seed", type=int, default=0, help="지연/오류 난수 시드")
+    parser.add_argument("--rate-limited", action="store_true", help="config의 호스트별 속도 제한을 적용")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE_PATH, help="기준값 파일")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="느려짐으로 볼 변화율 (기본 20%%)")
+    parser.add_argument("--save-baseline", action="store_true", help="결과를 기준값 파일로 저장")
+    parser.add_argument("--output", help="결과를 JSON 파일로 저장")
+    parser.add_argument("--list", action="store_true", help="측정 항목 목록 출력")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for name, (description, _) in SCENARIOS.items():
+            print(f"{name:<22}{description}")
+        return 0
+
+    report = run(args.only, args.iterations, args.concurrency, args.latency, args.jitter,
+                 args.error_rate, args.seed, args.rate_limited)
+
+    comparison = None
+    if not args.save_baseline and os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as f:
+            comparison = compare(report['results'], json.load(f)['results'], args.tolerance)
+
+    print(format_report(report, comparison))
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=1)
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=1)
+        print(f"\n기준값 저장: {args.baseline}")
+        return 0
+
+    if comparison and any(changes['regressed'] for changes in comparison.values()):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,78 @@
+"""
+한국 지역 좌표 테이블 생성 스크립트
+data/korean_location_coords.csv 원본 데이터로 korean_location_coords.py를 다시 만듭니다.
+네트워크 없이 실행되며, 원본 데이터를 수정한 뒤 실행하세요.
+
+    python build_location_coords.py
+"""
+import argparse
+import csv
+import os
+import sys
+
+from korean_locations import LOCATION_TABLES
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_SOURCE = os.path.join(BASE_DIR, "data", "korean_location_coords.csv")
+DEFAULT_OUTPUT = os.path.join(BASE_DIR, "korean_location_coords.py")
+
+HEADER = '''"""
+한국 지역 좌표 테이블 (자동 생성 파일 - 직접 수정하지 마세요)
+원본: data/korean_location_coords.csv
+생성: python build_location_coords.py
+
+영문 지역명 -> (위도, 경도, 행정표준코드)
+"""
+
+LOCATION_COORDS = {
+'''
+
+
+def read_source(path):
+    """원본 CSV를 읽어 {영문 지역명: (위도, 경도, 행정코드)} 딕셔너리를 반환합니다."""
+    with open(path, encoding="utf-8", newline="") as f:
+        rows = csv.DictReader(line for line in f if not line.startswith("#"))
+        coords = {}
+        for row in rows:
+            name = row["english_name"].strip()
+            if name in coords:
+                raise ValueError(f"중복된 지역명: {name}")
+            coords[name] = (
+                round(float(row["latitude"]), 4),
+                round(float(row["longitude"]), 4),
+                row["admin_code"].strip()
+            )
+        return coords
+
+
+def render(coords):
+    lines = [HEADER]
+    for name, (lat, lon, admin_code) in coords.items():
+        lines.append(f"    {name!r}: ({lat}, {lon}, {admin_code!r}),\n")
+    lines.append("}\n")
+    return "".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="한국 지역 좌표 테이블을 생성합니다.")
+    parser.add_argument("--source", default=DEFAULT_SOURCE, help="원본 CSV 경로")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="생성할 파이썬 모듈 경로")
+    args = parser.parse_args(argv)
+
+    coords = read_source(args.source)
+
+    # 지역 데이터베이스의 모든 영문 지역명에 좌표가 있는지 확인
+    english_names = {name for table in LOCATION_TABLES for name in table.values()}
+    missing = sorted(english_names - set(coords))
+    if missing:
+        print(f"좌표가 없는 지역 {len(missing)}개: {', '.join(missing)}", file=sys.stderr)
+        return 1
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        f.write(render(coords))
+    print(f"{len(coords)}개 지역 좌표를 {args.output}에 저장했습니다.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,281 @@
+"""
+캐시 모듈
+반복해서 조회되는 데이터(지오코딩 결과 등)를 메모리(LRU)와 디스크(SQLite)에 저장합니다.
+"""
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+# 캐시에 값이 없음을 나타내는 표식 (None은 '찾을 수 없음' 결과로 저장될 수 있음)
+MISSING = object()
+
+
+class TTLCache:
+    """
+    만료 시간(TTL)과 최대 크기를 가진 스레드 안전 LRU 캐시입니다.
+    최대 크기를 넘으면 가장 오랫동안 사용되지 않은 항목부터 제거합니다.
+    """
+
+    def __init__(self, maxsize=1024, ttl=3600):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()  # key -> (만료 시각, 값)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, default=MISSING):
+        """키에 해당하는 값을 반환합니다. 없거나 만료되었으면 default를 반환합니다."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                self.misses += 1
+                return default
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def peek(self, key, default=MISSING):
+        """통계와 LRU 순서를 바꾸지 않고 값을 확인합니다."""
+        with self._lock:
+            entry = self._data.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            return default
+        return entry[1]
+
+    def remaining(self, key):
+        """남은 유효 시간(초)을 반환합니다. 없거나 만료되었으면 0을 반환합니다."""
+        with self._lock:
+            entry = self._data.get(key)
+        if entry is None:
+            return 0
+        return max(entry[0] - time.monotonic(), 0)
+
+    def set(self, key, value, ttl=None):
+        """값을 저장합니다. ttl을 지정하지 않으면 기본 TTL을 사용합니다."""
+        ttl = self.ttl if ttl is None else ttl
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+    def stats(self):
+        """캐시 적중/실패 통계를 반환합니다."""
+        with self._lock:
+            return {
+                'size': len(self._data),
+                'maxsize': self.maxsize,
+                'hits': self.hits,
+                'misses': self.misses
+            }
+
+
+class SQLiteStore:
+    """
+    SQLite 파일에 JSON 값을 저장하는 영구 캐시입니다.
+    Streamlit 재시작 후에도 캐시가 유지됩니다.
+    """
+
+    def __init__(self, db_path, maxsize=10000, table='cache'):
+        self.db_path = db_path
+        self.maxsize = maxsize
+        self.table = table
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {table} ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+
+    def get(self, key):
+        """
+        저장된 값과 남은 유효 시간(초)을 반환합니다.
+        값이 없거나 만료되었으면 (MISSING, 0)을 반환합니다.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT value, expires_at FROM {self.table} WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return MISSING, 0
+
+        remaining = row[1] - time.time()
+        if remaining <= 0:
+            self.delete(key)
+            return MISSING, 0
+        return json.loads(row[0]), remaining
+
+    def set(self, key, value, ttl):
+        with self._lock, self._conn:
+            self._conn.execute(
+                f"INSERT OR REPLACE INTO {self.table} (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, json.dumps(value, ensure_ascii=False), time.time() + ttl)
+            )
+            self._prune()
+
+    def delete(self, key):
+        with self._lock, self._conn:
+            self._conn.execute(f"DELETE FROM {self.table} WHERE key = ?", (key,))
+
+    def _prune(self):
+        """만료된 항목을 지우고, 최대 크기를 넘으면 만료가 가까운 항목부터 제거합니다."""
+        self._conn.execute(f"DELETE FROM {self.table} WHERE expires_at <= ?", (time.time(),))
+        count = self._conn.execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()[0]
+        if count > self.maxsize:
+            self._conn.execute(
+                f"DELETE FROM {self.table} WHERE key IN ("
+                f"SELECT key FROM {self.table} ORDER BY expires_at LIMIT ?)",
+                (count - self.maxsize,)
+            )
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class GeocodeCache:
+    """
+    지오코딩 결과 캐시입니다.
+    메모리 LRU를 먼저 확인하고, 설정된 경우 SQLite 디스크 캐시를 사용합니다.
+    '찾을 수 없음' 결과(None)는 negative_ttl 동안만 저장합니다.
+    """
+
+    def __init__(self, maxsize=1024, ttl=7 * 24 * 3600, negative_ttl=600,
+                 db_path=None, db_maxsize=10000):
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.memory = TTLCache(maxsize=maxsize, ttl=ttl)
+        self.disk = SQLiteStore(db_path, maxsize=db_maxsize, table='geocode') if db_path else None
+
+    @staticmethod
+    def normalize(query):
+        """대소문자와 공백 차이를 없앤 캐시 키를 만듭니다."""
+        return ' '.join(query.split()).lower()
+
+    def get(self, query):
+        """
+        캐시된 좌표 (lat, lon, country)를 반환합니다.
+        '찾을 수 없음'으로 저장된 경우 None, 캐시에 없으면 MISSING을 반환합니다.
+        """
+        key = self.normalize(query)
+        value = self.memory.get(key)
+        if value is not MISSING:
+            return value
+
+        if self.disk is not None:
+            value, remaining = self.disk.get(key)
+            if value is not MISSING:
+                value = tuple(value) if value is not None else None
+                self.memory.set(key, value, ttl=remaining)
+                return value
+
+        return MISSING
+
+    def peek(self, query):
+        """통계를 바꾸지 않고 메모리 캐시만 확인합니다."""
+        return self.memory.peek(self.normalize(query))
+
+    def set(self, query, value):
+        """좌표 결과를 저장합니다. value가 None이면 '찾을 수 없음'으로 짧게 저장합니다."""
+        key = self.normalize(query)
+        ttl = self.negative_ttl if value is None else self.ttl
+        self.memory.set(key, value, ttl=ttl)
+        if self.disk is not None:
+            self.disk.set(key, list(value) if value is not None else None, ttl)
+
+    def stats(self):
+        stats = self.memory.stats()
+        stats['disk'] = self.disk is not None
+        return stats
+
+
+class ResponseCache:
+    """
+    날씨 API 응답 캐시입니다.
+    (엔드포인트, 격자 단위로 반올림한 위도/경도, 단위, 언어)를 키로 사용하므로
+    가까운 위치를 보는 여러 사용자가 같은 응답을 공유합니다.
+    엔드포인트마다 TTL을 따로 지정할 수 있습니다.
+
+    stale_ttl을 지정하면 TTL이 지난 뒤에도 마지막으로 받은 정상 응답을 stale_ttl초 동안 따로 보관합니다.
+    (서버가 느리거나 오류일 때 get_stale()로 대신 사용)
+    """
+
+    def __init__(self, maxsize=512, ttls=None, default_ttl=600, grid=0.01, stale_ttl=0):
+        self.ttls = dict(ttls or {})
+        self.default_ttl = default_ttl
+        self.grid = grid
+        self.memory = TTLCache(maxsize=maxsize, ttl=default_ttl)
+        # 키 -> (응답, 저장 시각), 레코드 객체를 공유하므로 추가 메모리는 항목당 튜플 하나
+        self.stale = TTLCache(maxsize=maxsize, ttl=stale_ttl) if stale_ttl else None
+
+    def round_coords(self, lat, lon):
+        """위도/경도를 격자 크기 단위로 반올림합니다."""
+        if not self.grid:
+            return lat, lon
+        return (round(round(lat / self.grid) * self.grid, 6),
+                round(round(lon / self.grid) * self.grid, 6))
+
+    def make_key(self, endpoint, lat, lon, units, lang):
+        lat, lon = self.round_coords(lat, lon)
+        return (endpoint, lat, lon, units, lang)
+
+    def get(self, key):
+        """캐시된 응답을 반환합니다. 없거나 만료되었으면 MISSING을 반환합니다."""
+        return self.memory.get(key)
+
+    def peek(self, key):
+        """통계를 바꾸지 않고 캐시를 확인합니다."""
+        return self.memory.peek(key)
+
+    def remaining(self, key):
+        """캐시된 응답의 남은 유효 시간(초)을 반환합니다."""
+        return self.memory.remaining(key)
+
+    def get_stale(self, key):
+        """
+        마지막으로 받은 정상 응답과 경과 시간(초)을 (응답, 초)로 반환합니다.
+        보관된 응답이 없으면 MISSING을 반환합니다.
+        """
+        if self.stale is None:
+            return MISSING
+        entry = self.stale.get(key)
+        if entry is MISSING:
+            return MISSING
+        value, stored_at = entry
+        return value, max(time.time() - stored_at, 0)
+
+    def set(self, key, value):
+        endpoint = key[0]
+        self.memory.set(key, value, ttl=self.ttls.get(endpoint, self.default_ttl))
+        if self.stale is not None:
+            self.stale.set(key, (value, time.time()))
+
+    def clear(self):
+        self.memory.clear()
+        if self.stale is not None:
+            self.stale.clear()
+
+    def stats(self):
+        return self.memory.stats()
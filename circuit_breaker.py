@@ -0,0 +1,118 @@
+"""
+서킷 브레이커 모듈
+실패가 이어지는 호스트로의 요청을 잠시 막아, 장애 중인 서버에 요청을 계속 보내거나 응답을 오래 기다리지 않게 합니다.
+"""
+import threading
+import time
+
+import requests
+
+# 서킷 상태
+CLOSED = 'closed'        # 정상: 모든 요청 허용
+OPEN = 'open'            # 차단: 요청을 보내지 않고 바로 실패
+HALF_OPEN = 'half_open'  # 확인: 시험 요청 하나만 허용
+
+
+class CircuitOpenError(requests.ConnectionError):
+    """서킷이 열려 있어 요청을 보내지 않은 경우 (requests 예외와 같은 방식으로 처리됨)"""
+
+    def __init__(self, host, retry_after):
+        super().__init__(f"{host} 요청 일시 중단 (연속 실패, {retry_after:.0f}초 후 재시도)")
+        self.host = host
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    """
+    스레드 안전 서킷 브레이커입니다.
+    연속 실패가 failure_threshold번이면 서킷을 열고 reset_timeout초 동안 요청을 막습니다.
+    그 뒤 시험 요청 하나를 보내 성공하면 다시 닫고, 실패하면 다시 엽니다.
+    """
+
+    def __init__(self, failure_threshold=5, reset_timeout=30):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = CLOSED
+        self.failures = 0
+        self._opened_at = 0.0
+        self._lock = threading.Lock()
+        self.opens = 0     # 서킷이 열린 횟수
+        self.rejected = 0  # 서킷이 열려 있어 막은 요청 수
+
+    def allow(self):
+        """지금 요청을 보내도 되면 True를 반환합니다."""
+        with self._lock:
+            if self.state == CLOSED:
+                return True
+            # 차단 시간이 지나면 시험 요청 하나를 허용 (시험 요청이 끝나지 않아도 같은 시간이 지나면 다시 허용)
+            if time.monotonic() - self._opened_at >= self.reset_timeout:
+                self.state = HALF_OPEN
+                self._opened_at = time.monotonic()
+                return True
+            self.rejected += 1
+            return False
+
+    def retry_after(self):
+        """다음 시험 요청까지 남은 시간(초)"""
+        with self._lock:
+            if self.state == CLOSED:
+                return 0
+            return max(self.reset_timeout - (time.monotonic() - self._opened_at), 0)
+
+    def record_success(self):
+        with self._lock:
+            self.state = CLOSED
+            self.failures = 0
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+                if self.state != OPEN:
+                    self.opens += 1
+                self.state = OPEN
+                self._opened_at = time.monotonic()
+
+    def stats(self):
+        with self._lock:
+            return {
+                'state': self.state,
+                'failures': self.failures,
+                'opens': self.opens,
+                'rejected': self.rejected
+            }
+
+
+class HostCircuitBreaker:
+    """호스트마다 별도의 서킷 브레이커를 둡니다. (한 호스트의 장애가 다른 호스트 요청을 막지 않음)"""
+
+    def __init__(self, failure_threshold=5, reset_timeout=30):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._breakers = {}
+        self._lock = threading.Lock()
+
+    def breaker(self, host):
+        with self._lock:
+            breaker = self._breakers.get(host)
+            if breaker is None:
+                breaker = self._breakers[host] = CircuitBreaker(self.failure_threshold, self.reset_timeout)
+            return breaker
+
+    def check(self, host):
+        """요청을 보내도 되는지 확인하고, 서킷이 열려 있으면 CircuitOpenError를 발생시킵니다."""
+        breaker = self.breaker(host)
+        if not breaker.allow():
+            raise CircuitOpenError(host, breaker.retry_after())
+
+    def record_success(self, host):
+        self.breaker(host).record_success()
+
+    def record_failure(self, host):
+        self.breaker(host).record_failure()
+
+    def stats(self):
+        """호스트별 서킷 상태를 반환합니다."""
+        with self._lock:
+            breakers = dict(self._breakers)
+        return {host: breaker.stats() for host, breaker in breakers.items()}
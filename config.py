@@ -2,11 +2,19 @@
 설정 파일
 API 키와 기타 설정값을 관리합니다.
 """
+import os
 
 # OpenWeather API 설정
+# URL은 환경변수로 바꿀 수 있습니다 (예: fake_openweather.py 로컬 서버로 테스트)
 OPENWEATHER_API_KEY = "bed963520292a4fcf7ee4f9110312c6a"
-OPENWEATHER_BASE_URL = "http://api.openweathermap.org/data/2.5"
-OPENWEATHER_GEOCODING_URL = "http://api.openweathermap.org/geo/1.0"
+OPENWEATHER_BASE_URL = os.getenv("OPENWEATHER_BASE_URL", "http://api.openweathermap.org/data/2.5")
+OPENWEATHER_GEOCODING_URL = os.getenv("OPENWEATHER_GEOCODING_URL", "http://api.openweathermap.org/geo/1.0")
+OPENWEATHER_ONECALL_URL = os.getenv("OPENWEATHER_ONECALL_URL", "https://api.openweathermap.org/data/3.0/onecall")
+
+# 날씨 조회 방식
+# "standard": /weather + /forecast 두 번 요청 (무료 플랜)
+# "onecall": One Call API 3.0 한 번으로 현재 날씨와 시간별/일별 예보를 함께 요청 (구독 필요)
+WEATHER_FETCH_MODE = os.getenv("WEATHER_FETCH_MODE", "standard")
 
 # Streamlit 앱 설정
 APP_TITLE = "날씨 정보 앱"
@@ -24,4 +32,101 @@ TEMPERATURE_UNIT = "metric"  # 섭씨 온도
 
 # UI 설정
 CHART_HEIGHT = 400
-FORECAST_DAYS = 5
\ No newline at end of file
+FORECAST_DAYS = 5
+
+# 지오코딩 캐시 설정
+GEOCODE_CACHE_SIZE = 1024             # 메모리 LRU 최대 항목 수
+GEOCODE_CACHE_TTL = 7 * 24 * 3600     # 좌표 결과 유지 시간 (초)
+GEOCODE_NEGATIVE_TTL = 10 * 60        # '찾을 수 없음' 결과 유지 시간 (초)
+GEOCODE_CACHE_DB_PATH = None          # SQLite 캐시 파일 경로 (None이면 디스크 캐시 미사용)
+GEOCODE_CACHE_DB_SIZE = 10000         # 디스크 캐시 최대 항목 수
+
+# 동시 요청 설정
+FETCH_CONCURRENTLY = True             # 현재 날씨와 예보를 병렬로 요청
+FETCH_MAX_WORKERS = 8                 # WeatherAPI 스레드 풀 크기
+FETCH_ENGINE_MAX_WORKERS = 64         # 응답 대기 시간을 제한하는 요청용 스레드 풀 크기 (일괄 조회/서비스 풀 크기의 합보다 크게)
+
+# HTTP 연결 설정
+HTTP_POOL_SIZE = 10                   # 호스트별 keep-alive 연결 풀 크기
+HTTP_CONNECT_TIMEOUT = 3.05           # 연결 타임아웃 (초)
+HTTP_READ_TIMEOUT = 10                # 응답 대기 타임아웃 (초)
+HTTP_MAX_RETRIES = 2                  # 429/5xx 및 연결 오류 재시도 횟수
+HTTP_BACKOFF_FACTOR = 0.5             # 지수 백오프 기본 대기 시간 (초)
+HTTP_BACKOFF_MAX = 8                  # 최대 대기 시간 (초)
+
+# 날씨 응답 캐시 설정
+RESPONSE_CACHE_SIZE = 512             # 캐시할 최대 응답 수
+RESPONSE_CACHE_GRID = 0.01            # 좌표 반올림 격자 크기 (도, 약 1km)
+RESPONSE_CACHE_TTLS = {               # 엔드포인트별 캐시 유지 시간 (초)
+    'weather': 5 * 60,
+    'forecast': 30 * 60,
+    'onecall': 5 * 60
+}
+
+# 응답 지연/장애 대응 설정
+RESPONSE_STALE_TTL = 24 * 3600        # 마지막 정상 응답 보관 시간 (초, 서버 장애 시 대신 표시)
+FETCH_TIMEOUT = 8                     # 보관된 응답이 없을 때 새 응답을 기다리는 최대 시간 (초)
+FETCH_STALE_TIMEOUT = 2               # 보관된 응답이 있을 때 새 응답을 기다리는 시간 (초)
+CIRCUIT_FAILURE_THRESHOLD = 5         # 이 횟수만큼 연속 실패하면 호스트 요청을 잠시 중단
+CIRCUIT_RESET_TIMEOUT = 30            # 요청 중단 후 다시 시도하기까지의 시간 (초)
+
+# 자동완성 설정
+AUTOCOMPLETE_MIN_REMOTE_CHARS = 2     # API 검색을 시작하는 최소 글자 수
+AUTOCOMPLETE_REMOTE_LIMIT = 5         # API 검색 결과 수 (OpenWeather 최대 5)
+AUTOCOMPLETE_CACHE_SIZE = 2048        # 캐시할 검색어 수
+AUTOCOMPLETE_CACHE_TTL = 24 * 3600    # API 검색 결과 유지 시간 (초)
+
+# Streamlit 화면 캐시 설정
+APP_WEATHER_CACHE_TTL = 5 * 60        # 위치별 날씨 조회 결과 유지 시간 (초)
+APP_FORECAST_VIEW_TTL = 5 * 60        # 위치별 예보 차트/표 유지 시간 (초)
+
+# 요청 속도 제한 및 일괄 조회 설정
+HTTP_RATE_LIMIT = 10                  # 호스트별 초당 최대 요청 수 (None이면 제한 없음)
+HTTP_RATE_BURST = 10                  # 한 번에 몰아서 보낼 수 있는 최대 요청 수
+BATCH_MAX_WORKERS = 8                 # 여러 지역 일괄 조회용 스레드 풀 크기
+
+# API 키 호출 한도 설정 (모든 세션이 같은 키를 공유, 키 풀을 쓰면 키 하나당 한도)
+API_QUOTA_PER_MINUTE = 60             # 분당 최대 호출 수 (OpenWeather 무료 플랜 기준)
+API_QUOTA_PER_DAY = None              # 일일 최대 호출 수 (예: One Call 3.0 무료 1000, None이면 제한 없음)
+ENDPOINT_QUOTAS_PER_MINUTE = {        # 엔드포인트별 분당 최대 호출 수 (자동완성/역지오코딩이 한도를 다 쓰지 않도록)
+    '/geo/1.0/direct': 20,
+    '/geo/1.0/reverse': 10
+}
+RATE_LIMIT_RESERVES = {               # 우선순위별로 남겨 둘 토큰 비율 (높은 우선순위 요청 몫)
+    'interactive': 0,
+    'autocomplete': 0.25,
+    'background': 0.5
+}
+RATE_LIMIT_MAX_WAITS = {              # 우선순위별 최대 대기 시간 (초), 넘으면 요청하지 않고 캐시 사용
+    'interactive': 5,
+    'autocomplete': 0.3,
+    'background': 10
+}
+
+# API 키 풀 설정 (키를 여러 개 지정하면 남은 호출 한도가 많은 키부터 나눠 사용, 한도는 키마다 적용)
+OPENWEATHER_API_KEYS = [key.strip() for key in os.getenv("OPENWEATHER_API_KEYS", "").split(",") if key.strip()]
+KEY_UNAUTHORIZED_TIMEOUT = 60 * 60    # 401(잘못된 키)을 받은 키를 빼 두는 시간 (초)
+KEY_RATE_LIMITED_TIMEOUT = 60         # 429(한도 초과)를 받은 키를 빼 두는 시간 (초, Retry-After 헤더가 있으면 우선)
+
+# 성능 디버그 설정
+DEBUG_PANEL_ENABLED = os.getenv("WEATHER_DEBUG_PANEL", "0") == "1"  # 사이드바 성능 디버그 패널 사용 여부 (운영자용, 기본 꺼짐)
+
+# 인기 지역 미리 갱신 설정 (캐시 만료 전에 백그라운드에서 다시 요청)
+PREFETCH_ENABLED = os.getenv("PREFETCH_ENABLED", "1") != "0"
+PREFETCH_INTERVAL = 60                # 캐시 확인 주기 (초)
+PREFETCH_REFRESH_AHEAD = 90           # 남은 유효 시간이 이 값 이하이면 갱신 (초, 확인 주기보다 길게)
+PREFETCH_MAX_WORKERS = 4              # 동시에 갱신할 최대 요청 수
+PREFETCH_MAX_CALLS_PER_DAY = {        # 조회 방식별 미리 갱신 일일 최대 호출 수 (UTC 자정 초기화, 넘으면 다음 날까지 갱신 중단)
+    'standard': 10000,                # 인기 지역 약 24곳 x (현재 날씨 288 + 예보 48회) ≈ 8천 회
+    'onecall': 500                    # One Call 3.0 무료 1000회/일의 절반 (사용자 조회 몫 남김)
+}
+
+# 날씨 HTTP 서비스 설정 (python -m weather_api serve)
+SERVICE_HOST = os.getenv("WEATHER_SERVICE_HOST", "127.0.0.1")
+SERVICE_PORT = int(os.getenv("WEATHER_SERVICE_PORT", "8080"))
+SERVICE_MAX_WORKERS = 32              # 외부 API 조회용 스레드 풀 크기
+SERVICE_CACHE_SIZE = 4096             # 보관할 JSON 응답 수
+SERVICE_CACHE_TTL = 30                # JSON 응답 보관 시간 (초, 날씨 데이터는 응답 캐시가 따로 유지)
+SERVICE_BATCH_MAX = 50                # 일괄 조회 한 번에 받을 최대 지역 수
+SERVICE_MAX_BODY = 64 * 1024          # 요청 본문 최대 크기 (바이트)
+SERVICE_KEEPALIVE_TIMEOUT = 15        # keep-alive 연결 유휴 시간 (초)
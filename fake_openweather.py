@@ -0,0 +1,224 @@
+"""
+OpenWeather 로컬 대체 서버
+fixtures/ 폴더에 저장된 응답을 OpenWeather와 같은 경로로 돌려주는 테스트용 HTTP 서버입니다.
+실제 API 호출 없이 WeatherAPI와 app.py를 확인할 수 있습니다.
+응답 지연과 오류를 일부러 섞어 느리거나 불안정한 서버를 흉내 낼 수 있습니다. (benchmark.py에서 사용)
+
+    python fake_openweather.py serve --port 8765
+    python fake_openweather.py serve --latency 0.2 --jitter 0.1 --error-rate 0.05
+    python fake_openweather.py record --api-key <키>   # 실제 API 응답으로 fixtures/ 갱신
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import requests
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_FIXTURES_DIR = os.path.join(BASE_DIR, "fixtures")
+
+# 요청 경로 -> 응답 파일
+ROUTES = {
+    "/data/2.5/weather": "weather.json",
+    "/data/2.5/forecast": "forecast.json",
+    "/data/3.0/onecall": "onecall.json",
+    "/geo/1.0/direct": "geo_direct.json",
+    "/geo/1.0/reverse": "geo_reverse.json"
+}
+
+# record 명령으로 저장할 실제 API 요청 (응답 파일 -> (URL, 추가 파라미터))
+RECORD_TARGETS = {
+    "weather.json": ("https://api.openweathermap.org/data/2.5/weather", {}),
+    "forecast.json": ("https://api.openweathermap.org/data/2.5/forecast", {}),
+    "onecall.json": ("https://api.openweathermap.org/data/3.0/onecall", {"exclude": "minutely,alerts"}),
+    "geo_reverse.json": ("https://api.openweathermap.org/geo/1.0/reverse", {"limit": 1})
+}
+
+
+def load_fixtures(fixtures_dir=DEFAULT_FIXTURES_DIR):
+    """응답 파일을 읽어 {요청 경로: 응답 본문(bytes)}을 반환합니다."""
+    fixtures = {}
+    for path, filename in ROUTES.items():
+        with open(os.path.join(fixtures_dir, filename), "rb") as f:
+            fixtures[path] = f.read()
+    return fixtures
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive 지원
+    disable_nagle_algorithm = True  # 헤더와 본문을 나눠 보낼 때 생기는 40ms 지연(Nagle + delayed ACK) 방지
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        params = parse_qs(url.query)
+        self.server.count(url.path, params.get("appid", [None])[0])
+
+        delay = self.server.next_delay()
+        if delay:
+            time.sleep(delay)
+
+        body = self.server.fixtures.get(url.path)
+        if body is None:
+            self._send(404, b'{"cod": "404", "message": "Not found"}')
+        elif "appid" not in params or params["appid"][0] in self.server.invalid_keys:
+            self._send(401, b'{"cod": 401, "message": "Invalid API key."}')
+        elif self.server.should_fail():
+            status = self.server.error_status
+            self._send(status, json.dumps({"cod": status, "message": "Injected error"}).encode())
+        else:
+            self._send(200, body)
+
+    def _send(self, status, body):
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # 요청마다 로그를 출력하지 않음
+
+
+class FakeOpenWeatherServer(ThreadingHTTPServer):
+    """
+    저장된 응답을 돌려주는 서버입니다. 경로별 요청 수를 기록합니다.
+
+    - latency, jitter: 응답마다 latency + (0 ~ jitter)초 지연
+    - error_rate: 이 비율(0~1)의 요청에 error_status 오류로 응답
+    - seed: 지연/오류 난수 시드 (같은 시드면 같은 순서로 발생)
+    - invalid_keys: 401로 응답할 API 키 목록 (키 풀 제외 동작 확인용)
+    - requests_by_key: API 키별 요청 수
+    """
+
+    daemon_threads = True
+
+    def __init__(self, host="127.0.0.1", port=0, fixtures_dir=DEFAULT_FIXTURES_DIR,
+                 latency=0, jitter=0, error_rate=0, error_status=503, seed=None,
+                 invalid_keys=()):
+        super().__init__((host, port), _Handler)
+        self.fixtures = load_fixtures(fixtures_dir)
+        self.requests = Counter()
+        self.requests_by_key = Counter()
+        self.invalid_keys = set(invalid_keys)
+        self.injected_errors = 0
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def count(self, path, api_key=None):
+        with self._lock:
+            self.requests[path] += 1
+            self.requests_by_key[api_key] += 1
+
+    def next_delay(self):
+        """이번 응답의 지연 시간(초)"""
+        if not self.jitter:
+            return self.latency
+        with self._lock:
+            return self.latency + self._random.uniform(0, self.jitter)
+
+    def should_fail(self):
+        """이번 요청을 오류로 응답할지 정합니다."""
+        if not self.error_rate:
+            return False
+        with self._lock:
+            failed = self._random.random() < self.error_rate
+            if failed:
+                self.injected_errors += 1
+        return failed
+
+    @property
+    def base_url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def api_urls(self):
+        """WeatherAPI에 넘길 URL 인자를 반환합니다. (WeatherAPI(key, **server.api_urls()))"""
+        return {
+            "base_url": f"{self.base_url}/data/2.5",
+            "geocoding_url": f"{self.base_url}/geo/1.0",
+            "onecall_url": f"{self.base_url}/data/3.0/onecall"
+        }
+
+
+def start_server(port=0, fixtures_dir=DEFAULT_FIXTURES_DIR, **options):
+    """
+    백그라운드 스레드에서 서버를 시작하고 서버 객체를 반환합니다. (종료: server.shutdown())
+    options는 FakeOpenWeatherServer의 지연/오류 설정(latency, jitter, error_rate, ...)입니다.
+    """
+    server = FakeOpenWeatherServer(port=port, fixtures_dir=fixtures_dir, **options)
+    threading.Thread(target=server.serve_forever, name="fake-openweather", daemon=True).start()
+    return server
+
+
+def record(api_key, fixtures_dir, lat, lon, query, lang="kr", units="metric"):
+    """실제 OpenWeather 응답을 받아 응답 파일로 저장합니다."""
+    common = {"lat": lat, "lon": lon, "appid": api_key, "units": units, "lang": lang}
+    targets = dict(RECORD_TARGETS)
+    targets["geo_direct.json"] = ("https://api.openweathermap.org/geo/1.0/direct", {"q": query, "limit": 5})
+
+    for filename, (url, extra) in targets.items():
+        response = requests.get(url, params=dict(common, **extra), timeout=10)
+        response.raise_for_status()
+        with open(os.path.join(fixtures_dir, filename), "w", encoding="utf-8") as f:
+            json.dump(response.json(), f, ensure_ascii=False, indent=1)
+        print(f"{filename} 저장")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="OpenWeather 로컬 대체 서버")
+    parser.add_argument("--fixtures", default=DEFAULT_FIXTURES_DIR, help="응답 파일 폴더")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    serve_parser = commands.add_parser("serve", help="저장된 응답으로 서버 실행")
+    serve_parser.add_argument("--host", default="127.0.0.1")
+    serve_parser.add_argument("--port", type=int, default=8765)
+    serve_parser.add_argument("--latency", type=float, default=0, help="응답 지연 시간 (초)")
+    serve_parser.add_argument("--jitter", type=float, default=0, help="추가 임의 지연 최대값 (초)")
+    serve_parser.add_argument("--error-rate", type=float, default=0, help="오류로 응답할 요청 비율 (0~1)")
+    serve_parser.add_argument("--error-status", type=int, default=503, help="오류 응답 상태 코드")
+    serve_parser.add_argument("--invalid-key", action="append", default=[], help="401로 응답할 API 키 (여러 번 지정 가능)")
+
+    record_parser = commands.add_parser("record", help="실제 API 응답을 응답 파일로 저장")
+    record_parser.add_argument("--api-key", required=True)
+    record_parser.add_argument("--lat", type=float, default=37.5683)
+    record_parser.add_argument("--lon", type=float, default=126.9778)
+    record_parser.add_argument("--query", default="Seoul")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "record":
+        record(args.api_key, args.fixtures, args.lat, args.lon, args.query)
+        return 0
+
+    server = FakeOpenWeatherServer(args.host, args.port, args.fixtures,
+                                   latency=args.latency, jitter=args.jitter,
+                                   error_rate=args.error_rate, error_status=args.error_status,
+                                   invalid_keys=args.invalid_key)
+    urls = server.api_urls()
+    print(f"OpenWeather 대체 서버 실행 중: {server.base_url}")
+    print("앱을 이 서버로 실행하려면:")
+    print(f"  OPENWEATHER_BASE_URL={urls['base_url']} "
+          f"OPENWEATHER_GEOCODING_URL={urls['geocoding_url']} "
+          f"OPENWEATHER_ONECALL_URL={urls['onecall_url']} streamlit run app.py")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
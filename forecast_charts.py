@@ -0,0 +1,190 @@
+"""
+예보 데이터 변환 및 차트 생성 모듈
+5일 예보 목록을 DataFrame으로 변환하고 화면에 표시할 Plotly 차트를 만듭니다.
+Streamlit에 의존하지 않으므로 앱의 캐시 함수와 다른 스크립트에서 함께 사용할 수 있습니다.
+"""
+import pandas as pd
+import plotly.express as px
+
+from metrics import span
+
+# 상세 예보 테이블에 표시할 컬럼 (원본 컬럼명 -> 표시 이름)
+DISPLAY_COLUMNS = {
+    'datetime': '날짜/시간',
+    'temperature': '온도(°C)',
+    'feels_like': '체감온도(°C)',
+    'humidity': '습도(%)',
+    'pressure': '기압(hPa)',
+    'weather_description': '날씨',
+    'wind_speed': '풍속(m/s)',
+    'pop': '강수확률(%)'
+}
+
+
+def build_forecast_frame(forecast_data):
+    """
+    예보 목록을 시간 컬럼이 변환된 DataFrame으로 만듭니다.
+    이미 DataFrame(WeatherAPI의 as_frame=True 결과)이면 그대로 사용합니다.
+    """
+    if isinstance(forecast_data, pd.DataFrame):
+        return forecast_data
+    df = pd.DataFrame(forecast_data)
+    df['datetime'] = pd.to_datetime(df['datetime'])
+    return df
+
+
+def build_daily_frame(df):
+    """시간별 예보를 일별 데이터(최고/최저 온도 등)로 그룹화합니다."""
+    return df.groupby('date').agg({
+        'temp_max': 'max',
+        'temp_min': 'min',
+        'humidity': 'mean',
+        'weather_description': 'first',
+        'weather_icon': 'first',
+        'pop': 'max'
+    }).reset_index()
+
+
+def build_display_table(df):
+    """상세 예보 테이블용 DataFrame을 만듭니다."""
+    display_df = df[list(DISPLAY_COLUMNS)].copy()
+    display_df.columns = list(DISPLAY_COLUMNS.values())
+    return display_df
+
+
+def build_forecast_figures(df):
+    """
+    예보 화면의 차트를 만듭니다.
+
+    Returns:
+        dict: 'temperature', 'humidity', 'wind', 'pop' -> Plotly Figure
+    """
+    # 시간별 온도 변화 차트
+    fig_temp = px.line(df, x='datetime', y='temperature',
+                       title='시간별 온도 변화',
+                       labels={'temperature': '온도 (°C)', 'datetime': '시간'})
+    fig_temp.update_layout(height=400)
+
+    # 습도 차트
+    fig_humidity = px.bar(df, x='time', y='humidity',
+                          title='시간별 습도',
+                          labels={'humidity': '습도 (%)', 'time': '시간'})
+    fig_humidity.update_layout(height=400)
+
+    # 풍속 차트
+    fig_wind = px.line(df, x='datetime', y='wind_speed',
+                       title='시간별 풍속 변화',
+                       labels={'wind_speed': '풍속 (m/s)', 'datetime': '시간'})
+
+    # 강수 확률 차트
+    fig_pop = px.bar(df, x='time', y='pop',
+                     title='시간별 강수 확률',
+                     labels={'pop': '강수 확률 (%)', 'time': '시간'})
+
+    return {
+        'temperature': fig_temp,
+        'humidity': fig_humidity,
+        'wind': fig_wind,
+        'pop': fig_pop
+    }
+
+
+def build_forecast_view(forecast_data):
+    """
+    예보 화면에 필요한 데이터를 한 번에 만듭니다.
+
+    Returns:
+        dict: 'hourly'(DataFrame), 'daily'(DataFrame), 'table'(DataFrame), 'figures'(dict)
+    """
+    df = build_forecast_frame(forecast_data)
+    with span('view.daily'):
+        daily = build_daily_frame(df)
+    with span('view.table'):
+        table = build_display_table(df)
+    with span('view.figures'):
+        figures = build_forecast_figures(df)
+    return {
+        'hourly': df,
+        'daily': daily,
+        'table': table,
+        'figures': figures
+    }
+
+
+# 지역 비교 차트 (컬럼명 -> (축 이름, 차트 제목))
+COMPARISON_METRICS = {
+    'temperature': ('온도 (°C)', '지역별 시간별 온도'),
+    'pop': ('강수 확률 (%)', '지역별 시간별 강수 확률'),
+    'wind_speed': ('풍속 (m/s)', '지역별 시간별 풍속')
+}
+
+# 현재 날씨 요약 테이블에 표시할 컬럼 (원본 컬럼명 -> 표시 이름)
+SUMMARY_COLUMNS = {
+    'temperature': '온도(°C)',
+    'feels_like': '체감온도(°C)',
+    'humidity': '습도(%)',
+    'wind_speed': '풍속(m/s)',
+    'weather_description': '날씨'
+}
+
+
+def build_comparison_frame(forecasts):
+    """
+    여러 지역의 예보를 'location' 컬럼을 가진 하나의 DataFrame으로 합칩니다.
+
+    Args:
+        forecasts: {지역명: 예보 목록 또는 DataFrame} (표시 순서대로)
+    """
+    frames = [
+        build_forecast_frame(forecast_data).assign(location=location)
+        for location, forecast_data in forecasts.items()
+    ]
+    return pd.concat(frames, ignore_index=True)
+
+
+def build_comparison_figures(df):
+    """
+    지표마다 모든 지역을 겹쳐 그린 차트 하나씩을 만듭니다. (지역 수와 관계없이 차트 수는 일정)
+
+    Returns:
+        dict: COMPARISON_METRICS의 컬럼명 -> Plotly Figure
+    """
+    figures = {}
+    for column, (label, title) in COMPARISON_METRICS.items():
+        fig = px.line(df, x='datetime', y=column, color='location',
+                      title=title,
+                      labels={column: label, 'datetime': '시간', 'location': '지역'})
+        fig.update_layout(height=400, hovermode='x unified')
+        figures[column] = fig
+    return figures
+
+
+def build_current_summary(currents):
+    """여러 지역의 현재 날씨를 지역당 한 행인 표로 만듭니다."""
+    summary = pd.DataFrame.from_dict(currents, orient='index')[list(SUMMARY_COLUMNS)]
+    summary.columns = list(SUMMARY_COLUMNS.values())
+    summary.index.name = '지역'
+    return summary
+
+
+def build_comparison_view(bundles):
+    """
+    지역 비교 화면에 필요한 데이터를 한 번에 만듭니다.
+
+    Args:
+        bundles: {지역명: (현재 날씨 dict, 예보 목록)} (표시 순서대로)
+
+    Returns:
+        dict: 'hourly'(DataFrame), 'summary'(DataFrame), 'figures'(dict)
+    """
+    with span('view.comparison_frame'):
+        df = build_comparison_frame({location: forecast for location, (_, forecast) in bundles.items()})
+    with span('view.summary'):
+        summary = build_current_summary({location: current for location, (current, _) in bundles.items()})
+    with span('view.figures'):
+        figures = build_comparison_figures(df)
+    return {
+        'hourly': df,
+        'summary': summary,
+        'figures': figures
+    }
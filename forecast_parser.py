@@ -0,0 +1,171 @@
+"""
+날씨 응답 파싱 모듈
+/weather 응답을 CurrentWeather로, /forecast 응답의 list 배열을 항목별 dict를 거치지 않고
+컬럼별 배열(Forecast)과 DataFrame으로 변환합니다.
+시간대 변환과 날짜/시간 문자열 생성은 배열 연산으로 한 번에 처리합니다.
+"""
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+
+from models import CurrentWeather, Forecast, encode_categories
+
+
+def _local_time(utc_timestamp, timezone_offset, fmt):
+    """UTC 타임스탬프를 지역 시간 문자열로 변환합니다."""
+    local_tz = timezone(timedelta(seconds=timezone_offset))
+    return datetime.fromtimestamp(utc_timestamp, tz=local_tz).strftime(fmt)
+
+
+def parse_current_weather(data, country=None):
+    """
+    /weather 응답을 CurrentWeather 레코드로 변환합니다.
+    country를 지정하지 않으면 응답의 국가 코드를 사용합니다.
+    """
+    main = data['main']
+    weather = data['weather'][0]
+    offset = data['timezone']
+    return CurrentWeather(
+        city=data['name'],
+        country=country if country is not None else data['sys'].get('country', 'Unknown'),
+        temperature=round(main['temp']),
+        feels_like=round(main['feels_like']),
+        humidity=main['humidity'],
+        pressure=main['pressure'],
+        visibility=data.get('visibility', 0) / 1000,  # km로 변환
+        wind_speed=data['wind']['speed'],
+        wind_direction=data['wind'].get('deg', 0),
+        weather_main=weather['main'],
+        weather_description=weather['description'],
+        weather_icon=weather['icon'],
+        clouds=data['clouds']['all'],
+        sunrise=_local_time(data['sys']['sunrise'], offset, '%H:%M'),
+        sunset=_local_time(data['sys']['sunset'], offset, '%H:%M'),
+        timezone=offset,
+        dt=_local_time(data['dt'], offset, '%Y-%m-%d %H:%M:%S')
+    )
+
+
+def _rounded(values, dtype='int16'):
+    """Python round()와 같은 방식(짝수 반올림)으로 반올림한 정수 배열을 반환합니다."""
+    return np.round(np.asarray(values, dtype=float)).astype(dtype)
+
+
+def parse_forecast(data):
+    """
+    /forecast 응답을 컬럼별 배열로 저장하는 Forecast 레코드로 변환합니다.
+    UTC 타임스탬프에 타임존 오프셋을 더해 지역 시간으로 한 번에 변환합니다.
+    """
+    items = data['list']
+    timezone_offset = data.get('city', {}).get('timezone', 0)
+    mains = [item['main'] for item in items]
+    weathers = [item['weather'][0] for item in items]
+    winds = [item['wind'] for item in items]
+
+    timestamps = np.fromiter((item['dt'] for item in items), dtype='int64', count=len(items))
+    return Forecast(
+        local_time=(timestamps + timezone_offset).astype('datetime64[s]'),
+        temperature=_rounded([main['temp'] for main in mains]),
+        feels_like=_rounded([main['feels_like'] for main in mains]),
+        temp_min=_rounded([main['temp_min'] for main in mains]),
+        temp_max=_rounded([main['temp_max'] for main in mains]),
+        humidity=np.array([main['humidity'] for main in mains], dtype=np.uint8),
+        pressure=np.array([main['pressure'] for main in mains], dtype=np.int16),
+        clouds=np.array([item['clouds']['all'] for item in items], dtype=np.uint8),
+        wind_speed=np.array([wind['speed'] for wind in winds], dtype=float),
+        wind_direction=np.array([wind.get('deg', 0) for wind in winds], dtype=np.int16),
+        pop=np.array([item.get('pop', 0) for item in items], dtype=float) * 100,  # %로 변환
+        weather_main=encode_categories(weather['main'] for weather in weathers),
+        weather_description=encode_categories(weather['description'] for weather in weathers),
+        weather_icon=encode_categories(weather['icon'] for weather in weathers)
+    )
+
+
+def parse_forecast_frame(data):
+    """
+    /forecast 응답을 DataFrame으로 변환합니다.
+
+    'datetime'은 지역 시간 기준 datetime64 컬럼이고, 'date'/'time'은 같은 값에서 만든 문자열입니다.
+    타임스탬프는 한 번만 변환하므로 화면이나 일괄 작업에서 pd.to_datetime을 다시 호출할 필요가 없습니다.
+    """
+    return parse_forecast(data).to_frame()
+
+
+def forecast_records(frame):
+    """
+    예보 DataFrame을 기존 API 형식의 dict 목록으로 변환합니다.
+    ('datetime'은 'YYYY-MM-DD HH:MM' 문자열)
+    """
+    records = frame.assign(datetime=frame['date'] + ' ' + frame['time'])
+    return records.to_dict('records')
+
+
+def _onecall_forecast_item(entry, temp, feels_like, temp_min, temp_max):
+    """One Call 시간별/일별 항목을 /forecast 목록 항목 형태로 바꿉니다."""
+    return {
+        'dt': entry['dt'],
+        'main': {
+            'temp': temp,
+            'feels_like': feels_like,
+            'temp_min': temp_min,
+            'temp_max': temp_max,
+            'humidity': entry['humidity'],
+            'pressure': entry['pressure']
+        },
+        'weather': entry['weather'],
+        'clouds': {'all': entry.get('clouds', 0)},
+        'wind': {'speed': entry['wind_speed'], 'deg': entry.get('wind_deg', 0)},
+        'pop': entry.get('pop', 0)
+    }
+
+
+def parse_onecall(data, days=5, step_hours=3):
+    """
+    One Call API 3.0 응답을 현재 날씨와 예보 레코드로 변환합니다.
+
+    예보는 기존 /forecast와 같은 모양이 되도록 시간별 예보를 step_hours 간격으로 사용하고,
+    시간별 예보(48시간)가 끝난 뒤부터 days일까지는 일별 예보를 하루 한 항목으로 이어 붙입니다.
+    One Call 응답에는 지역명과 국가 코드가 없으므로 CurrentWeather의 city/country는 빈 문자열입니다.
+
+    Returns:
+        dict: {'weather': CurrentWeather, 'forecast': Forecast}
+    """
+    offset = data.get('timezone_offset', 0)
+    current = data['current']
+    weather = current['weather'][0]
+    current_weather = CurrentWeather(
+        city='',
+        country='',
+        temperature=round(current['temp']),
+        feels_like=round(current['feels_like']),
+        humidity=current['humidity'],
+        pressure=current['pressure'],
+        visibility=current.get('visibility', 0) / 1000,  # km로 변환
+        wind_speed=current['wind_speed'],
+        wind_direction=current.get('wind_deg', 0),
+        weather_main=weather['main'],
+        weather_description=weather['description'],
+        weather_icon=weather['icon'],
+        clouds=current.get('clouds', 0),
+        sunrise=_local_time(current['sunrise'], offset, '%H:%M'),
+        sunset=_local_time(current['sunset'], offset, '%H:%M'),
+        timezone=offset,
+        dt=_local_time(current['dt'], offset, '%Y-%m-%d %H:%M:%S')
+    )
+
+    hourly = data.get('hourly', [])[::step_hours]
+    items = [
+        _onecall_forecast_item(entry, entry['temp'], entry['feels_like'], entry['temp'], entry['temp'])
+        for entry in hourly
+    ]
+    end = current['dt'] + days * 86400
+    last = hourly[-1]['dt'] if hourly else current['dt']
+    for entry in data.get('daily', []):
+        if last < entry['dt'] < end:
+            temp = entry['temp']
+            items.append(_onecall_forecast_item(
+                entry, temp['day'], entry['feels_like']['day'], temp['min'], temp['max']
+            ))
+
+    forecast = parse_forecast({'city': {'timezone': offset}, 'list': items})
+    return {'weather': current_weather, 'forecast': forecast}
@@ -0,0 +1,81 @@
+"""
+한글 자모 처리 모듈
+한글 음절을 초성/자모 단위로 분해하여 초성 검색과 입력 중인 글자 검색을 지원합니다.
+"""
+
+_SYLLABLE_BASE = 0xAC00
+_SYLLABLE_LAST = 0xD7A3
+_JUNGSEONG_COUNT = 21
+_JONGSEONG_COUNT = 28
+
+CHOSEONG = 'ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ'
+JUNGSEONG = 'ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ'
+JONGSEONG = [
+    '', 'ㄱ', 'ㄲ', 'ㄳ', 'ㄴ', 'ㄵ', 'ㄶ', 'ㄷ', 'ㄹ', 'ㄺ', 'ㄻ', 'ㄼ', 'ㄽ', 'ㄾ',
+    'ㄿ', 'ㅀ', 'ㅁ', 'ㅂ', 'ㅄ', 'ㅅ', 'ㅆ', 'ㅇ', 'ㅈ', 'ㅊ', 'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ'
+]
+
+# 두 번의 키 입력으로 만들어지는 겹자음/겹모음 (입력 중에 '역ㅅ' -> '엯'처럼 나타남)
+_COMPOUND_JAMO = {
+    'ㄳ': 'ㄱㅅ', 'ㄵ': 'ㄴㅈ', 'ㄶ': 'ㄴㅎ', 'ㄺ': 'ㄹㄱ', 'ㄻ': 'ㄹㅁ', 'ㄼ': 'ㄹㅂ',
+    'ㄽ': 'ㄹㅅ', 'ㄾ': 'ㄹㅌ', 'ㄿ': 'ㄹㅍ', 'ㅀ': 'ㄹㅎ', 'ㅄ': 'ㅂㅅ',
+    'ㅘ': 'ㅗㅏ', 'ㅙ': 'ㅗㅐ', 'ㅚ': 'ㅗㅣ', 'ㅝ': 'ㅜㅓ', 'ㅞ': 'ㅜㅔ', 'ㅟ': 'ㅜㅣ', 'ㅢ': 'ㅡㅣ'
+}
+
+_CHOSEONG_SET = frozenset(CHOSEONG)
+
+
+def is_syllable(char):
+    """완성형 한글 음절인지 확인합니다."""
+    return _SYLLABLE_BASE <= ord(char) <= _SYLLABLE_LAST
+
+
+def is_jamo(char):
+    """한글 호환 자모(ㄱ~ㅣ)인지 확인합니다."""
+    return 0x3131 <= ord(char) <= 0x318E
+
+
+def has_jamo(text):
+    """아직 음절로 완성되지 않은 자모가 포함되어 있는지 확인합니다."""
+    return any(is_jamo(char) for char in text)
+
+
+def is_choseong_query(text):
+    """공백을 제외한 모든 글자가 자음인지 확인합니다. (예: 'ㄱㄴㄱ')"""
+    chars = [char for char in text if not char.isspace()]
+    return bool(chars) and all(char in _CHOSEONG_SET for char in chars)
+
+
+def choseong(text):
+    """
+    각 음절의 초성만 모은 문자열을 반환합니다. 공백은 제거합니다.
+    예: '강남구' -> 'ㄱㄴㄱ'
+    """
+    result = []
+    for char in text:
+        if is_syllable(char):
+            offset = ord(char) - _SYLLABLE_BASE
+            result.append(CHOSEONG[offset // (_JUNGSEONG_COUNT * _JONGSEONG_COUNT)])
+        elif not char.isspace():
+            result.append(char)
+    return ''.join(result)
+
+
+def decompose(text):
+    """
+    음절을 키 입력 순서대로의 기본 자모로 분해합니다. 공백은 제거합니다.
+    예: '강남' -> 'ㄱㅏㅇㄴㅏㅁ', '엯' -> 'ㅇㅕㄱㅅ'
+    """
+    result = []
+    for char in text:
+        if is_syllable(char):
+            offset = ord(char) - _SYLLABLE_BASE
+            cho, rest = divmod(offset, _JUNGSEONG_COUNT * _JONGSEONG_COUNT)
+            jung, jong = divmod(rest, _JONGSEONG_COUNT)
+            jamo = CHOSEONG[cho] + JUNGSEONG[jung] + JONGSEONG[jong]
+        elif char.isspace():
+            continue
+        else:
+            jamo = char
+        result.append(''.join(_COMPOUND_JAMO.get(j, j) for j in jamo))
+    return ''.join(result)
@@ -0,0 +1,190 @@
+"""
+HTTP 클라이언트 모듈
+연결 풀(keep-alive), 타임아웃, 재시도/백오프를 갖춘 공용 HTTP 클라이언트를 제공합니다.
+"""
+import random
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from metrics import inc, span
+from rate_limit import RateLimitExceeded
+
+# 재시도할 HTTP 상태 코드 (요청 한도 초과 및 서버 오류)
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+def error_summary(error):
+    """
+    화면/응답에 보여줄 오류 요약을 반환합니다.
+    requests 예외 메시지에는 API 키(appid)가 포함된 요청 URL이 들어가므로 예외 종류, 상태 코드, 경로만 남깁니다.
+    (요청을 보내기 전에 직접 만든 예외(서킷 차단, 호출 한도 등)와 다른 예외는 메시지를 그대로 사용)
+    """
+    if not isinstance(error, requests.RequestException) or (error.request is None and error.response is None):
+        return str(error)
+    if error.response is not None:
+        return f"{type(error).__name__} {error.response.status_code} ({urlsplit(error.response.url).path})"
+    if error.request is not None and error.request.url:
+        return f"{type(error).__name__} ({urlsplit(error.request.url).path})"
+    return type(error).__name__
+
+
+class HTTPClient:
+    """
+    requests.Session 기반 HTTP 클라이언트입니다.
+    하나의 연결 풀을 여러 스레드가 공유하며, 같은 호스트로의 연결을 재사용합니다.
+    rate_limiter(HostRateLimiter)를 지정하면 재시도를 포함한 모든 요청이 호스트별/엔드포인트별 한도와
+    현재 요청 우선순위(rate_limit.priority)를 따릅니다. 한도 때문에 생략된 요청은 RateLimitExceeded입니다.
+    circuit_breaker(HostCircuitBreaker)를 지정하면 연속으로 실패하는 호스트에는 잠시 요청하지 않고
+    바로 CircuitOpenError를 발생시킵니다. (연결 오류, 타임아웃, 429/5xx만 실패로 셈)
+    key_pool(KeyPool)을 지정하면 요청마다 풀에서 고른 키를 'appid'로 보내고,
+    401/429를 받으면 그 키를 풀에서 빼고 다른 키로 바로 다시 요청합니다.
+    """
+
+    def __init__(self, pool_size=10, connect_timeout=3.05, read_timeout=10,
+                 max_retries=2, backoff_factor=0.5, backoff_max=8, rate_limiter=None,
+                 circuit_breaker=None, key_pool=None):
+        self.timeout = (connect_timeout, read_timeout)
+        self.rate_limiter = rate_limiter
+        self.circuit_breaker = circuit_breaker
+        self.key_pool = key_pool
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.backoff_max = backoff_max
+
+        # 재시도는 직접 처리하므로 어댑터 자체 재시도는 끕니다
+        self._adapter = HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            max_retries=0
+        )
+        self.session = requests.Session()
+        self.session.mount("http://", self._adapter)
+        self.session.mount("https://", self._adapter)
+
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.retries = 0
+        self.errors = 0
+
+    def get_json(self, url, params=None):
+        """
+        GET 요청을 보내고 JSON 응답을 반환합니다.
+        연결 오류와 429/5xx 응답은 지터가 포함된 지수 백오프로 재시도합니다.
+        최종 실패 시 requests 예외를 발생시킵니다.
+        응답 코드별 횟수는 'upstream_responses_total{endpoint, status}' 메트릭으로 기록합니다.
+        """
+        parts = urlsplit(url)
+        with span('http', endpoint=parts.path) as attrs:
+            try:
+                return self._get_json(url, params, parts.netloc, parts.path, attrs)
+            except RateLimitExceeded:
+                attrs['shed'] = True  # 서버로 보내지 않은 요청 (ratelimit_requests_total로 집계)
+                raise
+            except requests.RequestException as e:
+                if e.response is None:
+                    # 응답 없이 실패 (연결 오류, 타임아웃, 서킷 차단)
+                    inc('upstream_responses_total', endpoint=parts.path, status=type(e).__name__)
+                raise
+
+    def _get_json(self, url, params, host, path, attrs):
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.check(host)
+        for attempt in range(self.max_retries + 1):
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(host, path)
+            key = None
+            if self.key_pool is not None:
+                key = self.key_pool.acquire()  # 남은 키가 없으면 NoAvailableKey
+                params = dict(params or {}, appid=key)
+            self._count('requests')
+            try:
+                response = self.session.get(url, params=params, timeout=self.timeout)
+                inc('upstream_responses_total', endpoint=path, status=response.status_code)
+                attrs['status'] = response.status_code
+                attrs['attempts'] = attempt + 1
+            except requests.ConnectionError:
+                if attempt == self.max_retries:
+                    self._count('errors')
+                    self._record(host, False)
+                    raise
+                self._count('retries')
+                time.sleep(self._backoff(attempt))
+                continue
+            except requests.Timeout:
+                # 응답 대기 시간 초과는 재시도하지 않음 (대기 시간이 늘어나는 것을 방지)
+                self._count('errors')
+                self._record(host, False)
+                raise
+
+            # 401/429를 받은 키는 풀에서 빠지므로 남은 키가 있으면 기다리지 않고 다른 키로 재시도
+            evicted = key is not None and self.key_pool.report(
+                key, response.status_code, response.headers.get('Retry-After'))
+            if evicted and attempt < self.max_retries and self.key_pool.available():
+                self._count('retries')
+                continue
+
+            if response.status_code in RETRY_STATUS_CODES and attempt < self.max_retries and not evicted:
+                self._count('retries')
+                time.sleep(self._backoff(attempt, response.headers.get('Retry-After')))
+                continue
+
+            # 4xx(잘못된 키, 없는 지역 등)는 서버가 정상 응답한 것으로 봄
+            self._record(host, response.status_code not in RETRY_STATUS_CODES)
+            if response.status_code >= 400:
+                self._count('errors')
+            response.raise_for_status()
+            return response.json()
+
+    def _record(self, host, success):
+        """서킷 브레이커에 요청 결과를 기록합니다."""
+        if self.circuit_breaker is None:
+            return
+        if success:
+            self.circuit_breaker.record_success(host)
+        else:
+            self.circuit_breaker.record_failure(host)
+
+    def _backoff(self, attempt, retry_after=None):
+        """재시도 전 대기 시간(초)을 계산합니다. Retry-After 헤더가 있으면 우선합니다."""
+        if retry_after is not None:
+            try:
+                return min(float(retry_after), self.backoff_max)
+            except ValueError:
+                pass
+        # Full jitter: 0 ~ factor * 2^attempt 사이의 임의 값
+        return random.uniform(0, min(self.backoff_max, self.backoff_factor * (2 ** attempt)))
+
+    def _count(self, name, amount=1):
+        with self._lock:
+            setattr(self, name, getattr(self, name) + amount)
+
+    def stats(self):
+        """
+        요청/재시도/오류 횟수와 연결 재사용 통계를 반환합니다.
+        reused_connections는 기존 keep-alive 연결로 처리된 요청 수입니다.
+        """
+        new_connections = 0
+        pooled_requests = 0
+        pools = self._adapter.poolmanager.pools
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            new_connections += pool.num_connections
+            pooled_requests += pool.num_requests
+
+        with self._lock:
+            return {
+                'requests': self.requests,
+                'retries': self.retries,
+                'errors': self.errors,
+                'new_connections': new_connections,
+                'reused_connections': max(pooled_requests - new_connections, 0)
+            }
+
+    def close(self):
+        self.session.close()
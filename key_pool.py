@@ -0,0 +1,184 @@
+"""
+API 키 풀 모듈
+여러 OpenWeather API 키에 요청을 나눠 보내 한 키의 호출 한도를 넘는 트래픽을 처리합니다.
+
+- 남은 호출 한도(분/일)가 가장 많은 키를 고릅니다.
+- 401(잘못된 키)이나 429(한도 초과)를 받은 키는 일정 시간 풀에서 뺍니다.
+- 키별 통계는 stats()와 메트릭(weather_key_*)으로 확인합니다. (키는 '풀 순번:앞/뒤 4자리'로 표시)
+"""
+import threading
+import time
+
+import requests
+
+from metrics import inc
+from rate_limit import QuotaTracker
+
+# 키를 풀에서 빼야 하는 응답 코드
+UNAUTHORIZED = 401
+RATE_LIMITED = 429
+KEY_ERROR_STATUS_CODES = frozenset({UNAUTHORIZED, RATE_LIMITED})
+
+
+def mask_key(key):
+    """통계/로그에 표시할 키 (앞 4자리와 뒤 4자리만)"""
+    return f"{key[:4]}…{key[-4:]}" if len(key) > 8 else "…"
+
+
+def parse_keys(value):
+    """
+    API 키 목록을 만듭니다. 문자열은 쉼표로 나누고, 목록은 각 키의 앞뒤 공백을 지웁니다. (빈 키는 제외)
+    """
+    if isinstance(value, str):
+        value = value.split(",")
+    return [key.strip() for key in value if key and key.strip()]
+
+
+class NoAvailableKey(requests.ConnectionError):
+    """사용할 수 있는 API 키가 없는 경우 (requests 예외와 같은 방식으로 처리됨)"""
+
+    def __init__(self, retry_after):
+        super().__init__(f"사용 가능한 API 키 없음 ({retry_after:.0f}초 후 다시 사용 가능)")
+        self.retry_after = retry_after
+
+
+class _KeyState:
+    """키 하나의 사용량, 제외 상태, 응답 통계"""
+
+    def __init__(self, key, index, quota_per_minute, quota_per_day):
+        self.key = key
+        self.label = f"{index}:{mask_key(key)}"  # 짧은 키도 서로 구분되도록 풀 순번을 붙임
+        self.quota = QuotaTracker(quota_per_minute, quota_per_day)
+        self.evicted_until = 0.0
+        self.last_used = 0.0
+        self.requests = 0
+        self.errors = 0
+        self.unauthorized = 0
+        self.rate_limited = 0
+
+    def remaining(self):
+        """(분당 남은 호출 수, 일일 남은 호출 수). 한도가 없으면 무한대"""
+        usage = self.quota.usage()
+        minute = usage['minute_limit'] - usage['minute'] if usage['minute_limit'] else float('inf')
+        day = usage['day_limit'] - usage['day'] if usage['day_limit'] else float('inf')
+        return minute, day
+
+
+class KeyPool:
+    """
+    스레드 안전 API 키 풀입니다.
+
+    - quota_per_minute/quota_per_day: 키 하나의 분/일 호출 한도 (None이면 제한 없음)
+    - unauthorized_timeout: 401을 받은 키를 빼 두는 시간 (초)
+    - rate_limited_timeout: 429를 받은 키를 빼 두는 시간 (초, Retry-After 헤더가 있으면 우선)
+    """
+
+    def __init__(self, keys, quota_per_minute=None, quota_per_day=None,
+                 unauthorized_timeout=3600, rate_limited_timeout=60):
+        keys = list(dict.fromkeys(key for key in keys if key))  # 순서를 유지하며 중복/빈 키 제거
+        if not keys:
+            raise ValueError("API 키가 하나 이상 필요합니다.")
+        self.unauthorized_timeout = unauthorized_timeout
+        self.rate_limited_timeout = rate_limited_timeout
+        self._states = {key: _KeyState(key, index, quota_per_minute, quota_per_day)
+                        for index, key in enumerate(keys, 1)}
+        self._lock = threading.Lock()
+
+    @property
+    def keys(self):
+        return list(self._states)
+
+    def __len__(self):
+        return len(self._states)
+
+    def available(self):
+        """지금 사용할 수 있는 키 수"""
+        now = time.monotonic()
+        with self._lock:
+            return sum(1 for state in self._states.values() if state.evicted_until <= now)
+
+    def acquire(self):
+        """
+        남은 호출 한도가 가장 많은 키를 골라 사용량에 기록하고 반환합니다.
+        남은 한도가 같으면 가장 오래전에 쓴 키를 고릅니다. 모든 키가 빠져 있으면 NoAvailableKey를 발생시킵니다.
+        """
+        now = time.monotonic()
+        with self._lock:
+            candidates = [state for state in self._states.values()
+                          if state.evicted_until <= now and state.remaining()[1] > 0]
+            if not candidates:
+                waits = [state.evicted_until - now for state in self._states.values() if state.evicted_until > now]
+                raise NoAvailableKey(min(waits) if waits else 86400)
+            state = max(candidates, key=lambda state: (state.remaining(), -state.last_used))
+            state.quota.record()
+            state.last_used = now
+            state.requests += 1
+            return state.key
+
+    def report(self, key, status, retry_after=None):
+        """
+        키로 보낸 요청의 응답 코드를 기록합니다.
+        401/429면 키를 일정 시간 빼고 True를 반환합니다. (다른 키로 다시 요청할 수 있음)
+        """
+        state = self._states.get(key)
+        if state is None:
+            return False
+        inc('key_responses_total', key=state.label, status=status)
+        if status not in KEY_ERROR_STATUS_CODES:
+            if status >= 400:
+                with self._lock:
+                    state.errors += 1
+            return False
+
+        if status == UNAUTHORIZED:
+            timeout = self.unauthorized_timeout
+        else:
+            timeout = self.rate_limited_timeout
+            if retry_after is not None:
+                try:
+                    timeout = float(retry_after)
+                except ValueError:
+                    pass
+        with self._lock:
+            state.errors += 1
+            if status == UNAUTHORIZED:
+                state.unauthorized += 1
+            else:
+                state.rate_limited += 1
+            state.evicted_until = time.monotonic() + timeout
+        print(f"API 키 {state.label} 일시 제외 ({status}, {timeout:.0f}초)")
+        return True
+
+    def restore(self, key):
+        """빼 둔 키를 바로 다시 사용합니다."""
+        with self._lock:
+            self._states[key].evicted_until = 0.0
+
+    def gauges(self):
+        """키별 사용량/사용 가능 여부 게이지 (풀을 가진 WeatherAPI가 instance 레이블을 붙여 등록)"""
+        now = time.monotonic()
+        gauges = []
+        for state in list(self._states.values()):
+            usage = state.quota.usage()
+            gauges.append(('key_quota_used', {'key': state.label, 'window': 'minute'}, usage['minute']))
+            gauges.append(('key_quota_used', {'key': state.label, 'window': 'day'}, usage['day']))
+            gauges.append(('key_available', {'key': state.label}, int(state.evicted_until <= now)))
+        return gauges
+
+    def stats(self):
+        """키별 사용량과 응답 통계를 반환합니다. (키는 풀 순번과 앞/뒤 4자리만 표시)"""
+        now = time.monotonic()
+        with self._lock:
+            states = list(self._states.values())
+            return {
+                state.label: {
+                    'available': state.evicted_until <= now,
+                    'evicted_for': round(max(state.evicted_until - now, 0), 1),
+                    'requests': state.requests,
+                    'errors': state.errors,
+                    'unauthorized': state.unauthorized,
+                    'rate_limited': state.rate_limited,
+                    'quota': state.quota.usage()
+                }
+                for state in states
+            }
@@ -0,0 +1,192 @@
+"""
+한국 지역 좌표 테이블 (자동 생성 파일 - 직접 수정하지 마세요)
+원본: data/korean_location_coords.csv
+생성: python build_location_coords.py
+
+영문 지역명 -> (위도, 경도, 행정표준코드)
+"""
+
+LOCATION_COORDS = {
+    'Seoul': (37.5665, 126.978, '11'),
+    'Busan': (35.1796, 129.0756, '26'),
+    'Daegu': (35.8714, 128.6014, '27'),
+    'Incheon': (37.4563, 126.7052, '28'),
+    'Gwangju': (35.1595, 126.8526, '29'),
+    'Daejeon': (36.3504, 127.3845, '30'),
+    'Ulsan': (35.5384, 129.3114, '31'),
+    'Sejong': (36.48, 127.289, '36110'),
+    'Suwon': (37.2636, 127.0286, '41110'),
+    'Seongnam': (37.42, 127.1267, '41130'),
+    'Uijeongbu': (37.7381, 127.0338, '41150'),
+    'Anyang': (37.3943, 126.9568, '41170'),
+    'Bucheon': (37.5034, 126.766, '41190'),
+    'Gwangmyeong': (37.4786, 126.8646, '41210'),
+    'Pyeongtaek': (36.9921, 127.1129, '41220'),
+    'Dongducheon': (37.9036, 127.0606, '41250'),
+    'Ansan': (37.3219, 126.8309, '41270'),
+    'Goyang': (37.6584, 126.832, '41280'),
+    'Gwacheon': (37.4292, 126.9876, '41290'),
+    'Guri': (37.5943, 127.1296, '41310'),
+    'Namyangju': (37.636, 127.2165, '41360'),
+    'Osan': (37.1498, 127.0772, '41370'),
+    'Siheung': (37.38, 126.8029, '41390'),
+    'Gunpo': (37.3616, 126.9352, '41410'),
+    'Uiwang': (37.3447, 126.9683, '41430'),
+    'Hanam': (37.5393, 127.2148, '41450'),
+    'Yongin': (37.2411, 127.1776, '41460'),
+    'Paju': (37.76, 126.78, '41480'),
+    'Icheon': (37.272, 127.435, '41500'),
+    'Anseong': (37.008, 127.2797, '41550'),
+    'Gimpo': (37.6153, 126.7156, '41570'),
+    'Hwaseong': (37.1995, 126.8311, '41590'),
+    'Gwangju-si': (37.4292, 127.255, '41610'),
+    'Yangju': (37.7853, 127.0458, '41630'),
+    'Pocheon': (37.8949, 127.2003, '41650'),
+    'Yeoju': (37.2984, 127.637, '41670'),
+    'Yeoncheon': (38.0966, 127.0747, '41800'),
+    'Gapyeong': (37.8315, 127.5105, '41820'),
+    'Yangpyeong': (37.4917, 127.4875, '41830'),
+    'Chuncheon': (37.8813, 127.7298, '51110'),
+    'Wonju': (37.3422, 127.9202, '51130'),
+    'Gangneung': (37.7519, 128.8761, '51150'),
+    'Donghae': (37.5247, 129.1143, '51170'),
+    'Taebaek': (37.1641, 128.9856, '51190'),
+    'Sokcho': (38.207, 128.5918, '51210'),
+    'Samcheok': (37.45, 129.1651, '51230'),
+    'Cheongju': (36.6424, 127.489, '43110'),
+    'Chungju': (36.991, 127.9259, '43130'),
+    'Jecheon': (37.1326, 128.191, '43150'),
+    'Cheonan': (36.8151, 127.1139, '44130'),
+    'Gongju': (36.4465, 127.119, '44150'),
+    'Boryeong': (36.3334, 126.6128, '44180'),
+    'Asan': (36.7898, 127.0019, '44200'),
+    'Seosan': (36.7848, 126.4503, '44210'),
+    'Nonsan': (36.1871, 127.0987, '44230'),
+    'Gyeryong': (36.2745, 127.2489, '44250'),
+    'Dangjin': (36.8898, 126.6459, '44270'),
+    'Jeonju': (35.8242, 127.148, '52110'),
+    'Gunsan': (35.9676, 126.7366, '52130'),
+    'Iksan': (35.9483, 126.9577, '52140'),
+    'Jeongeup': (35.5699, 126.8559, '52180'),
+    'Namwon': (35.4164, 127.3905, '52190'),
+    'Gimje': (35.8036, 126.8809, '52210'),
+    'Mokpo': (34.8118, 126.3922, '46110'),
+    'Yeosu': (34.7604, 127.6622, '46130'),
+    'Suncheon': (34.9507, 127.4872, '46150'),
+    'Naju': (35.016, 126.7108, '46170'),
+    'Gwangyang': (34.9407, 127.6959, '46230'),
+    'Pohang': (36.019, 129.3435, '47110'),
+    'Gyeongju': (35.8562, 129.2247, '47130'),
+    'Gimcheon': (36.1398, 128.1136, '47150'),
+    'Andong': (36.5684, 128.7294, '47170'),
+    'Gumi': (36.1195, 128.3446, '47190'),
+    'Yeongju': (36.8057, 128.6241, '47210'),
+    'Yeongcheon': (35.9733, 128.9386, '47230'),
+    'Sangju': (36.4109, 128.159, '47250'),
+    'Mungyeong': (36.5866, 128.1867, '47280'),
+    'Gyeongsan': (35.8251, 128.7414, '47290'),
+    'Changwon': (35.228, 128.6811, '48120'),
+    'Masan': (35.198, 128.572, '48125'),
+    'Jinju': (35.18, 128.1076, '48170'),
+    'Tongyeong': (34.8544, 128.4331, '48220'),
+    'Sacheon': (35.0037, 128.0642, '48240'),
+    'Gimhae': (35.2285, 128.8894, '48250'),
+    'Miryang': (35.5038, 128.7467, '48270'),
+    'Geoje': (34.8806, 128.6211, '48310'),
+    'Yangsan': (35.335, 129.0372, '48330'),
+    'Jeju': (33.4996, 126.5312, '50110'),
+    'Seogwipo': (33.2541, 126.5601, '50130'),
+    'Jongno-gu, Seoul': (37.5735, 126.979, '11110'),
+    'Jung-gu, Seoul': (37.5641, 126.9979, '11140'),
+    'Yongsan-gu, Seoul': (37.5324, 126.99, '11170'),
+    'Seongdong-gu, Seoul': (37.5633, 127.0371, '11200'),
+    'Gwangjin-gu, Seoul': (37.5385, 127.0823, '11215'),
+    'Dongdaemun-gu, Seoul': (37.5744, 127.0396, '11230'),
+    'Jungnang-gu, Seoul': (37.6066, 127.0927, '11260'),
+    'Seongbuk-gu, Seoul': (37.5894, 127.0167, '11290'),
+    'Gangbuk-gu, Seoul': (37.6396, 127.0257, '11305'),
+    'Dobong-gu, Seoul': (37.6688, 127.0471, '11320'),
+    'Nowon-gu, Seoul': (37.6542, 127.0568, '11350'),
+    'Eunpyeong-gu, Seoul': (37.6027, 126.9291, '11380'),
+    'Seodaemun-gu, Seoul': (37.5791, 126.9368, '11410'),
+    'Mapo-gu, Seoul': (37.5663, 126.9019, '11440'),
+    'Yangcheon-gu, Seoul': (37.517, 126.8665, '11470'),
+    'Gangseo-gu, Seoul': (37.5509, 126.8495, '11500'),
+    'Guro-gu, Seoul': (37.4954, 126.8874, '11530'),
+    'Geumcheon-gu, Seoul': (37.4569, 126.8955, '11545'),
+    'Yeongdeungpo-gu, Seoul': (37.5264, 126.8962, '11560'),
+    'Dongjak-gu, Seoul': (37.5124, 126.9393, '11590'),
+    'Gwanak-gu, Seoul': (37.4784, 126.9516, '11620'),
+    'Seocho-gu, Seoul': (37.4837, 127.0324, '11650'),
+    'Gangnam-gu, Seoul': (37.5172, 127.0473, '11680'),
+    'Songpa-gu, Seoul': (37.5145, 127.1059, '11710'),
+    'Gangdong-gu, Seoul': (37.5301, 127.1238, '11740'),
+    'Jung-gu, Busan': (35.1063, 129.0323, '26110'),
+    'Seo-gu, Busan': (35.0979, 129.0242, '26140'),
+    'Dong-gu, Busan': (35.1294, 129.0454, '26170'),
+    'Yeongdo-gu, Busan': (35.0911, 129.0679, '26200'),
+    'Busanjin-gu, Busan': (35.163, 129.0532, '26230'),
+    'Dongnae-gu, Busan': (35.2049, 129.0837, '26260'),
+    'Nam-gu, Busan': (35.1366, 129.0843, '26290'),
+    'Buk-gu, Busan': (35.1972, 128.9903, '26320'),
+    'Haeundae-gu, Busan': (35.1631, 129.1635, '26350'),
+    'Saha-gu, Busan': (35.1046, 128.9749, '26380'),
+    'Geumjeong-gu, Busan': (35.2428, 129.0922, '26410'),
+    'Gangseo-gu, Busan': (35.2122, 128.9805, '26440'),
+    'Yeonje-gu, Busan': (35.1762, 129.0799, '26470'),
+    'Suyeong-gu, Busan': (35.1455, 129.1131, '26500'),
+    'Sasang-gu, Busan': (35.1527, 128.9913, '26530'),
+    'Gijang-gun, Busan': (35.2445, 129.2222, '26710'),
+    'Jung-gu, Incheon': (37.4738, 126.6216, '28110'),
+    'Dong-gu, Incheon': (37.4738, 126.6432, '28140'),
+    'Michuhol-gu, Incheon': (37.4635, 126.6505, '28177'),
+    'Yeonsu-gu, Incheon': (37.4101, 126.6783, '28185'),
+    'Namdong-gu, Incheon': (37.447, 126.7314, '28200'),
+    'Bupyeong-gu, Incheon': (37.507, 126.7219, '28237'),
+    'Gyeyang-gu, Incheon': (37.5372, 126.7376, '28245'),
+    'Seo-gu, Incheon': (37.5456, 126.676, '28260'),
+    'Ganghwa-gun, Incheon': (37.7466, 126.488, '28710'),
+    'Ongjin-gun, Incheon': (37.4466, 126.637, '28720'),
+    'Yeoksam-dong, Gangnam-gu, Seoul': (37.5006, 127.0364, '11680'),
+    'Samsung-dong, Gangnam-gu, Seoul': (37.5088, 127.0631, '11680'),
+    'Nonhyeon-dong, Gangnam-gu, Seoul': (37.5111, 127.0286, '11680'),
+    'Apgujeong-dong, Gangnam-gu, Seoul': (37.5271, 127.0286, '11680'),
+    'Cheongdam-dong, Gangnam-gu, Seoul': (37.525, 127.049, '11680'),
+    'Sinsa-dong, Gangnam-gu, Seoul': (37.5163, 127.0203, '11680'),
+    'Dogok-dong, Gangnam-gu, Seoul': (37.488, 127.0475, '11680'),
+    'Gaepo-dong, Gangnam-gu, Seoul': (37.482, 127.056, '11680'),
+    'Seocho-dong, Seocho-gu, Seoul': (37.4889, 127.015, '11650'),
+    'Bangbae-dong, Seocho-gu, Seoul': (37.4813, 126.9975, '11650'),
+    'Banpo-dong, Seocho-gu, Seoul': (37.505, 127.003, '11650'),
+    'Jamwon-dong, Seocho-gu, Seoul': (37.513, 127.012, '11650'),
+    'Yangjae-dong, Seocho-gu, Seoul': (37.4685, 127.039, '11650'),
+    'Umyeon-dong, Seocho-gu, Seoul': (37.466, 127.021, '11650'),
+    'Jamsil-dong, Songpa-gu, Seoul': (37.5133, 127.1, '11710'),
+    'Sincheon-dong, Songpa-gu, Seoul': (37.518, 127.105, '11710'),
+    'Seokchon-dong, Songpa-gu, Seoul': (37.505, 127.102, '11710'),
+    'Songpa-dong, Songpa-gu, Seoul': (37.505, 127.112, '11710'),
+    'Garak-dong, Songpa-gu, Seoul': (37.497, 127.118, '11710'),
+    'Munjeong-dong, Songpa-gu, Seoul': (37.485, 127.122, '11710'),
+    'Cheonho-dong, Gangdong-gu, Seoul': (37.545, 127.137, '11740'),
+    'Gangil-dong, Gangdong-gu, Seoul': (37.566, 127.175, '11740'),
+    'Dunchon-dong, Gangdong-gu, Seoul': (37.527, 127.138, '11740'),
+    'Hongdae, Mapo-gu, Seoul': (37.5563, 126.9236, '11440'),
+    'Sangsu-dong, Mapo-gu, Seoul': (37.5477, 126.9227, '11440'),
+    'Hapjeong-dong, Mapo-gu, Seoul': (37.5496, 126.9139, '11440'),
+    'Mangwon-dong, Mapo-gu, Seoul': (37.556, 126.904, '11440'),
+    'Yeonnam-dong, Mapo-gu, Seoul': (37.566, 126.925, '11440'),
+    'Seongsan-dong, Mapo-gu, Seoul': (37.566, 126.91, '11440'),
+    'Itaewon, Yongsan-gu, Seoul': (37.5345, 126.9946, '11170'),
+    'Hannam-dong, Yongsan-gu, Seoul': (37.534, 127.0026, '11170'),
+    'Yongsan-dong, Yongsan-gu, Seoul': (37.54, 126.987, '11170'),
+    'Seobinggo-dong, Yongsan-gu, Seoul': (37.52, 126.993, '11170'),
+    'Jongno, Jongno-gu, Seoul': (37.5704, 126.992, '11110'),
+    'Insadong, Jongno-gu, Seoul': (37.574, 126.985, '11110'),
+    'Samcheong-dong, Jongno-gu, Seoul': (37.585, 126.982, '11110'),
+    'Bukchon, Jongno-gu, Seoul': (37.5826, 126.983, '11110'),
+    'Myeongdong, Jung-gu, Seoul': (37.5636, 126.9826, '11140'),
+    'Seongsu-dong, Seongdong-gu, Seoul': (37.5446, 127.0559, '11200'),
+    'Wangsimni, Seongdong-gu, Seoul': (37.5613, 127.0374, '11200'),
+    'Konkuk University, Gwangjin-gu, Seoul': (37.5404, 127.0692, '11215'),
+    'Jayang-dong, Gwangjin-gu, Seoul': (37.535, 127.082, '11215'),
+}
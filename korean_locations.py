@@ -2,6 +2,12 @@
 한국 지역 데이터베이스
 한글 지역명과 영문 지역명을 매핑하고, 구/동 단위 검색을 지원합니다.
 """
+import re
+import threading
+from collections import defaultdict
+
+from location_index import LocationIndex, KOREAN, ENGLISH
+from korean_location_coords import LOCATION_COORDS
 
 # 서울특별시 구별 데이터
 SEOUL_DISTRICTS = {
@@ -114,7 +120,7 @@ KOREA_REGIONS = {
     "광명": "Gwangmyeong",
     "김포": "Gimpo",
     "군포": "Gunpo",
-    "광주": "Gwangju-si",
+    "광주시": "Gwangju-si",  # 경기도 광주 (광주광역시와 구분)
     "이천": "Icheon",
     "양주": "Yangju",
     "오산": "Osan",
@@ -260,37 +266,250 @@ SEOUL_DONG_AREAS = {
     "자양동": "Jayang-dong, Gwangjin-gu, Seoul",
 }
 
+# 모든 지역 데이터 테이블 (합칠 때 뒤의 테이블이 우선)
+LOCATION_TABLES = (
+    KOREA_REGIONS,
+    SEOUL_DISTRICTS,
+    BUSAN_DISTRICTS,
+    INCHEON_DISTRICTS,
+    SEOUL_DONG_AREAS,
+)
+
 def get_all_korean_locations():
     """모든 한국 지역 데이터를 합친 딕셔너리를 반환합니다."""
     all_locations = {}
-    all_locations.update(KOREA_REGIONS)
-    all_locations.update(SEOUL_DISTRICTS)
-    all_locations.update(BUSAN_DISTRICTS)
-    all_locations.update(INCHEON_DISTRICTS)
-    all_locations.update(SEOUL_DONG_AREAS)
+    for table in LOCATION_TABLES:
+        all_locations.update(table)
     return all_locations
 
+def get_location_coords(english_name):
+    """
+    영문 지역명의 미리 계산된 좌표를 반환합니다.
+    
+    Returns:
+        tuple: (위도, 경도, 행정표준코드). 좌표 테이블에 없으면 None
+    """
+    return LOCATION_COORDS.get(english_name)
+
+# 광역시/도가 아닌 지역이 속한 도 (행정표준코드 앞 2자리 -> 한글명, 영문명, 별칭)
+PROVINCES = {
+    "41": ("경기도", "Gyeonggi-do", ["경기"]),
+    "43": ("충청북도", "Chungcheongbuk-do", ["충북"]),
+    "44": ("충청남도", "Chungcheongnam-do", ["충남"]),
+    "46": ("전라남도", "Jeollanam-do", ["전남"]),
+    "47": ("경상북도", "Gyeongsangbuk-do", ["경북"]),
+    "48": ("경상남도", "Gyeongsangnam-do", ["경남"]),
+    "50": ("제주특별자치도", "Jeju-do", ["제주도"]),
+    "51": ("강원특별자치도", "Gangwon-do", ["강원도", "강원"]),
+    "52": ("전북특별자치도", "Jeollabuk-do", ["전라북도", "전북"]),
+}
+
+# 계층 단계 (앞쪽일수록 상위 지역)
+LEVELS = ("province", "city", "district", "dong")
+
+
+class KoreanLocation:
+    """
+    계층형 지역 정보입니다. (광역시/도 -> 시 -> 구 -> 동)
+    같은 영문 지역명을 가리키는 한글 이름들('서울', '서울특별시')은 하나의 지역의 별칭으로 묶입니다.
+    """
+
+    def __init__(self, korean_name, english_name, level, parent=None, coords=None):
+        self.korean_name = korean_name
+        self.english_name = english_name
+        self.level = level
+        self.parent = parent
+        self.aliases = [korean_name]
+        self.lat, self.lon, self.admin_code = coords or (None, None, None)
+
+    @property
+    def ancestors(self):
+        """상위 지역 목록 (가까운 순)"""
+        node = self.parent
+        while node is not None:
+            yield node
+            node = node.parent
+
+    @property
+    def full_name(self):
+        """상위 지역을 포함한 한글 이름 (예: '부산 중구', '경기 광주시')"""
+        names = [node.aliases[-1] if node.english_name in _PROVINCE_NAMES else node.korean_name
+                 for node in self.ancestors]
+        return ' '.join(list(reversed(names)) + [self.korean_name])
+
+    def names(self):
+        """검색에 쓰이는 모든 이름 (한글 별칭 + 영문명)"""
+        return self.aliases + [self.english_name]
+
+    def is_within(self, token):
+        """상위 지역 중 이름이 token으로 시작하는 지역이 있는지 확인합니다."""
+        return any(
+            LocationIndex.normalize(name).startswith(token)
+            for node in self.ancestors for name in node.names()
+        )
+
+    def __repr__(self):
+        return f"KoreanLocation({self.full_name!r}, {self.english_name!r})"
+
+
+_PROVINCE_NAMES = {english for _, english, _ in PROVINCES.values()}
+
+
+class KoreanLocationStore:
+    """
+    계층형 지역 저장소입니다.
+    한글 이름 하나가 여러 지역을 가리킬 수 있으며('중구' -> 서울/부산/인천),
+    모호한 검색어는 모든 후보를 순위대로 반환합니다.
+    """
+
+    def __init__(self, tables=LOCATION_TABLES, coords=LOCATION_COORDS):
+        self.locations = {}              # 영문 지역명 -> KoreanLocation
+        self.names = defaultdict(list)   # 정규화된 이름(한글 별칭/영문명) -> [KoreanLocation]
+        self.index = LocationIndex()     # 부분/초성 검색용 인덱스 (별칭, 영문 지역명)
+        self._coords = coords
+
+        for code, (korean_name, english_name, aliases) in PROVINCES.items():
+            province = KoreanLocation(korean_name, english_name, "province")
+            province.aliases.extend(aliases)
+            self.locations[english_name] = province
+
+        for table in tables:
+            for korean_name, english_name in table.items():
+                self._add(korean_name, english_name)
+
+        for location in self.locations.values():
+            # 도 단위 지역은 하위 지역 검색 문맥('경기 광주시')으로만 사용
+            if location.english_name in _PROVINCE_NAMES:
+                continue
+            for name in location.names():
+                self.names[LocationIndex.normalize(name)].append(location)
+            for alias in location.aliases:
+                self.index.add(alias, location.english_name)
+
+    def _add(self, korean_name, english_name):
+        location = self.locations.get(english_name)
+        if location is not None:
+            if korean_name not in location.aliases:
+                location.aliases.append(korean_name)
+            return location
+
+        coords = self._coords.get(english_name)
+        parts = [part.strip() for part in english_name.split(',')]
+        if len(parts) > 1:
+            # 'Yeoksam-dong, Gangnam-gu, Seoul' -> 상위 지역 'Gangnam-gu, Seoul'
+            level = "dong" if len(parts) > 2 else "district"
+            parent = self.locations.get(', '.join(parts[1:]))
+        elif coords and coords[2][:2] in PROVINCES:
+            level = "city"
+            parent = self.locations[PROVINCES[coords[2][:2]][1]]
+        else:
+            level, parent = "province", None
+
+        location = KoreanLocation(korean_name, english_name, level, parent, coords)
+        if level == "city":
+            # '수원' <-> '수원시' 처럼 '시'를 붙이거나 뗀 이름도 별칭으로 등록
+            if korean_name.endswith("시") and len(korean_name) > 2:
+                location.aliases.append(korean_name[:-1])
+            else:
+                location.aliases.append(korean_name + "시")
+        self.locations[english_name] = location
+        return location
+
+    @staticmethod
+    def _rank(location):
+        return (LEVELS.index(location.level), location.admin_code or "")
+
+    def _lookup(self, name, partial_english=True):
+        """이름 하나에 대한 후보 지역을 순위대로 반환합니다."""
+        exact = self.names.get(name)
+        if exact:
+            return sorted(exact, key=self._rank)
+
+        fields = (KOREAN, ENGLISH) if partial_english else (KOREAN,)
+        results = []
+        for _, english_name in self.index.search(name, fields=fields):
+            location = self.locations[english_name]
+            if location not in results:
+                results.append(location)
+        return results
+
+    def find(self, query, limit=None, partial_english=True):
+        """
+        검색어에 해당하는 지역 후보를 순위대로 반환합니다.
+
+        - 이름이 정확히 일치하면 그 후보들만 반환합니다. (상위 단계, 행정코드 순)
+        - '부산 중구', 'Jung-gu, Busan'처럼 상위 지역을 함께 쓰면 그 안의 지역으로 좁힙니다.
+        - 그 외에는 접두사/부분/초성 검색 결과를 반환합니다.
+
+        Args:
+            query: 검색어
+            limit: 최대 결과 수 (None이면 전체)
+            partial_english: 영문명도 접두사/부분 검색할지 여부 (False면 영문은 정확히 일치만)
+
+        Returns:
+            list: KoreanLocation 목록
+        """
+        key = LocationIndex.normalize(query)
+        if not key:
+            return []
+
+        results = self.names.get(key)
+        if results:
+            results = sorted(results, key=self._rank)
+        else:
+            results = []
+            tokens = [token for token in re.split(r"[\s,]+", key) if token]
+            if len(tokens) > 1:
+                # 한글 순서('부산 중구')와 영문 순서('jung-gu busan')를 모두 시도
+                for name, context in ((tokens[-1], tokens[:-1]), (tokens[0], tokens[1:])):
+                    results = [
+                        location for location in self._lookup(name, partial_english)
+                        if all(location.is_within(token) for token in context)
+                    ]
+                    if results:
+                        break
+            if not results:
+                results = self._lookup(key, partial_english)
+
+        return results[:limit] if limit is not None else results
+
+
+_location_store = None
+_location_store_lock = threading.Lock()
+
+def get_location_store():
+    """
+    계층형 지역 저장소를 반환합니다.
+    처음 호출될 때 한 번만 만들고 이후에는 공유합니다.
+    """
+    global _location_store
+    if _location_store is None:
+        with _location_store_lock:
+            if _location_store is None:
+                _location_store = KoreanLocationStore()
+    return _location_store
+
+def get_location_index():
+    """한국 지역 검색 인덱스를 반환합니다."""
+    return get_location_store().index
+
+def find_korean_locations(query, limit=None):
+    """
+    검색어에 해당하는 한국 지역 후보(KoreanLocation)를 순위대로 반환합니다.
+    '중구'처럼 여러 도시에 있는 이름은 모든 후보를 반환합니다.
+    """
+    return get_location_store().find(query, limit=limit)
+
 def search_korean_location(query):
     """
     한글 검색어로 영문 지역명을 찾습니다.
     부분 검색을 지원합니다.
     """
-    all_locations = get_all_korean_locations()
-    
-    # 정확한 매치 우선
-    if query in all_locations:
-        return all_locations[query]
-    
-    # 부분 매치 검색
-    matches = []
-    for korean_name, english_name in all_locations.items():
-        if query in korean_name:
-            matches.append((korean_name, english_name))
-    
-    # 가장 짧은 매치를 우선으로 반환 (더 정확한 매치)
+    # 정확한 매치 우선, 그 다음 접두사/부분 매치 중 가장 짧은 이름 (더 정확한 매치)
+    # 영문 검색어는 정확히 일치하는 경우만 사용 (해외 도시명 오변환 방지)
+    matches = get_location_store().find(query, limit=1, partial_english=False)
     if matches:
-        matches.sort(key=lambda x: len(x[0]))
-        return matches[0][1]
+        return matches[0].english_name
     
     return None
 
@@ -0,0 +1,167 @@
+"""
+지역명 검색 인덱스 모듈
+접두사 트라이와 문자 n-gram 역색인으로 한글/영문 지역명 부분 검색을 빠르게 처리합니다.
+초성('ㄱㄴㄱ')과 입력 중인 글자('강ㄴ') 검색도 지원합니다.
+"""
+from collections import defaultdict
+
+import hangul
+
+# 검색 대상 필드
+KOREAN = 'korean'
+ENGLISH = 'english'
+CHOSEONG = 'choseong'  # 한글 지역명의 초성
+JAMO = 'jamo'          # 한글 지역명을 자모 단위로 분해한 문자열
+
+FIELDS = (KOREAN, ENGLISH, CHOSEONG, JAMO)
+
+# 트라이 노드에서 해당 접두사를 가진 항목 번호 목록을 저장하는 키
+_IDS = None
+
+
+class LocationIndex:
+    """
+    (한글 지역명, 영문 지역명) 항목들에 대한 검색 인덱스입니다.
+
+    - 접두사 트라이: 입력한 글자로 시작하는 지역을 트라이 한 경로만 따라가서 찾습니다.
+    - n-gram 역색인: 부분 문자열 검색 시 검색어의 n-gram 목록이 모두 포함된 항목만 후보로 삼습니다.
+
+    한글 지역명은 초성과 자모 분해 결과도 함께 색인하므로, 아직 음절이 완성되지 않은
+    입력('ㄱㄴㄱ', '강ㄴ')도 네트워크 요청 없이 로컬에서 찾을 수 있습니다.
+
+    결과는 정확히 일치 > 접두사 일치 > 부분 일치 순, 같은 순위에서는 짧은 이름 순으로 정렬됩니다.
+    """
+
+    def __init__(self, entries=(), ngram=2):
+        self.ngram = ngram
+        self.entries = []  # 항목 번호 -> (한글 지역명, 영문 지역명)
+        self._keys = []    # 항목 번호 -> {필드: 정규화된 검색 키}
+        self._exact = {field: defaultdict(list) for field in FIELDS}
+        self._tries = {field: {} for field in FIELDS}
+        self._grams = {field: defaultdict(set) for field in FIELDS}
+
+        for korean_name, english_name in entries:
+            self.add(korean_name, english_name)
+
+    @staticmethod
+    def normalize(text):
+        """대소문자와 공백 차이를 없앤 검색 키를 만듭니다."""
+        return ' '.join(text.split()).lower()
+
+    def add(self, korean_name, english_name):
+        """항목을 인덱스에 추가합니다."""
+        idx = len(self.entries)
+        self.entries.append((korean_name, english_name))
+        keys = {
+            KOREAN: self.normalize(korean_name),
+            ENGLISH: self.normalize(english_name),
+            CHOSEONG: hangul.choseong(korean_name),
+            JAMO: hangul.decompose(korean_name)
+        }
+        self._keys.append(keys)
+
+        for field, key in keys.items():
+            self._exact[field][key].append(idx)
+            self._insert_prefixes(self._tries[field], key, idx)
+            for gram in self._ngrams(key):
+                self._grams[field][gram].add(idx)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def _ngrams(self, key):
+        """키의 1-gram과 n-gram을 모두 반환합니다. (짧은 검색어도 역색인을 쓸 수 있도록)"""
+        grams = set(key)
+        grams.update(key[i:i + self.ngram] for i in range(len(key) - self.ngram + 1))
+        return grams
+
+    @staticmethod
+    def _insert_prefixes(trie, key, idx):
+        node = trie
+        for char in key:
+            node = node.setdefault(char, {})
+            node.setdefault(_IDS, []).append(idx)
+
+    def _prefix_ids(self, field, key):
+        """key로 시작하는 항목 번호 목록을 반환합니다."""
+        node = self._tries[field]
+        for char in key:
+            node = node.get(char)
+            if node is None:
+                return []
+        return node.get(_IDS, [])
+
+    def _substring_ids(self, field, key):
+        """key를 포함하는 항목 번호 집합을 반환합니다."""
+        grams = self._grams[field]
+        if len(key) < self.ngram:
+            return set(grams.get(key, ()))
+
+        postings = []
+        for i in range(len(key) - self.ngram + 1):
+            posting = grams.get(key[i:i + self.ngram])
+            if not posting:
+                return set()
+            postings.append(posting)
+
+        # 가장 작은 목록부터 교집합을 구한 뒤 실제 포함 여부를 확인
+        postings.sort(key=len)
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            candidates &= posting
+            if not candidates:
+                return candidates
+        return {idx for idx in candidates if key in self._keys[idx][field]}
+
+    def search(self, query, limit=None, fields=(KOREAN, ENGLISH)):
+        """
+        검색어와 일치하는 항목을 순위대로 반환합니다.
+
+        검색어에 완성되지 않은 자모가 있고 한글 필드를 검색하는 경우,
+        자음만 있으면 초성 필드를, 그렇지 않으면 자모 분해 필드를 대신 검색합니다.
+        입력 중 겹받침이 생긴 경우('역ㅅ' -> '엯')처럼 일치하는 결과가 없으면
+        자모 분해 필드로 한 번 더 검색합니다.
+
+        Args:
+            query: 검색어 (한글, 초성 또는 영문)
+            limit: 최대 결과 수 (None이면 전체)
+            fields: 검색할 필드 (KOREAN, ENGLISH)
+
+        Returns:
+            list: (한글 지역명, 영문 지역명) 튜플 목록
+        """
+        key = self.normalize(query)
+        if not key:
+            return []
+
+        if KOREAN in fields and hangul.has_jamo(key):
+            if hangul.is_choseong_query(key):
+                ordered = self._rank((CHOSEONG,), hangul.choseong(key), limit)
+            else:
+                ordered = self._rank((JAMO,), hangul.decompose(key), limit)
+        else:
+            ordered = self._rank(fields, key, limit)
+            if not ordered and KOREAN in fields and any(hangul.is_syllable(c) for c in key):
+                ordered = self._rank((JAMO,), hangul.decompose(key), limit)
+
+        return [self.entries[idx] for idx in ordered]
+
+    def _rank(self, fields, key, limit):
+        """일치하는 항목 번호를 순위대로 반환합니다."""
+        ranks = {}  # 항목 번호 -> 순위 (0: 정확히 일치, 1: 접두사, 2: 부분 일치)
+        for field in fields:
+            for idx in self._exact[field].get(key, ()):
+                ranks[idx] = 0
+            for idx in self._prefix_ids(field, key):
+                ranks.setdefault(idx, 1)
+
+        # 접두사 일치만으로 결과가 충분하면 부분 문자열 검색은 생략
+        if limit is None or len(ranks) < limit:
+            for field in fields:
+                for idx in self._substring_ids(field, key):
+                    ranks.setdefault(idx, 2)
+
+        ordered = sorted(ranks, key=lambda idx: (ranks[idx], len(self.entries[idx][0]), idx))
+        if limit is not None:
+            ordered = ordered[:limit]
+        return ordered
@@ -0,0 +1,304 @@
+"""
+성능 측정(트레이싱/메트릭) 모듈
+단계별 소요 시간(span), 캐시 적중/실패, 외부 API 응답 코드를 기록하고
+Prometheus 텍스트 형식이나 JSON lines로 내보냅니다.
+
+    with span('geocode') as attrs:      # 소요 시간을 'stage_seconds' 히스토그램과 현재 트레이스에 기록
+        attrs['source'] = 'cache'       # 트레이스에만 남는 부가 정보
+    inc('cache_requests_total', cache='geocode', result='hit')
+    geocode_hit = bind('cache_requests_total', cache='geocode', result='hit')  # 자주 지나는 경로용
+    geocode_hit()
+
+    trace = start_trace('rerun')         # 이 컨텍스트에서 생기는 span을 모음
+    ...
+    trace.finish()
+    trace.breakdown()                    # 단계별 합계 (ms)
+
+스레드 풀에서 실행하는 작업도 같은 트레이스에 기록되도록 submit_in_context()로 제출합니다.
+"""
+import contextvars
+import json
+import threading
+import time
+import uuid
+import weakref
+from contextlib import contextmanager
+
+# 히스토그램 구간 (초)
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+# 현재 트레이스와 span 깊이 (스레드/재실행마다 따로 유지)
+_current_trace = contextvars.ContextVar('weather_trace', default=None)
+_current_depth = contextvars.ContextVar('weather_span_depth', default=0)
+
+
+def _label_key(labels):
+    return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+
+def _format_labels(label_key, extra=()):
+    pairs = list(label_key) + list(extra)
+    if not pairs:
+        return ''
+    escaped = [(key, value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n'))
+               for key, value in pairs]
+    body = ','.join(f'{key}="{value}"' for key, value in escaped)
+    return '{' + body + '}'
+
+
+class Metrics:
+    """
+    스레드 안전 메트릭 저장소입니다. (카운터, 히스토그램, 게이지)
+    레이블에는 지역명처럼 값이 많은 항목 대신 단계, 엔드포인트, 상태 코드처럼 종류가 적은 값을 사용합니다.
+    게이지(현재 값)는 add_collector()로 등록한 함수가 내보낼 때마다 계산합니다.
+    """
+
+    def __init__(self, buckets=DEFAULT_BUCKETS, prefix='weather_'):
+        self.buckets = tuple(buckets)
+        self.prefix = prefix
+        self._counters = {}    # (이름, 레이블) -> 값
+        self._histograms = {}  # (이름, 레이블) -> [구간별 개수, 합계, 개수]
+        self._collectors = []  # 게이지 수집 함수 (약한 참조)
+        self._lock = threading.Lock()
+
+    def add_collector(self, callback, **labels):
+        """
+        게이지 수집 함수를 등록합니다. callback()은 (이름, 레이블 dict, 값) 목록을 반환합니다.
+        labels는 이 함수가 내보내는 모든 게이지에 붙습니다. (예: instance, 같은 종류의 객체가 여러 개일 때 구분)
+        메서드는 약한 참조로 보관하므로 객체가 사라지면 자동으로 빠집니다.
+        """
+        ref = weakref.WeakMethod(callback) if hasattr(callback, '__self__') else (lambda: callback)
+        with self._lock:
+            self._collectors.append((ref, labels))
+
+    def _collect_gauges(self):
+        with self._lock:
+            self._collectors = [(ref, labels) for ref, labels in self._collectors if ref() is not None]
+            callbacks = [(ref(), labels) for ref, labels in self._collectors]
+        gauges = []
+        seen = set()
+        for callback, extra in callbacks:
+            if callback is None:
+                continue
+            for name, labels, value in callback():
+                labels = dict(labels, **extra)
+                # 같은 시계열이 두 번 나오면 Prometheus 형식이 잘못되므로 처음 값만 사용
+                key = (name, _label_key(labels))
+                if key in seen:
+                    continue
+                seen.add(key)
+                gauges.append({'type': 'gauge', 'name': name, 'labels': labels, 'value': value})
+        return gauges
+
+    def inc(self, name, amount=1, **labels):
+        """카운터를 증가시킵니다."""
+        key = (name, _label_key(labels))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + amount
+
+    def bind(self, name, **labels):
+        """
+        레이블을 미리 정한 카운터 증가 함수를 반환합니다.
+        캐시 적중처럼 자주 지나는 경로에서 호출마다 레이블을 정리하는 비용을 줄입니다.
+        """
+        key = (name, _label_key(labels))
+
+        def increment(amount=1):
+            with self._lock:
+                self._counters[key] = self._counters.get(key, 0) + amount
+        return increment
+
+    def observe(self, name, value, **labels):
+        """히스토그램에 값을 기록합니다."""
+        key = (name, _label_key(labels))
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = [[0] * len(self.buckets), 0.0, 0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    histogram[0][i] += 1
+            histogram[1] += value
+            histogram[2] += 1
+
+    def counter(self, name, **labels):
+        with self._lock:
+            return self._counters.get((name, _label_key(labels)), 0)
+
+    def snapshot(self):
+        """
+        현재 값을 반환합니다.
+
+        Returns:
+            list: {'type', 'name', 'labels', ...} dict 목록
+                  (카운터/게이지: 'value', 히스토그램: 'count', 'sum', 'buckets')
+        """
+        with self._lock:
+            counters = list(self._counters.items())
+            histograms = [(key, (list(counts), total, count))
+                          for key, (counts, total, count) in self._histograms.items()]
+        rows = []
+        for (name, label_key), value in sorted(counters):
+            rows.append({'type': 'counter', 'name': name, 'labels': dict(label_key), 'value': value})
+        rows.extend(self._collect_gauges())
+        for (name, label_key), (counts, total, count) in sorted(histograms):
+            rows.append({
+                'type': 'histogram',
+                'name': name,
+                'labels': dict(label_key),
+                'count': count,
+                'sum': round(total, 6),
+                'buckets': {str(bound): counts[i] for i, bound in enumerate(self.buckets)}
+            })
+        return rows
+
+    def to_json_lines(self):
+        """메트릭을 한 줄에 하나씩 JSON으로 내보냅니다."""
+        return '\n'.join(json.dumps(row, ensure_ascii=False) for row in self.snapshot())
+
+    def to_prometheus(self):
+        """메트릭을 Prometheus 텍스트 형식으로 내보냅니다."""
+        lines = []
+        declared = set()
+        for row in self.snapshot():
+            name = self.prefix + row['name']
+            label_key = _label_key(row['labels'])
+            if name not in declared:
+                declared.add(name)
+                lines.append(f"# TYPE {name} {row['type']}")
+            if row['type'] != 'histogram':
+                lines.append(f"{name}{_format_labels(label_key)} {row['value']}")
+                continue
+            for bound, count in row['buckets'].items():
+                lines.append(f"{name}_bucket{_format_labels(label_key, [('le', bound)])} {count}")
+            lines.append(f"{name}_bucket{_format_labels(label_key, [('le', '+Inf')])} {row['count']}")
+            lines.append(f"{name}_sum{_format_labels(label_key)} {row['sum']}")
+            lines.append(f"{name}_count{_format_labels(label_key)} {row['count']}")
+        return '\n'.join(lines) + '\n'
+
+    def reset(self):
+        """카운터와 히스토그램을 비웁니다. (게이지 수집 함수는 유지)"""
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+
+class Trace:
+    """한 번의 작업(예: 앱 재실행 한 번)에서 기록된 span 목록입니다."""
+
+    def __init__(self, name='trace'):
+        self.id = uuid.uuid4().hex[:16]
+        self.name = name
+        self.started = time.perf_counter()
+        self.started_at = time.time()
+        self.duration = None
+        self.spans = []
+        self._lock = threading.Lock()
+        self._token = None
+
+    def add(self, record):
+        with self._lock:
+            self.spans.append(record)
+
+    def finish(self):
+        """트레이스를 끝내고 현재 컨텍스트에서 분리합니다. (이후 span은 기록되지 않음)"""
+        if self.duration is None:
+            self.duration = time.perf_counter() - self.started
+        if self._token is not None:
+            try:
+                _current_trace.reset(self._token)
+            except ValueError:
+                _current_trace.set(None)  # 다른 컨텍스트에서 끝낸 경우
+            self._token = None
+        return self
+
+    def rows(self):
+        """span을 시작 순서대로 반환합니다. (시작/소요 시간은 ms)"""
+        with self._lock:
+            spans = list(self.spans)
+        return sorted(spans, key=lambda record: record['start_ms'])
+
+    def breakdown(self):
+        """
+        단계별 소요 시간 합계(ms)를 반환합니다. (가장 바깥 span 기준 '기타'는 span 밖에서 쓴 시간)
+        """
+        totals = {}
+        outer = 0.0
+        for record in self.rows():
+            totals[record['name']] = totals.get(record['name'], 0.0) + record['duration_ms']
+            if record['depth'] == 0:
+                outer += record['duration_ms']
+        if self.duration is not None:
+            totals['기타'] = max(self.duration * 1000 - outer, 0.0)
+        return {name: round(ms, 3) for name, ms in totals.items()}
+
+    def to_json_lines(self):
+        """span을 한 줄에 하나씩 JSON으로 내보냅니다."""
+        lines = [json.dumps(dict(record, trace_id=self.id, trace=self.name), ensure_ascii=False)
+                 for record in self.rows()]
+        return '\n'.join(lines)
+
+
+# 기본 메트릭 저장소 (프로세스 전체에서 공유)
+METRICS = Metrics()
+
+
+def inc(name, amount=1, **labels):
+    """기본 저장소의 카운터를 증가시킵니다."""
+    METRICS.inc(name, amount, **labels)
+
+
+def bind(name, **labels):
+    """기본 저장소의 레이블을 미리 정한 카운터 증가 함수를 반환합니다."""
+    return METRICS.bind(name, **labels)
+
+
+@contextmanager
+def span(name, **labels):
+    """
+    블록의 소요 시간을 'stage_seconds{stage=name, ...labels}' 히스토그램과 현재 트레이스에 기록합니다.
+    yield하는 dict에 넣은 값은 트레이스에만 남습니다. (상태 코드, 캐시 결과 등)
+    """
+    trace = _current_trace.get()
+    depth = _current_depth.get()
+    token = _current_depth.set(depth + 1)
+    attrs = {}
+    started = time.perf_counter()
+    try:
+        yield attrs
+    except BaseException as e:
+        attrs['error'] = type(e).__name__
+        raise
+    finally:
+        duration = time.perf_counter() - started
+        _current_depth.reset(token)
+        METRICS.observe('stage_seconds', duration, stage=name, **labels)
+        if trace is not None:
+            trace.add({
+                'name': name,
+                'start_ms': round((started - trace.started) * 1000, 3),
+                'duration_ms': round(duration * 1000, 3),
+                'depth': depth,
+                'labels': dict(labels, **attrs),
+                'thread': threading.current_thread().name
+            })
+
+
+def start_trace(name='trace'):
+    """현재 컨텍스트에서 새 트레이스를 시작합니다. 끝나면 trace.finish()를 호출합니다."""
+    trace = Trace(name)
+    trace._token = _current_trace.set(trace)
+    return trace
+
+
+def current_trace():
+    return _current_trace.get()
+
+
+def submit_in_context(executor, func, *args, **kwargs):
+    """
+    현재 컨텍스트(트레이스, span 깊이)를 유지한 채 스레드 풀에 작업을 제출합니다.
+    작업 안의 span도 호출한 쪽의 트레이스에 기록됩니다.
+    """
+    context = contextvars.copy_context()
+    return executor.submit(context.run, func, *args, **kwargs)
@@ -0,0 +1,116 @@
+"""
+날씨 데이터 레코드 모듈
+캐시에 오래 보관하는 날씨 데이터를 항목별 dict 대신 작은 레코드로 저장합니다.
+
+- CurrentWeather: __slots__ 데이터클래스 (인스턴스마다 dict를 만들지 않음)
+- Forecast: 컬럼별 NumPy 배열을 가진 struct-of-arrays 컨테이너 (문자열 컬럼은 범주 코드로 저장)
+"""
+from dataclasses import dataclass, fields
+
+import numpy as np
+import pandas as pd
+
+# 예보 DataFrame 컬럼 순서 (기존 예보 dict의 키 순서와 동일)
+FORECAST_COLUMNS = [
+    'datetime', 'date', 'time', 'temperature', 'feels_like', 'temp_min', 'temp_max',
+    'humidity', 'pressure', 'weather_main', 'weather_description', 'weather_icon',
+    'clouds', 'wind_speed', 'wind_direction', 'pop'
+]
+
+
+@dataclass(slots=True)
+class CurrentWeather:
+    """현재 날씨 (기존 현재 날씨 dict와 같은 필드)"""
+    city: str
+    country: str
+    temperature: int
+    feels_like: int
+    humidity: int
+    pressure: int
+    visibility: float
+    wind_speed: float
+    wind_direction: int
+    weather_main: str
+    weather_description: str
+    weather_icon: str
+    clouds: int
+    sunrise: str
+    sunset: str
+    timezone: int
+    dt: str
+
+    def to_dict(self):
+        """기존 API 형식의 dict로 변환합니다."""
+        return {field.name: getattr(self, field.name) for field in fields(self)}
+
+
+def encode_categories(values):
+    """
+    문자열 목록을 (코드 배열, 범주 튜플)로 변환합니다.
+    코드 타입은 pandas Categorical이 그대로 사용할 수 있는 가장 작은 정수 타입입니다.
+    """
+    categories = {}
+    codes = [categories.setdefault(value, len(categories)) for value in values]
+    dtype = np.int8 if len(categories) < 2 ** 7 else np.int16 if len(categories) < 2 ** 15 else np.int32
+    return np.array(codes, dtype=dtype), tuple(categories)
+
+
+@dataclass(slots=True)
+class Forecast:
+    """
+    3시간 단위 예보를 컬럼별 배열로 저장하는 컨테이너입니다.
+    예보 한 건(보통 40개 항목)이 dict 40개 대신 배열 몇 개로 저장됩니다.
+    """
+    local_time: np.ndarray           # datetime64[s], 지역 시간
+    temperature: np.ndarray          # int16
+    feels_like: np.ndarray           # int16
+    temp_min: np.ndarray             # int16
+    temp_max: np.ndarray             # int16
+    humidity: np.ndarray             # uint8
+    pressure: np.ndarray             # int16
+    clouds: np.ndarray               # uint8
+    wind_speed: np.ndarray           # float64
+    wind_direction: np.ndarray       # int16
+    pop: np.ndarray                  # float64, 강수 확률 (%)
+    weather_main: tuple              # (코드 배열, 범주 튜플)
+    weather_description: tuple
+    weather_icon: tuple
+
+    # 범주 코드로 저장된 문자열 컬럼
+    CATEGORICAL = ('weather_main', 'weather_description', 'weather_icon')
+
+    def __len__(self):
+        return len(self.local_time)
+
+    @property
+    def nbytes(self):
+        """배열과 범주 문자열이 차지하는 대략적인 메모리 크기 (바이트)"""
+        total = 0
+        for field in fields(self):
+            value = getattr(self, field.name)
+            if field.name in self.CATEGORICAL:
+                codes, categories = value
+                total += codes.nbytes + sum(len(category.encode()) for category in categories)
+            else:
+                total += value.nbytes
+        return total
+
+    def to_frame(self):
+        """
+        예보 DataFrame을 만듭니다.
+        문자열 컬럼은 범주형(Categorical)입니다.
+        배열은 복사해서 사용합니다. (copy-on-write가 없는 pandas에서 DataFrame을 고쳐도 캐시된 레코드는 그대로 유지)
+        """
+        labels = pd.Series(np.datetime_as_string(self.local_time, unit='m'))  # 'YYYY-MM-DDTHH:MM'
+        columns = {
+            'datetime': self.local_time,
+            'date': labels.str.slice(0, 10),
+            'time': labels.str.slice(11, 16)
+        }
+        for name in FORECAST_COLUMNS[3:]:
+            value = getattr(self, name)
+            if name in self.CATEGORICAL:
+                codes, categories = value
+                value = pd.Categorical.from_codes(codes, categories=categories)
+            columns[name] = value
+        return pd.DataFrame(columns, copy=True)
@@ -0,0 +1,152 @@
+"""
+인기 지역 미리 갱신 모듈
+자주 조회되는 지역의 날씨 응답을 캐시가 만료되기 전에 백그라운드에서 다시 받아 둡니다.
+사용자가 인기 지역을 선택하면 항상 유효한 캐시에서 바로 응답합니다. (refresh-ahead)
+"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from metrics import submit_in_context
+from rate_limit import BACKGROUND, QuotaTracker, RateLimitExceeded, priority
+
+
+class Prefetcher:
+    """
+    WeatherAPI의 응답 캐시를 주기적으로 확인하고 만료가 가까운 인기 지역을 미리 갱신하는 스레드입니다.
+
+    - interval: 캐시 확인 주기 (초)
+    - refresh_ahead: 남은 유효 시간이 이 값 이하인 응답을 갱신 (interval보다 커야 만료 전에 갱신됨)
+    - max_calls_per_day: 하루(UTC)에 보낼 최대 갱신 요청 수 (None이면 제한 없음)
+      사용자가 없어도 갱신은 계속되므로 일일 한도가 있는 API(One Call 등)를 다 쓰지 않도록 제한합니다.
+
+    갱신은 엔진의 refresh()를 사용하므로 같은 지역의 사용자 요청과 동시에 일어나도 요청은 한 번입니다.
+    요청은 background 우선순위라 호출 한도가 부족하면 화면 조회에 양보하고 다음 주기에 다시 시도합니다.
+    """
+
+    def __init__(self, api, locations, interval=60, refresh_ahead=90, max_workers=4,
+                 max_calls_per_day=None):
+        self.api = api
+        self.locations = list(dict.fromkeys(locations))  # 순서를 유지하며 중복 제거
+        self.interval = interval
+        self.refresh_ahead = refresh_ahead
+        self.max_workers = max_workers
+        self.calls = QuotaTracker(per_day=max_calls_per_day)  # 보낸 갱신 요청 수
+        self._coordinates = {}  # 지역명 -> (lat, lon), 한 번 찾은 좌표는 다시 찾지 않음
+        self._stop = threading.Event()
+        self._thread = None
+        self._lock = threading.Lock()
+        self.refreshed = 0
+        self.errors = 0
+        self.skipped = 0
+        self.last_run = None
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        """백그라운드 스레드를 시작합니다. 이미 실행 중이면 아무것도 하지 않습니다."""
+        with self._lock:
+            if self.running:
+                return self
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="weather-prefetch", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self, timeout=None):
+        """스레드를 멈춥니다. 진행 중인 갱신이 끝날 때까지 최대 timeout초 기다립니다."""
+        self._stop.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+
+    def _run(self):
+        # 시작하자마자 한 번 채우고, 이후 interval마다 확인
+        while not self._stop.is_set():
+            self.run_once()
+            if self._stop.wait(self.interval):
+                break
+
+    def due(self):
+        """
+        지금 갱신해야 하는 (API, lat, lon) 목록을 반환합니다.
+        좌표가 같은 지역(예: '부산'과 'Busan')은 한 번만 포함합니다.
+        """
+        engine = self.api.engine
+        targets = {}
+        for location in self.locations:
+            coordinates = self._get_coordinates(location)
+            if coordinates is None:
+                continue
+            lat, lon = coordinates
+            for source in engine.sources():
+                key = engine.cache.make_key(source, lat, lon, engine.units, engine.lang)
+                if key not in targets and engine.remaining(source, lat, lon) <= self.refresh_ahead:
+                    targets[key] = (source, lat, lon)
+        return list(targets.values())
+
+    def run_once(self):
+        """
+        만료가 가까운 응답을 모두 갱신합니다.
+
+        Returns:
+            int: 갱신한 응답 수
+        """
+        with priority(BACKGROUND):
+            targets = self.due()
+            refreshed = 0
+            # 일일 한도가 남은 만큼만 갱신 (지역 목록 앞쪽이 우선, 나머지는 사용자가 조회할 때 요청)
+            usage = self.calls.usage()
+            if usage['day_limit'] is not None:
+                allowed = max(usage['day_limit'] - usage['day'], 0)
+                self.skipped += max(len(targets) - allowed, 0)
+                targets = targets[:allowed]
+            if targets:
+                with ThreadPoolExecutor(max_workers=self.max_workers,
+                                        thread_name_prefix="weather-prefetch") as executor:
+                    futures = [submit_in_context(executor, self.api.engine.refresh, *target)
+                               for target in targets]
+                    wait(futures)
+                for future in futures:
+                    error = future.exception()
+                    if error is None:
+                        refreshed += 1
+                        self.calls.record()
+                    elif isinstance(error, RateLimitExceeded):
+                        self.skipped += 1  # 호출 한도를 화면 조회에 양보 (다음 주기에 다시 시도)
+                    else:
+                        self.errors += 1
+                        self.calls.record()
+                        print(f"날씨 미리 갱신 중 오류 발생: {error}")
+        self.refreshed += refreshed
+        self.last_run = time.time()
+        return refreshed
+
+    def _get_coordinates(self, location):
+        coordinates = self._coordinates.get(location)
+        if coordinates is not None:
+            return coordinates
+        try:
+            result = self.api._resolve_coordinates(location)
+        except Exception as e:
+            # 다음 주기에 다시 시도
+            print(f"미리 갱신할 지역 좌표 조회 중 오류 발생: {e}")
+            return None
+        if result is None:
+            return None
+        coordinates = self._coordinates[location] = result[:2]
+        return coordinates
+
+    def stats(self):
+        """갱신 통계를 반환합니다."""
+        return {
+            'running': self.running,
+            'locations': len(self.locations),
+            'refreshed': self.refreshed,
+            'errors': self.errors,
+            'skipped': self.skipped,
+            'calls_today': self.calls.usage()['day'],
+            'last_run': self.last_run
+        }
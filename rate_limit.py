@@ -0,0 +1,307 @@
+"""
+요청 속도 제한 모듈
+토큰 버킷으로 호스트별 초당 요청 수를 제한하고, API 키의 분/일 호출 한도와 엔드포인트별 한도를 관리합니다.
+
+요청마다 우선순위가 있어 화면 조회(interactive)가 자동완성(autocomplete)과 백그라운드 갱신(background)보다 먼저입니다.
+낮은 우선순위 요청은 토큰 일부를 남겨 두어야만 보낼 수 있고, 오래 기다려야 하면 보내지 않고
+RateLimitExceeded를 발생시킵니다. (호출한 쪽은 캐시된 데이터를 대신 사용)
+
+    with priority(BACKGROUND):
+        api.engine.refresh(...)   # 이 블록의 요청은 background 우선순위
+"""
+import contextvars
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+
+import requests
+
+from metrics import METRICS, inc
+
+# 요청 우선순위 (앞쪽이 높음)
+INTERACTIVE = 'interactive'    # 화면 조회 (날씨, 좌표)
+AUTOCOMPLETE = 'autocomplete'  # 자동완성 검색
+BACKGROUND = 'background'      # 미리 갱신 등 백그라운드 작업
+PRIORITIES = (INTERACTIVE, AUTOCOMPLETE, BACKGROUND)
+
+# 우선순위별 기본값
+# - reserve: 요청 후에도 남아 있어야 하는 토큰 비율 (높은 우선순위 요청 몫)
+# - max_wait: 토큰을 기다리는 최대 시간 (초), 넘으면 요청하지 않음
+DEFAULT_RESERVES = {INTERACTIVE: 0, AUTOCOMPLETE: 0.25, BACKGROUND: 0.5}
+DEFAULT_MAX_WAITS = {INTERACTIVE: 5, AUTOCOMPLETE: 0.3, BACKGROUND: 10}
+
+_current_priority = contextvars.ContextVar('request_priority', default=INTERACTIVE)
+
+
+@contextmanager
+def priority(level):
+    """블록 안에서 보내는 요청의 우선순위를 정합니다. (스레드 풀 작업은 metrics.submit_in_context로 전달)"""
+    if level not in PRIORITIES:
+        raise ValueError(f"알 수 없는 우선순위: {level}")
+    token = _current_priority.set(level)
+    try:
+        yield
+    finally:
+        _current_priority.reset(token)
+
+
+def current_priority():
+    return _current_priority.get()
+
+
+class RateLimitExceeded(requests.ConnectionError):
+    """호출 한도 때문에 요청을 보내지 않은 경우 (requests 예외와 같은 방식으로 처리됨)"""
+
+    def __init__(self, host, endpoint, level, reason):
+        super().__init__(f"{host}{endpoint or ''} 요청 생략 ({level}, {reason})")
+        self.host = host
+        self.endpoint = endpoint
+        self.priority = level
+        self.reason = reason
+
+
+class TokenBucket:
+    """
+    스레드 안전 토큰 버킷입니다.
+    초당 rate개의 토큰이 채워지고, 최대 capacity개까지 모아 두었다가 한 번에 쓸 수 있습니다.
+    """
+
+    def __init__(self, rate, capacity=None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1)
+        self.tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self.acquired = 0
+        self.waited = 0.0  # 토큰을 기다린 총 시간 (초)
+
+    def _refill(self, now):
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def try_acquire(self, tokens=1, reserve=0):
+        """
+        토큰을 바로 가져올 수 있으면 가져오고 0을 반환합니다.
+        부족하면 가져오지 않고, 토큰이 채워질 때까지 기다려야 하는 시간(초)을 반환합니다.
+        reserve를 지정하면 가져간 뒤에도 reserve개 이상 남는 경우에만 가져옵니다.
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            if self.tokens - tokens >= reserve:
+                self.tokens -= tokens
+                self.acquired += 1
+                return 0
+            return (tokens + reserve - self.tokens) / self.rate
+
+    def refund(self, tokens=1):
+        """가져간 토큰을 돌려놓습니다. (여러 버킷 중 일부만 가져온 경우)"""
+        with self._lock:
+            self.tokens = min(self.capacity, self.tokens + tokens)
+            self.acquired -= 1
+
+    def acquire(self, tokens=1, timeout=None):
+        """
+        토큰을 가져올 때까지 기다립니다.
+        timeout(초) 안에 가져오지 못하면 False를 반환합니다.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        started = time.monotonic()
+        while True:
+            wait = self.try_acquire(tokens)
+            if wait == 0:
+                break
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                wait = min(wait, remaining)
+            time.sleep(wait)
+
+        waited = time.monotonic() - started
+        if waited > 0:
+            with self._lock:
+                self.waited += waited
+        return True
+
+    def stats(self):
+        with self._lock:
+            self._refill(time.monotonic())
+            return {
+                'rate': self.rate,
+                'capacity': self.capacity,
+                'tokens': round(self.tokens, 2),
+                'acquired': self.acquired,
+                'waited': round(self.waited, 3)
+            }
+
+
+class QuotaTracker:
+    """API 키의 분/일 호출 수를 셉니다. (분은 매분 0초, 일은 UTC 자정에 초기화)"""
+
+    def __init__(self, per_minute=None, per_day=None):
+        self.per_minute = per_minute
+        self.per_day = per_day
+        self._minute = None
+        self._day = None
+        self.minute_count = 0
+        self.day_count = 0
+        self._lock = threading.Lock()
+
+    def _roll(self, now):
+        minute = int(now // 60)
+        day = int(now // 86400)
+        if minute != self._minute:
+            self._minute, self.minute_count = minute, 0
+        if day != self._day:
+            self._day, self.day_count = day, 0
+
+    def day_exhausted(self):
+        with self._lock:
+            self._roll(time.time())
+            return self.per_day is not None and self.day_count >= self.per_day
+
+    def record(self):
+        with self._lock:
+            self._roll(time.time())
+            self.minute_count += 1
+            self.day_count += 1
+
+    def usage(self):
+        with self._lock:
+            self._roll(time.time())
+            return {
+                'minute': self.minute_count,
+                'minute_limit': self.per_minute,
+                'day': self.day_count,
+                'day_limit': self.per_day
+            }
+
+
+class HostRateLimiter:
+    """
+    호스트마다 별도의 토큰 버킷을 두어 요청 속도를 제한합니다.
+    같은 호스트로 가는 요청은 스레드와 관계없이 하나의 한도를 공유합니다.
+
+    - quota_per_minute/quota_per_day: API 키 전체의 분/일 호출 한도 (None이면 제한 없음)
+    - endpoint_quotas: {엔드포인트 경로: 분당 최대 호출 수} (예: 자동완성이 지오코딩 한도를 다 쓰지 않도록)
+    - reserves/max_waits: 우선순위별 남길 토큰 비율과 최대 대기 시간 (DEFAULT_RESERVES, DEFAULT_MAX_WAITS)
+    """
+
+    def __init__(self, rate=10, burst=None, quota_per_minute=None, quota_per_day=None,
+                 endpoint_quotas=None, reserves=None, max_waits=None):
+        self.rate = rate
+        self.burst = burst
+        self.endpoint_quotas = dict(endpoint_quotas or {})
+        self.reserves = dict(DEFAULT_RESERVES, **(reserves or {}))
+        self.max_waits = dict(DEFAULT_MAX_WAITS, **(max_waits or {}))
+        self.quota = QuotaTracker(quota_per_minute, quota_per_day)
+        # 분당 한도는 1분에 걸쳐 채워지는 버킷으로 적용 (한 번에 최대 quota_per_minute개)
+        self._minute_bucket = (TokenBucket(quota_per_minute / 60, quota_per_minute)
+                               if quota_per_minute else None)
+        self._buckets = {}
+        self._endpoint_buckets = {}
+        self._lock = threading.Lock()
+        self.allowed = Counter()  # 우선순위별 보낸 요청 수
+        self.shed = Counter()     # 우선순위별 생략한 요청 수
+
+    def bucket(self, host):
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = self._buckets[host] = TokenBucket(self.rate, self.burst)
+            return bucket
+
+    def endpoint_bucket(self, endpoint):
+        quota = self.endpoint_quotas.get(endpoint)
+        if not quota:
+            return None
+        with self._lock:
+            bucket = self._endpoint_buckets.get(endpoint)
+            if bucket is None:
+                bucket = self._endpoint_buckets[endpoint] = TokenBucket(quota / 60, quota)
+            return bucket
+
+    def acquire(self, host, endpoint=None, level=None, timeout=None):
+        """
+        호스트, API 키, 엔드포인트 한도에 모두 여유가 생길 때까지 기다린 뒤 True를 반환합니다.
+        우선순위(level, 기본: 현재 컨텍스트의 우선순위)의 최대 대기 시간 안에 보낼 수 없으면
+        기다리지 않고 RateLimitExceeded를 발생시킵니다.
+        """
+        level = level or current_priority()
+        if timeout is None:
+            timeout = self.max_waits.get(level)
+        if self.quota.day_exhausted():
+            self._shed(host, endpoint, level, "일일 호출 한도 초과")
+
+        reserve = self.reserves.get(level, 0)
+        buckets = [bucket for bucket in (self.bucket(host), self._minute_bucket, self.endpoint_bucket(endpoint))
+                   if bucket is not None]
+        started = time.monotonic()
+        deadline = None if timeout is None else started + timeout
+        while True:
+            wait = self._try_acquire_all(buckets, reserve)
+            if wait == 0:
+                break
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if wait > remaining:
+                    # 기다려도 시간 안에 보낼 수 없으면 바로 포기
+                    self._shed(host, endpoint, level, f"{wait:.1f}초 대기 필요")
+            time.sleep(wait)
+
+        self.quota.record()
+        with self._lock:
+            self.allowed[level] += 1
+        inc('ratelimit_requests_total', priority=level, result='allowed')
+        METRICS.observe('ratelimit_wait_seconds', time.monotonic() - started, priority=level)
+        return True
+
+    @staticmethod
+    def _try_acquire_all(buckets, reserve):
+        """모든 버킷에서 토큰을 하나씩 가져옵니다. 하나라도 부족하면 가져온 토큰을 돌려놓고 대기 시간을 반환합니다."""
+        taken = []
+        for bucket in buckets:
+            wait = bucket.try_acquire(reserve=reserve * bucket.capacity)
+            if wait:
+                for other in taken:
+                    other.refund()
+                return wait
+            taken.append(bucket)
+        return 0
+
+    def _shed(self, host, endpoint, level, reason):
+        with self._lock:
+            self.shed[level] += 1
+        inc('ratelimit_requests_total', priority=level, result='shed')
+        raise RateLimitExceeded(host, endpoint, level, reason)
+
+    def gauges(self):
+        """
+        호출 한도 사용량 게이지 (메트릭 내보내기 시 계산)
+        인스턴스마다 값이 다르므로 소유한 쪽(WeatherAPI)이 instance 레이블과 함께 등록합니다.
+        """
+        usage = self.quota.usage()
+        gauges = [
+            ('quota_used', {'window': 'minute'}, usage['minute']),
+            ('quota_used', {'window': 'day'}, usage['day'])
+        ]
+        if usage['minute_limit']:
+            gauges.append(('quota_limit', {'window': 'minute'}, usage['minute_limit']))
+        if usage['day_limit']:
+            gauges.append(('quota_limit', {'window': 'day'}, usage['day_limit']))
+        return gauges
+
+    def stats(self):
+        """호스트별 토큰 버킷, 호출 한도 사용량, 우선순위별 요청/생략 수를 반환합니다."""
+        with self._lock:
+            buckets = dict(self._buckets)
+            endpoint_buckets = dict(self._endpoint_buckets)
+            allowed, shed = dict(self.allowed), dict(self.shed)
+        return {
+            'hosts': {host: bucket.stats() for host, bucket in buckets.items()},
+            'endpoints': {endpoint: bucket.stats() for endpoint, bucket in endpoint_buckets.items()},
+            'quota': self.quota.usage(),
+            'allowed': allowed,
+            'shed': shed
+        }
@@ -0,0 +1,65 @@
+"""
+요청 병합(single-flight) 모듈
+같은 키로 동시에 들어온 호출을 하나의 실제 호출로 합치고 결과를 공유합니다.
+"""
+import threading
+
+
+class _Call:
+    """진행 중인 호출 하나의 상태입니다."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    같은 키에 대해 진행 중인 호출이 있으면 새로 호출하지 않고
+    그 호출이 끝나기를 기다렸다가 같은 결과(또는 예외)를 받습니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self.calls = 0   # 실제로 실행된 호출 수
+        self.shared = 0  # 다른 호출의 결과를 공유받은 횟수
+
+    def do(self, key, func, *args):
+        """key에 대해 func(*args)를 한 번만 실행하고 결과를 반환합니다."""
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                self.shared += 1
+                leader = False
+            else:
+                call = _Call()
+                self._calls[key] = call
+                self.calls += 1
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func(*args)
+            return call.result
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def stats(self):
+        with self._lock:
+            return {
+                'calls': self.calls,
+                'shared': self.shared,
+                'in_flight': len(self._calls)
+            }
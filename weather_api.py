@@ -2,360 +2,681 @@
 OpenWeather API를 사용하여 날씨 데이터를 가져오는 모듈
 한글 지역명 검색과 구/동 단위 검색을 지원합니다.
 """
-import requests
+import itertools
 import json
-from datetime import datetime, timezone, timedelta
-from korean_locations import search_korean_location, get_all_korean_locations
+import threading
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from korean_locations import search_korean_location, find_korean_locations, get_location_coords
+from hangul import has_jamo
+from cache import GeocodeCache, ResponseCache, TTLCache, MISSING
+from http_client import HTTPClient, error_summary
+from forecast_parser import forecast_records
+from rate_limit import AUTOCOMPLETE, HostRateLimiter, priority
+from circuit_breaker import HostCircuitBreaker
+from key_pool import KeyPool
+from singleflight import SingleFlight
+from weather_engine import WeatherEngine
+from metrics import METRICS, bind, inc, span, submit_in_context
+from prefetch import Prefetcher
+from config import (
+    OPENWEATHER_BASE_URL, OPENWEATHER_GEOCODING_URL, OPENWEATHER_ONECALL_URL, WEATHER_FETCH_MODE,
+    GEOCODE_CACHE_SIZE, GEOCODE_CACHE_TTL, GEOCODE_NEGATIVE_TTL,
+    GEOCODE_CACHE_DB_PATH, GEOCODE_CACHE_DB_SIZE,
+    FETCH_CONCURRENTLY, FETCH_MAX_WORKERS, FETCH_ENGINE_MAX_WORKERS,
+    HTTP_POOL_SIZE, HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT,
+    HTTP_MAX_RETRIES, HTTP_BACKOFF_FACTOR, HTTP_BACKOFF_MAX,
+    HTTP_RATE_LIMIT, HTTP_RATE_BURST, BATCH_MAX_WORKERS,
+    API_QUOTA_PER_MINUTE, API_QUOTA_PER_DAY, ENDPOINT_QUOTAS_PER_MINUTE,
+    RATE_LIMIT_RESERVES, RATE_LIMIT_MAX_WAITS, KEY_UNAUTHORIZED_TIMEOUT, KEY_RATE_LIMITED_TIMEOUT,
+    PREFETCH_INTERVAL, PREFETCH_REFRESH_AHEAD, PREFETCH_MAX_WORKERS, PREFETCH_MAX_CALLS_PER_DAY,
+    RESPONSE_CACHE_SIZE, RESPONSE_CACHE_TTLS, RESPONSE_CACHE_GRID, RESPONSE_STALE_TTL,
+    FETCH_TIMEOUT, FETCH_STALE_TIMEOUT, CIRCUIT_FAILURE_THRESHOLD, CIRCUIT_RESET_TIMEOUT,
+    TEMPERATURE_UNIT, WEATHER_LANGUAGE,
+    AUTOCOMPLETE_MIN_REMOTE_CHARS, AUTOCOMPLETE_REMOTE_LIMIT,
+    AUTOCOMPLETE_CACHE_SIZE, AUTOCOMPLETE_CACHE_TTL
+)
+
+# 지오코딩 캐시 카운터 (좌표 조회마다 지나는 경로라 레이블을 미리 정해 둠)
+_count_geocode_table = bind('cache_requests_total', cache='geocode', result='table')
+_count_geocode_hit = bind('cache_requests_total', cache='geocode', result='hit')
+_count_geocode_miss = bind('cache_requests_total', cache='geocode', result='miss')
+
+# 게이지의 instance 레이블 (한 프로세스에 WeatherAPI가 여러 개일 때 구분)
+_instance_ids = itertools.count(1)
+
 
 class WeatherAPI:
-    def __init__(self, api_key):
-        self.api_key = api_key
-        self.base_url = "http://api.openweathermap.org/data/2.5"
-        self.geocoding_url = "http://api.openweathermap.org/geo/1.0"
+    """
+    OpenWeather 날씨 조회 클라이언트입니다.
+    api_key에 키 목록을 넘기면 키 풀을 만들어 요청을 여러 키에 나눠 보냅니다. (키마다 호출 한도 적용)
+    """
+    
+    def __init__(self, api_key, geocode_cache=None, response_cache=None, http_client=None,
+                 concurrent=FETCH_CONCURRENTLY, max_workers=FETCH_MAX_WORKERS, parsers=None,
+                 fetch_mode=WEATHER_FETCH_MODE, base_url=OPENWEATHER_BASE_URL,
+                 geocoding_url=OPENWEATHER_GEOCODING_URL, onecall_url=OPENWEATHER_ONECALL_URL):
+        # API 키 풀 (남은 한도가 많은 키부터 사용, 401/429를 받은 키는 잠시 제외)
+        keys = [api_key] if isinstance(api_key, str) else list(api_key)
+        self.key_pool = KeyPool(
+            keys,
+            quota_per_minute=API_QUOTA_PER_MINUTE,
+            quota_per_day=API_QUOTA_PER_DAY,
+            unauthorized_timeout=KEY_UNAUTHORIZED_TIMEOUT,
+            rate_limited_timeout=KEY_RATE_LIMITED_TIMEOUT
+        )
+        self.api_key = self.key_pool.keys[0]  # 키 풀이 없는 HTTP 클라이언트를 주입한 경우에 사용
+        self.geocoding_url = geocoding_url
+        
+        # 지오코딩 캐시 (다른 캐시 구현을 주입할 수 있음)
+        if geocode_cache is None:
+            geocode_cache = GeocodeCache(
+                maxsize=GEOCODE_CACHE_SIZE,
+                ttl=GEOCODE_CACHE_TTL,
+                negative_ttl=GEOCODE_NEGATIVE_TTL,
+                db_path=GEOCODE_CACHE_DB_PATH,
+                db_maxsize=GEOCODE_CACHE_DB_SIZE
+            )
+        self.geocode_cache = geocode_cache
+        
+        # /weather, /forecast 응답 캐시 (반올림한 좌표 기준)
+        if response_cache is None:
+            response_cache = ResponseCache(
+                maxsize=RESPONSE_CACHE_SIZE,
+                ttls=RESPONSE_CACHE_TTLS,
+                grid=RESPONSE_CACHE_GRID,
+                stale_ttl=RESPONSE_STALE_TTL  # 서버 장애 시 마지막 정상 응답을 대신 사용
+            )
+        self.response_cache = response_cache
+        
+        # 자동완성 API 검색 결과 캐시 (정규화된 검색어 -> (결과, 전체 여부))
+        self.suggestion_cache = TTLCache(maxsize=AUTOCOMPLETE_CACHE_SIZE, ttl=AUTOCOMPLETE_CACHE_TTL)
+        
+        # 좌표 -> (지역명, 국가 코드) 역지오코딩 캐시 (지역명이 없는 One Call 응답에 사용)
+        self.place_cache = TTLCache(maxsize=GEOCODE_CACHE_SIZE, ttl=GEOCODE_CACHE_TTL)
+        
+        # 동일한 지오코딩/날씨 요청이 동시에 들어오면 하나로 합침
+        self._singleflight = SingleFlight()
+        
+        # 인스턴스가 소유하는 공용 연결 풀 (keep-alive, 타임아웃, 재시도, 호출 한도, 키 풀)
+        # 전체 호출 한도는 키 수만큼 늘어나고, 키별 한도는 키 풀이 나눠 맞춤
+        if http_client is None:
+            key_count = len(self.key_pool)
+            rate_limiter = HostRateLimiter(
+                HTTP_RATE_LIMIT, HTTP_RATE_BURST,
+                quota_per_minute=API_QUOTA_PER_MINUTE and API_QUOTA_PER_MINUTE * key_count,
+                quota_per_day=API_QUOTA_PER_DAY and API_QUOTA_PER_DAY * key_count,
+                endpoint_quotas=ENDPOINT_QUOTAS_PER_MINUTE,
+                reserves=RATE_LIMIT_RESERVES,
+                max_waits=RATE_LIMIT_MAX_WAITS
+            ) if HTTP_RATE_LIMIT else None
+            http_client = HTTPClient(
+                pool_size=HTTP_POOL_SIZE,
+                connect_timeout=HTTP_CONNECT_TIMEOUT,
+                read_timeout=HTTP_READ_TIMEOUT,
+                max_retries=HTTP_MAX_RETRIES,
+                backoff_factor=HTTP_BACKOFF_FACTOR,
+                backoff_max=HTTP_BACKOFF_MAX,
+                rate_limiter=rate_limiter,
+                circuit_breaker=HostCircuitBreaker(CIRCUIT_FAILURE_THRESHOLD, CIRCUIT_RESET_TIMEOUT),
+                key_pool=self.key_pool
+            )
+        self.http = http_client
+        
+        # 호출 한도/키별 사용량 게이지 (인스턴스마다 한 번, instance 레이블로 구분)
+        self.instance = str(next(_instance_ids))
+        METRICS.add_collector(self._collect_gauges, instance=self.instance)
+        
+        # 좌표 -> 날씨 조회 엔진 (요청, 응답 캐시, 파서 단계를 교체할 수 있음)
+        self.engine = WeatherEngine(
+            self.api_key,
+            transport=http_client,
+            cache=response_cache,
+            parsers=parsers,
+            base_url=base_url,
+            units=TEMPERATURE_UNIT,  # 섭씨 온도 사용
+            lang=WEATHER_LANGUAGE,   # 한국어 설명
+            singleflight=self._singleflight,
+            mode=fetch_mode,         # "standard" 또는 "onecall"
+            onecall_url=onecall_url,
+            timeout=FETCH_TIMEOUT,   # 서버가 느려도 이 시간 안에 응답 또는 오류 반환
+            stale_timeout=FETCH_STALE_TIMEOUT,
+            max_workers=FETCH_ENGINE_MAX_WORKERS
+        )
+        
+        # 현재 날씨/예보 병렬 요청용 스레드 풀
+        self.concurrent = concurrent
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="weather-api"
+        ) if concurrent else None
+        
+        # 여러 지역 일괄 조회용 스레드 풀 (처음 사용할 때 생성)
+        # 일괄 작업이 내부에서 _executor를 사용하므로 같은 풀을 쓰면 교착될 수 있어 분리함
+        self.batch_max_workers = BATCH_MAX_WORKERS
+        self._batch_executor = None
+        self._batch_lock = threading.Lock()
+        
+        # 인기 지역 미리 갱신 스레드 (start_prefetch로 시작)
+        self.prefetcher = None
+    
+    @property
+    def base_url(self):
+        """날씨 API 기본 URL (엔진 설정)"""
+        return self.engine.base_url
+    
+    @base_url.setter
+    def base_url(self, value):
+        self.engine.base_url = value
+    
+    @property
+    def fetch_mode(self):
+        """날씨 조회 방식 ("standard" 또는 "onecall")"""
+        return self.engine.mode
+    
+    @property
+    def units(self):
+        return self.engine.units
+    
+    @property
+    def lang(self):
+        return self.engine.lang
+    
+    def start_prefetch(self, locations, interval=PREFETCH_INTERVAL,
+                       refresh_ahead=PREFETCH_REFRESH_AHEAD, max_workers=PREFETCH_MAX_WORKERS,
+                       max_calls_per_day=None):
+        """
+        지정한 지역의 날씨 응답을 캐시 만료 전에 백그라운드에서 미리 갱신합니다.
+        이미 실행 중이면 멈추고 새 지역 목록으로 다시 시작합니다.
+        max_calls_per_day를 지정하지 않으면 조회 방식별 PREFETCH_MAX_CALLS_PER_DAY를 사용합니다.
+        
+        Returns:
+            Prefetcher: 실행 중인 갱신 스레드 (stats()로 통계 확인)
+        """
+        self.stop_prefetch()
+        if max_calls_per_day is None:
+            max_calls_per_day = PREFETCH_MAX_CALLS_PER_DAY.get(self.fetch_mode)
+        self.prefetcher = Prefetcher(self, locations, interval=interval,
+                                     refresh_ahead=refresh_ahead, max_workers=max_workers,
+                                     max_calls_per_day=max_calls_per_day)
+        return self.prefetcher.start()
+    
+    def stop_prefetch(self):
+        """미리 갱신 스레드를 멈춥니다."""
+        if self.prefetcher is not None:
+            self.prefetcher.stop()
+            self.prefetcher = None
+    
+    def close(self):
+        """미리 갱신 스레드, 스레드 풀, HTTP 연결을 정리합니다."""
+        self.stop_prefetch()
+        self.engine.close()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        if self._batch_executor is not None:
+            self._batch_executor.shutdown(wait=False)
+            self._batch_executor = None
+        self.http.close()
+    
+    def _collect_gauges(self):
+        gauges = []
+        for source in (getattr(self.http, 'rate_limiter', None), getattr(self.http, 'key_pool', None)):
+            if source is not None:
+                gauges.extend(source.gauges())
+        return gauges
+    
+    def _run_parallel(self, *tasks):
+        """
+        (함수, 인자...) 형태의 작업들을 동시에 실행하고 결과를 순서대로 반환합니다.
+        병렬 모드가 꺼져 있으면 순서대로 실행합니다.
+        """
+        if self._executor is None:
+            return [func(*args) for func, *args in tasks]
+        
+        futures = [submit_in_context(self._executor, func, *args) for func, *args in tasks]
+        return [future.result() for future in futures]
     
     def get_coordinates(self, city_name):
         """도시 이름으로 위도, 경도를 가져옵니다. 한글 검색을 지원합니다."""
         try:
-            # 1. 먼저 한글 지역명 데이터베이스에서 검색
-            english_location = search_korean_location(city_name)
-            if english_location:
-                # 한글 -> 영문 변환된 지역명으로 검색
-                search_query = english_location
-                print(f"한글 지역 '{city_name}' -> 영문 '{english_location}'로 변환하여 검색")
-            else:
-                # 영문 그대로 또는 한글 그대로 검색
-                search_query = city_name
-            
-            url = f"{self.geocoding_url}/direct"
-            params = {
-                'q': search_query,
-                'limit': 5,  # 더 많은 결과를 가져와서 정확도 향상
-                'appid': self.api_key
-            }
-            response = requests.get(url, params=params)
-            response.raise_for_status()
-            
-            data = response.json()
-            if data:
-                # 가장 적합한 결과 선택 (첫 번째 결과 우선)
-                best_match = data[0]
-                
-                # 한국 지역인 경우 더 정확한 매칭 시도
-                for location in data:
-                    if location.get('country') == 'KR':
-                        best_match = location
-                        break
-                
-                return best_match['lat'], best_match['lon'], best_match.get('country', 'Unknown')
-            else:
+            result = self._resolve_coordinates(city_name)
+            if result is None:
                 print(f"'{city_name}' 지역을 찾을 수 없습니다.")
                 return None, None, None
+            return result
                 
         except Exception as e:
             print(f"좌표 조회 중 오류 발생: {e}")
             return None, None, None
     
+    def _resolve_coordinates(self, city_name):
+        """
+        지역 좌표 테이블, 지오코딩 캐시, 지오코딩 API 순으로 좌표를 찾습니다.
+        테이블/캐시 적중은 자주 호출되므로 카운터만 기록하고, API를 기다리는 경우만 'geocode' 단계로 기록합니다.
+        
+        Returns:
+            tuple: (lat, lon, country). 찾을 수 없으면 None (API 오류는 예외로 전달)
+        """
+        # 1. 먼저 한글 지역명 데이터베이스에서 검색
+        english_location = search_korean_location(city_name)
+        if english_location:
+            # 좌표 테이블에 있는 지역은 지오코딩 API 없이 바로 반환
+            location_coords = get_location_coords(english_location)
+            if location_coords:
+                lat, lon, _ = location_coords
+                _count_geocode_table()
+                return lat, lon, 'KR'
+            
+            # 한글 -> 영문 변환된 지역명으로 검색
+            search_query = english_location
+            print(f"한글 지역 '{city_name}' -> 영문 '{english_location}'로 변환하여 검색")
+        else:
+            # 영문 그대로 또는 한글 그대로 검색
+            search_query = city_name
+        
+        # 2. 캐시 확인 (정규화된 검색어 기준), 없으면 API 조회
+        result = self.geocode_cache.get(search_query)
+        if result is not MISSING:
+            _count_geocode_hit()
+            return result
+        _count_geocode_miss()
+        with span('geocode'):
+            key = ('geocode', GeocodeCache.normalize(search_query))
+            return self._singleflight.do(key, self._geocode, search_query)
+    
+    def _geocode(self, search_query):
+        """
+        지오코딩 API로 좌표를 조회하고 캐시에 저장합니다.
+        
+        Returns:
+            tuple: (lat, lon, country). 찾을 수 없으면 None
+        """
+        # 병합 대기 중 다른 호출이 이미 캐시를 채웠을 수 있음
+        cached = self.geocode_cache.peek(search_query)
+        if cached is not MISSING:
+            return cached
+        
+        url = f"{self.geocoding_url}/direct"
+        params = {
+            'q': search_query,
+            'limit': 5,  # 더 많은 결과를 가져와서 정확도 향상
+            'appid': self.api_key
+        }
+        data = self.http.get_json(url, params)
+        if not data:
+            self.geocode_cache.set(search_query, None)
+            return None
+        
+        # 가장 적합한 결과 선택 (첫 번째 결과 우선)
+        best_match = data[0]
+        
+        # 한국 지역인 경우 더 정확한 매칭 시도
+        for location in data:
+            if location.get('country') == 'KR':
+                best_match = location
+                break
+        
+        result = (best_match['lat'], best_match['lon'], best_match.get('country', 'Unknown'))
+        self.geocode_cache.set(search_query, result)
+        return result
+    
     def search_locations(self, query, limit=5):
         """
         지역 검색 기능 - 한글 검색어로 여러 결과를 반환합니다.
         자동완성 기능을 위해 사용됩니다.
         """
-        try:
-            results = []
-            
-            # 1. 한국 지역 데이터베이스에서 검색
-            all_korean_locations = get_all_korean_locations()
-            for korean_name, english_name in all_korean_locations.items():
-                if query.lower() in korean_name.lower():
-                    results.append({
-                        'korean_name': korean_name,
-                        'english_name': english_name,
-                        'display_name': f"{korean_name} ({english_name})",
-                        'type': 'local_db'
-                    })
-            
-            # 2. OpenWeather API에서도 검색 (영문)
+        with span('search'):
             try:
-                url = f"{self.geocoding_url}/direct"
-                params = {
-                    'q': query,
-                    'limit': limit,
-                    'appid': self.api_key
-                }
-                response = requests.get(url, params=params)
-                response.raise_for_status()
+                results = []
                 
-                api_data = response.json()
-                for location in api_data:
-                    location_name = location.get('name', '')
-                    state = location.get('state', '')
-                    country = location.get('country', '')
-                    
-                    display_name = location_name
-                    if state:
-                        display_name += f", {state}"
-                    if country:
-                        display_name += f", {country}"
-                    
+                # 1. 한국 지역 저장소에서 검색 (한글/영문 지역명, 모호한 이름은 모든 후보)
+                #    '부산 중구'처럼 상위 지역을 포함한 이름을 사용해 선택 시 다시 모호해지지 않도록 함
+                for location in find_korean_locations(query, limit=limit):
                     results.append({
-                        'korean_name': location_name,
-                        'english_name': location_name,
-                        'display_name': display_name,
-                        'type': 'api',
-                        'lat': location.get('lat'),
-                        'lon': location.get('lon'),
-                        'country': country
+                        'korean_name': location.full_name,
+                        'english_name': location.english_name,
+                        'display_name': f"{location.full_name} ({location.english_name})",
+                        'type': 'local_db',
+                        'lat': location.lat,
+                        'lon': location.lon,
+                        'country': 'KR'
                     })
-            except:
-                pass  # API 검색 실패해도 로컬 DB 결과는 반환
-            
-            # 중복 제거 및 정렬
-            unique_results = []
-            seen_names = set()
-            
-            for result in results:
-                key = result['korean_name'].lower()
-                if key not in seen_names:
-                    seen_names.add(key)
-                    unique_results.append(result)
-            
-            # 한국 지역 우선, 그 다음 길이순 정렬
-            unique_results.sort(key=lambda x: (
-                0 if x['type'] == 'local_db' else 1,
-                len(x['korean_name'])
-            ))
-            
-            return unique_results[:limit]
-            
-        except Exception as e:
-            print(f"지역 검색 중 오류 발생: {e}")
-            return []
+                
+                # 2. 로컬 결과가 부족할 때만 OpenWeather API에서도 검색 (영문)
+                #    입력 중인 자모('강ㄴ', 'ㄱㄴㄱ')나 너무 짧은 검색어는 API로 찾을 수 없으므로 제외
+                if (len(results) < limit and not has_jamo(query)
+                        and len(query.strip()) >= AUTOCOMPLETE_MIN_REMOTE_CHARS):
+                    # 자동완성 요청은 화면 조회보다 낮은 우선순위 (한도가 부족하면 로컬 결과만 반환)
+                    with priority(AUTOCOMPLETE):
+                        results.extend(self._get_remote_suggestions(query, limit - len(results)))
+                
+                # 중복 제거 및 정렬
+                unique_results = []
+                seen_names = set()
+                
+                for result in results:
+                    key = result['korean_name'].lower()
+                    if key not in seen_names:
+                        seen_names.add(key)
+                        unique_results.append(result)
+                
+                # 한국 지역 우선 (로컬 결과는 검색 인덱스의 순위를 유지)
+                unique_results.sort(key=lambda x: 0 if x['type'] == 'local_db' else 1)
+                
+                return unique_results[:limit]
+                
+            except Exception as e:
+                print(f"지역 검색 중 오류 발생: {e}")
+                return []
     
-    def get_current_weather(self, city_name):
-        """현재 날씨 정보를 가져옵니다."""
+    def _get_remote_suggestions(self, query, needed):
+        """
+        API 검색 제안을 캐시를 거쳐 가져옵니다.
+        더 짧은 검색어의 캐시된 결과가 있으면 걸러서 재사용하므로
+        입력을 이어갈 때마다 API를 호출하지 않습니다.
+        """
+        key = GeocodeCache.normalize(query)
+        cached = self.suggestion_cache.get(key)
+        if cached is not MISSING:
+            inc('cache_requests_total', cache='suggestion', result='hit')
+            return cached[0]
+        
+        # 'lon' -> 'lond'처럼 이전 검색어의 결과 중 새 검색어를 포함하는 것만 사용
+        for end in range(len(key) - 1, AUTOCOMPLETE_MIN_REMOTE_CHARS - 1, -1):
+            cached = self.suggestion_cache.peek(key[:end])
+            if cached is MISSING:
+                continue
+            suggestions, complete = cached
+            filtered = [
+                suggestion for suggestion in suggestions
+                if key in GeocodeCache.normalize(suggestion['display_name'])
+            ]
+            # 이전 결과가 잘리지 않았거나 필요한 개수를 채우면 재사용
+            if filtered and (complete or len(filtered) >= needed):
+                inc('cache_requests_total', cache='suggestion', result='prefix')
+                self.suggestion_cache.set(key, (filtered, complete))
+                return filtered
+            break
+        
+        inc('cache_requests_total', cache='suggestion', result='miss')
         try:
-            lat, lon, country = self.get_coordinates(city_name)
-            if lat is None or lon is None:
-                return None
-            
-            url = f"{self.base_url}/weather"
-            params = {
-                'lat': lat,
-                'lon': lon,
-                'appid': self.api_key,
-                'units': 'metric',  # 섭씨 온도 사용
-                'lang': 'kr'        # 한국어 설명
-            }
-            
-            response = requests.get(url, params=params)
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            # 데이터 정리
-            weather_data = {
-                'city': data['name'],
-                'country': country,
-                'temperature': round(data['main']['temp']),
-                'feels_like': round(data['main']['feels_like']),
-                'humidity': data['main']['humidity'],
-                'pressure': data['main']['pressure'],
-                'visibility': data.get('visibility', 0) / 1000,  # km로 변환
-                'wind_speed': data['wind']['speed'],
-                'wind_direction': data['wind'].get('deg', 0),
-                'weather_main': data['weather'][0]['main'],
-                'weather_description': data['weather'][0]['description'],
-                'weather_icon': data['weather'][0]['icon'],
-                'clouds': data['clouds']['all'],
-                'sunrise': self._convert_utc_to_local(data['sys']['sunrise'], data['timezone']).strftime('%H:%M'),
-                'sunset': self._convert_utc_to_local(data['sys']['sunset'], data['timezone']).strftime('%H:%M'),
-                'timezone': data['timezone'],
-                'dt': self._convert_utc_to_local(data['dt'], data['timezone']).strftime('%Y-%m-%d %H:%M:%S')
-            }
-            
-            return weather_data
-            
-        except Exception as e:
-            print(f"현재 날씨 조회 중 오류 발생: {e}")
-            return None
+            return self._singleflight.do(('suggest', key), self._search_remote_locations, query)
+        except Exception:
+            return []  # API 검색 실패해도 로컬 DB 결과는 반환
     
-    def get_5day_forecast(self, city_name):
-        """5일 날씨 예보를 가져옵니다."""
-        try:
-            lat, lon, country = self.get_coordinates(city_name)
-            if lat is None or lon is None:
-                return None
-            
-            url = f"{self.base_url}/forecast"
-            params = {
-                'lat': lat,
-                'lon': lon,
-                'appid': self.api_key,
-                'units': 'metric',
-                'lang': 'kr'
-            }
-            
-            response = requests.get(url, params=params)
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            # 타임존 정보 가져오기 (도시의 타임존 오프셋)
-            timezone_offset = data.get('city', {}).get('timezone', 0)
-            
-            forecast_list = []
-            for item in data['list']:
-                # 지역 시간으로 변환
-                local_dt = self._convert_utc_to_local(item['dt'], timezone_offset)
-                
-                forecast_item = {
-                    'datetime': local_dt.strftime('%Y-%m-%d %H:%M'),
-                    'date': local_dt.strftime('%Y-%m-%d'),
-                    'time': local_dt.strftime('%H:%M'),
-                    'temperature': round(item['main']['temp']),
-                    'feels_like': round(item['main']['feels_like']),
-                    'temp_min': round(item['main']['temp_min']),
-                    'temp_max': round(item['main']['temp_max']),
-                    'humidity': item['main']['humidity'],
-                    'pressure': item['main']['pressure'],
-                    'weather_main': item['weather'][0]['main'],
-                    'weather_description': item['weather'][0]['description'],
-                    'weather_icon': item['weather'][0]['icon'],
-                    'clouds': item['clouds']['all'],
-                    'wind_speed': item['wind']['speed'],
-                    'wind_direction': item['wind'].get('deg', 0),
-                    'pop': item.get('pop', 0) * 100  # 강수 확률을 %로 변환
-                }
-                forecast_list.append(forecast_item)
-            
-            return forecast_list
-            
-        except Exception as e:
-            print(f"5일 예보 조회 중 오류 발생: {e}")
-            return None
+    def _search_remote_locations(self, query):
+        """OpenWeather 지오코딩 API로 지역을 검색하고 결과를 제안 캐시에 저장합니다."""
+        url = f"{self.geocoding_url}/direct"
+        params = {
+            'q': query,
+            'limit': AUTOCOMPLETE_REMOTE_LIMIT,
+            'appid': self.api_key
+        }
+        api_data = self.http.get_json(url, params)
+        
+        results = []
+        for location in api_data:
+            location_name = location.get('name', '')
+            state = location.get('state', '')
+            country = location.get('country', '')
+            
+            display_name = location_name
+            if state:
+                display_name += f", {state}"
+            if country:
+                display_name += f", {country}"
+            
+            results.append({
+                'korean_name': location_name,
+                'english_name': location_name,
+                'display_name': display_name,
+                'type': 'api',
+                'lat': location.get('lat'),
+                'lon': location.get('lon'),
+                'country': country
+            })
+        
+        # 요청 한도보다 적게 왔으면 이 검색어의 결과 전체 (더 긴 검색어에서 걸러 쓸 수 있음)
+        complete = len(results) < AUTOCOMPLETE_REMOTE_LIMIT
+        self.suggestion_cache.set(GeocodeCache.normalize(query), (results, complete))
+        return results
     
-    def _convert_utc_to_local(self, utc_timestamp, timezone_offset):
+    def get_weather_bundle(self, city_name, as_frame=False):
         """
-        UTC 타임스탬프를 지역 시간으로 변환합니다.
+        현재 날씨와 5일 예보를 함께 가져옵니다.
+        좌표 조회는 한 번만 수행하고, 두 API 호출은 동시에 요청합니다.
         
         Args:
-            utc_timestamp: UTC 타임스탬프 (초)
-            timezone_offset: UTC로부터의 오프셋 (초)
+            city_name: 지역명
+            as_frame: True면 예보를 DataFrame으로 반환
         
         Returns:
-            datetime: 지역 시간으로 변환된 datetime 객체
+            tuple: (현재 날씨 dict, 5일 예보 list 또는 DataFrame). 실패한 항목은 None
         """
-        # UTC 시간으로 datetime 객체 생성
-        utc_dt = datetime.fromtimestamp(utc_timestamp, tz=timezone.utc)
-        
-        # 지역 시간으로 변환
-        local_tz = timezone(timedelta(seconds=timezone_offset))
-        local_dt = utc_dt.astimezone(local_tz)
+        lat, lon, country = self.get_coordinates(city_name)
+        if lat is None or lon is None:
+            return None, None
+        return self._weather_bundle_at(lat, lon, country, as_frame, name=city_name)
+    
+    def get_weather_bundle_by_coords(self, lat, lon, as_frame=False):
+        """
+        위도, 경도로 현재 날씨와 5일 예보를 함께 가져옵니다.
         
-        return local_dt
+        Returns:
+            tuple: (현재 날씨 dict, 5일 예보 list 또는 DataFrame). 실패한 항목은 None
+        """
+        return self._weather_bundle_at(lat, lon, None, as_frame)
+    
+    def get_current_weather(self, city_name):
+        """현재 날씨 정보를 가져옵니다."""
+        lat, lon, country = self.get_coordinates(city_name)
+        if lat is None or lon is None:
+            return None
+        return self._or_none("현재 날씨 조회", self._current_weather_at, lat, lon, country, city_name)
     
     def get_current_weather_by_coords(self, lat, lon):
         """
         위도, 경도로 현재 날씨 정보를 가져옵니다.
         현재 위치 기반 날씨 조회에 사용됩니다.
         """
-        try:
-            url = f"{self.base_url}/weather"
-            params = {
-                'lat': lat,
-                'lon': lon,
-                'appid': self.api_key,
-                'units': 'metric',
-                'lang': 'kr'
-            }
-            
-            response = requests.get(url, params=params)
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            # 데이터 정리
-            weather_data = {
-                'city': data['name'],
-                'country': data['sys']['country'],
-                'coordinates': {'lat': lat, 'lon': lon},
-                'temperature': round(data['main']['temp']),
-                'feels_like': round(data['main']['feels_like']),
-                'humidity': data['main']['humidity'],
-                'pressure': data['main']['pressure'],
-                'visibility': data.get('visibility', 0) / 1000,
-                'wind_speed': data['wind']['speed'],
-                'wind_direction': data['wind'].get('deg', 0),
-                'weather_main': data['weather'][0]['main'],
-                'weather_description': data['weather'][0]['description'],
-                'weather_icon': data['weather'][0]['icon'],
-                'clouds': data['clouds']['all'],
-                'sunrise': self._convert_utc_to_local(data['sys']['sunrise'], data['timezone']).strftime('%H:%M'),
-                'sunset': self._convert_utc_to_local(data['sys']['sunset'], data['timezone']).strftime('%H:%M'),
-                'timezone': data['timezone'],
-                'dt': self._convert_utc_to_local(data['dt'], data['timezone']).strftime('%Y-%m-%d %H:%M:%S')
-            }
-            
-            return weather_data
-            
-        except Exception as e:
-            print(f"좌표 기반 날씨 조회 중 오류 발생: {e}")
+        return self._or_none("좌표 기반 날씨 조회", self._current_weather_at, lat, lon)
+    
+    def get_5day_forecast(self, city_name, as_frame=False):
+        """5일 날씨 예보를 가져옵니다. as_frame=True면 DataFrame으로 반환합니다."""
+        lat, lon, country = self.get_coordinates(city_name)
+        if lat is None or lon is None:
             return None
+        return self._or_none("5일 예보 조회", self._forecast_at, lat, lon, as_frame)
     
-    def get_5day_forecast_by_coords(self, lat, lon):
+    def get_5day_forecast_by_coords(self, lat, lon, as_frame=False):
         """
         위도, 경도로 5일 날씨 예보를 가져옵니다.
         현재 위치 기반 예보 조회에 사용됩니다.
         """
+        return self._or_none("좌표 기반 5일 예보 조회", self._forecast_at, lat, lon, as_frame)
+    
+    def get_current_weather_many(self, queries, max_workers=None):
+        """
+        여러 지역의 현재 날씨를 동시에 가져와 완료되는 순서대로 반환하는 제너레이터입니다.
+        좌표는 지역 좌표 테이블과 지오코딩 캐시를 먼저 사용하고, 요청은 호스트별 속도 제한을 따릅니다.
+        한 지역이 실패해도 나머지 결과는 계속 반환합니다.
+        
+        Args:
+            queries: 지역명 목록
+            max_workers: 동시에 조회할 최대 지역 수 (None이면 BATCH_MAX_WORKERS)
+        
+        Yields:
+            dict: {'query': 지역명, 'result': 현재 날씨 dict 또는 None, 'error': 오류 요약 또는 None}
+        """
+        return self._run_batch(self._get_current_weather_or_raise, queries, max_workers)
+    
+    def get_weather_bundle_many(self, queries, max_workers=None, as_frame=False):
+        """
+        여러 지역의 현재 날씨와 5일 예보를 동시에 가져와 완료되는 순서대로 반환하는 제너레이터입니다.
+        (지역 비교 화면에서 사용)
+        
+        Yields:
+            dict: {'query': 지역명, 'result': (현재 날씨 dict, 5일 예보 list 또는 DataFrame) 또는 None,
+                   'error': 오류 요약 또는 None}
+        """
+        return self._run_batch(
+            partial(self._get_weather_bundle_or_raise, as_frame=as_frame), queries, max_workers
+        )
+    
+    def _run_batch(self, func, queries, max_workers=None):
+        """지역마다 func(query)를 일괄 실행 스레드 풀에서 실행하고 완료 순서대로 결과를 반환합니다."""
+        queries = list(queries)
+        if not queries:
+            return
+        
+        executor = self._get_batch_executor()
+        # 풀 크기보다 적은 동시 실행을 요청하면 그만큼만 먼저 제출하고, 하나가 끝날 때마다 채움
+        limit = max_workers or self.batch_max_workers
+        pending = iter(queries)
+        futures = {}
+        
+        def submit_next():
+            query = next(pending, None)
+            if query is not None:
+                futures[submit_in_context(executor, func, query)] = query
+        
+        for _ in range(min(limit, len(queries))):
+            submit_next()
+        
         try:
-            url = f"{self.base_url}/forecast"
-            params = {
-                'lat': lat,
-                'lon': lon,
-                'appid': self.api_key,
-                'units': 'metric',
-                'lang': 'kr'
-            }
-            
-            response = requests.get(url, params=params)
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            # 타임존 정보 가져오기
-            timezone_offset = data.get('city', {}).get('timezone', 0)
-            
-            forecast_list = []
-            for item in data['list']:
-                # 지역 시간으로 변환
-                local_dt = self._convert_utc_to_local(item['dt'], timezone_offset)
-                
-                forecast_item = {
-                    'datetime': local_dt.strftime('%Y-%m-%d %H:%M'),
-                    'date': local_dt.strftime('%Y-%m-%d'),
-                    'time': local_dt.strftime('%H:%M'),
-                    'temperature': round(item['main']['temp']),
-                    'feels_like': round(item['main']['feels_like']),
-                    'temp_min': round(item['main']['temp_min']),
-                    'temp_max': round(item['main']['temp_max']),
-                    'humidity': item['main']['humidity'],
-                    'pressure': item['main']['pressure'],
-                    'weather_main': item['weather'][0]['main'],
-                    'weather_description': item['weather'][0]['description'],
-                    'weather_icon': item['weather'][0]['icon'],
-                    'clouds': item['clouds']['all'],
-                    'wind_speed': item['wind']['speed'],
-                    'wind_direction': item['wind'].get('deg', 0),
-                    'pop': item.get('pop', 0) * 100
-                }
-                forecast_list.append(forecast_item)
-            
-            return forecast_list
-            
+            while futures:
+                future = next(as_completed(futures))
+                query = futures.pop(future)
+                submit_next()
+                try:
+                    yield {'query': query, 'result': future.result(), 'error': None}
+                except Exception as e:
+                    # 응답에는 API 키/URL이 없는 요약만 담고, 자세한 내용은 로그로 남김
+                    print(f"'{query}' 일괄 조회 중 오류 발생: {e}")
+                    yield {'query': query, 'result': None, 'error': error_summary(e)}
+        finally:
+            # 호출한 쪽이 중간에 멈추면 아직 시작하지 않은 작업은 취소
+            for future in futures:
+                future.cancel()
+    
+    def _get_batch_executor(self):
+        with self._batch_lock:
+            if self._batch_executor is None:
+                self._batch_executor = ThreadPoolExecutor(
+                    max_workers=self.batch_max_workers,
+                    thread_name_prefix="weather-api-batch"
+                )
+            return self._batch_executor
+    
+    def _require_coordinates(self, city_name):
+        """일괄 조회용: 좌표를 찾고, 없으면 LookupError를 발생시킵니다."""
+        coordinates = self._resolve_coordinates(city_name)
+        if coordinates is None:
+            raise LookupError(f"'{city_name}' 지역을 찾을 수 없습니다.")
+        return coordinates
+    
+    def _get_current_weather_or_raise(self, city_name):
+        """일괄 조회용: 현재 날씨를 가져오고, 실패하면 원인을 담은 예외를 발생시킵니다."""
+        lat, lon, country = self._require_coordinates(city_name)
+        return self._current_weather_at(lat, lon, country, city_name)
+    
+    def _get_weather_bundle_or_raise(self, city_name, as_frame=False):
+        """일괄 조회용: 현재 날씨와 예보를 가져오고, 실패하면 원인을 담은 예외를 발생시킵니다."""
+        lat, lon, country = self._require_coordinates(city_name)
+        current_weather, forecast_data = self._run_parallel(
+            (self._current_weather_at, lat, lon, country, city_name),
+            (self._forecast_at, lat, lon, as_frame)
+        )
+        return current_weather, forecast_data
+    
+    # ---- 좌표가 정해진 뒤의 공통 조회 경로 (모든 공개 메서드가 사용) ----
+    
+    def _or_none(self, label, func, *args):
+        """func를 실행하고, 실패하면 오류를 출력한 뒤 None을 반환합니다."""
+        try:
+            return func(*args)
         except Exception as e:
-            print(f"좌표 기반 5일 예보 조회 중 오류 발생: {e}")
+            print(f"{label} 중 오류 발생: {e}")
             return None
+    
+    def _weather_bundle_at(self, lat, lon, country=None, as_frame=False, name=None):
+        """
+        현재 날씨와 예보를 동시에 가져옵니다. 실패한 항목은 None입니다.
+        One Call 방식에서는 두 조회가 같은 요청 하나로 합쳐집니다.
+        """
+        current_weather, forecast_data = self._run_parallel(
+            (self._or_none, "현재 날씨 조회", self._current_weather_at, lat, lon, country, name),
+            (self._or_none, "5일 예보 조회", self._forecast_at, lat, lon, as_frame)
+        )
+        return current_weather, forecast_data
+    
+    def _current_weather_at(self, lat, lon, country=None, name=None):
+        """
+        좌표의 현재 날씨 dict를 만듭니다.
+        국가 코드는 지오코딩 결과(country)를 우선하고, 없으면 응답의 국가 코드를 사용합니다.
+        응답에 지역명이 없으면(One Call) 검색한 지역명(name)을, 그것도 없으면 역지오코딩 결과를 사용합니다.
+        """
+        record, age = self.engine.fetch_with_age('weather', lat, lon)
+        weather_data = record.to_dict()
+        if country:
+            weather_data['country'] = country
+        if not weather_data['city'] and name:
+            weather_data['city'] = name
+        if not weather_data['city'] or not weather_data['country']:
+            place_name, place_country = self._get_place(lat, lon)
+            weather_data['city'] = weather_data['city'] or place_name
+            weather_data['country'] = weather_data['country'] or place_country
+        weather_data['coordinates'] = {'lat': lat, 'lon': lon}
+        # 서버 지연/오류로 마지막 정상 응답을 사용했다면 그 경과 시간(초), 새 응답이면 None
+        weather_data['stale_seconds'] = age
+        return weather_data
+    
+    def _get_place(self, lat, lon):
+        """
+        좌표의 (지역명, 국가 코드)를 역지오코딩 API로 가져옵니다. (반올림한 좌표 기준으로 캐시)
+        찾지 못하거나 오류가 나면 좌표 문자열과 빈 국가 코드를 반환합니다.
+        """
+        key = self.response_cache.round_coords(lat, lon)
+        place = self.place_cache.get(key)
+        if place is not MISSING:
+            return place
+        
+        place = (f"{lat:.4f}, {lon:.4f}", '')
+        try:
+            params = {'lat': key[0], 'lon': key[1], 'limit': 1, 'appid': self.api_key}
+            data = self.http.get_json(f"{self.geocoding_url}/reverse", params)
+            if data:
+                place = (data[0].get('local_names', {}).get('ko') or data[0].get('name', place[0]),
+                         data[0].get('country', ''))
+        except Exception as e:
+            print(f"역지오코딩 중 오류 발생: {e}")
+            return place
+        
+        self.place_cache.set(key, place)
+        return place
+    
+    def _forecast_at(self, lat, lon, as_frame=False):
+        """
+        좌표의 5일 예보를 컬럼 단위 DataFrame으로 만듭니다.
+        as_frame=False면 같은 데이터를 3시간 단위 예보 dict 목록으로 반환합니다.
+        마지막 정상 응답을 사용했다면 DataFrame의 attrs['stale_seconds']에 경과 시간(초)이 들어갑니다.
+        """
+        record, age = self.engine.fetch_with_age('forecast', lat, lon)
+        with span('frame'):
+            frame = record.to_frame()
+        frame.attrs['stale_seconds'] = age
+        if as_frame:
+            return frame
+        with span('records'):
+            return forecast_records(frame)
 
     def get_weather_icon_url(self, icon_code):
         """날씨 아이콘 URL을 반환합니다."""
-        return f"http://openweathermap.org/img/wn/{icon_code}@2x.png"
\ No newline at end of file
+        return f"http://openweathermap.org/img/wn/{icon_code}@2x.png"
+
+
+if __name__ == "__main__":
+    # python -m weather_api serve: Streamlit 없이 JSON HTTP 서비스로 실행
+    from weather_service import main
+    raise SystemExit(main())
@@ -0,0 +1,225 @@
+"""
+날씨 조회 엔진 모듈
+좌표가 정해진 뒤의 날씨 조회(요청 -> 캐시 -> 파싱)를 한 곳에서 처리합니다.
+지역명 조회와 좌표 조회가 모두 이 엔진을 거치므로 연결 풀, 응답 캐시, 파서 개선이 두 경로에 똑같이 적용됩니다.
+"""
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+
+from cache import MISSING
+from forecast_parser import parse_current_weather, parse_forecast, parse_onecall
+from metrics import bind, inc, span, submit_in_context
+from singleflight import SingleFlight
+
+# API별 기본 응답 파서 (캐시에는 원본 JSON 대신 파싱된 레코드를 저장)
+# 'onecall' 파서는 {'weather': 레코드, 'forecast': 레코드}를 반환합니다.
+DEFAULT_PARSERS = {
+    'weather': parse_current_weather,
+    'forecast': parse_forecast,
+    'onecall': parse_onecall
+}
+
+# 조회 방식
+STANDARD = 'standard'  # /weather, /forecast를 각각 요청
+ONECALL = 'onecall'    # One Call API 한 번으로 현재 날씨와 예보를 함께 요청
+FETCH_MODES = (STANDARD, ONECALL)
+
+# One Call 응답에서 사용하지 않는 항목 (응답 크기 감소)
+ONECALL_EXCLUDE = 'minutely,alerts'
+
+# 응답 캐시 카운터 (조회마다 지나는 경로라 레이블을 미리 정해 둠)
+_count_response_hit = bind('cache_requests_total', cache='response', result='hit')
+_count_response_miss = bind('cache_requests_total', cache='response', result='miss')
+
+
+class WeatherEngine:
+    """
+    좌표로 날씨 데이터를 가져오는 엔진입니다. 각 단계는 교체할 수 있습니다.
+
+    - transport: get_json(url, params)을 제공하는 객체 (예: HTTPClient)
+    - cache: make_key/get/peek/set/remaining/get_stale을 제공하는 응답 캐시 (예: ResponseCache)
+    - parsers: {API: 응답 JSON -> 레코드 함수}
+
+    mode가 ONECALL이면 'weather'와 'forecast'를 One Call 응답 하나에서 꺼내므로
+    현재 날씨와 예보를 함께 조회해도 요청은 한 번입니다.
+    같은 캐시 키의 요청이 동시에 들어오면 한 번만 요청합니다.
+
+    응답 대기 시간은 서버가 아닌 엔진이 정합니다.
+    - timeout: 캐시가 만료된 요청을 기다리는 최대 시간 (None이면 서버 응답까지 대기)
+    - stale_timeout: 마지막 정상 응답(cache.get_stale)이 있을 때 새 응답을 기다리는 시간
+    - max_workers: 대기 시간을 제한하는 요청용 스레드 풀 크기 (엔진을 호출하는 쪽 스레드 풀 크기의 합보다 크게)
+    시간 안에 응답이 없거나 오류면 마지막 정상 응답을 경과 시간과 함께 반환하고,
+    요청은 백그라운드에서 계속 진행해 끝나면 캐시를 갱신합니다.
+    """
+
+    def __init__(self, api_key, transport, cache, parsers=None,
+                 base_url="http://api.openweathermap.org/data/2.5",
+                 units="metric", lang="kr", singleflight=None, mode=STANDARD,
+                 onecall_url="https://api.openweathermap.org/data/3.0/onecall",
+                 timeout=None, stale_timeout=2, max_workers=64):
+        if mode not in FETCH_MODES:
+            raise ValueError(f"지원하지 않는 조회 방식: {mode}")
+        self.mode = mode
+        self.onecall_url = onecall_url
+        self.api_key = api_key
+        self.transport = transport
+        self.cache = cache
+        self.parsers = dict(DEFAULT_PARSERS if parsers is None else parsers)
+        self.base_url = base_url
+        self.units = units
+        self.lang = lang
+        self._singleflight = singleflight if singleflight is not None else SingleFlight()
+
+        # 대기 시간 제한이 있는 요청을 실행하는 스레드 풀 (처음 사용할 때 생성)
+        self.timeout = timeout
+        self.stale_timeout = stale_timeout
+        self.max_workers = max_workers
+        self._executor = None
+        self._pending = {}  # 캐시 키 -> (진행 중인 Future, 시작 Event)
+        self._lock = threading.Lock()
+        self.stale_served = 0  # 마지막 정상 응답으로 대신한 횟수
+
+    def fetch(self, endpoint, lat, lon):
+        """
+        엔드포인트 데이터를 캐시를 거쳐 가져옵니다.
+        좌표는 캐시 격자 단위로 반올림해서 요청하므로 가까운 위치의 요청이 응답을 공유합니다.
+
+        Args:
+            endpoint: 'weather' 또는 'forecast'
+
+        Returns:
+            파서가 만든 레코드 (기본: CurrentWeather 또는 Forecast)
+        """
+        return self.fetch_with_age(endpoint, lat, lon)[0]
+
+    def fetch_with_age(self, endpoint, lat, lon):
+        """
+        fetch()와 같지만 (레코드, 경과 시간)을 반환합니다.
+        경과 시간은 마지막 정상 응답으로 대신한 경우 그 응답을 받은 뒤 지난 초, 새 응답이면 None입니다.
+        """
+        with span('fetch', endpoint=endpoint) as attrs:
+            if self.mode == ONECALL:
+                record, age = self._fetch_source(ONECALL, lat, lon)
+                record = record[endpoint]
+            else:
+                record, age = self._fetch_source(endpoint, lat, lon)
+            attrs['stale_seconds'] = age
+            return record, age
+
+    def sources(self):
+        """현재 조회 방식에서 실제로 요청하는 API 목록을 반환합니다."""
+        return (ONECALL,) if self.mode == ONECALL else ('weather', 'forecast')
+
+    def remaining(self, source, lat, lon):
+        """API(source) 응답 캐시의 남은 유효 시간(초)을 반환합니다. 없으면 0입니다."""
+        return self.cache.remaining(self.cache.make_key(source, lat, lon, self.units, self.lang))
+
+    def refresh(self, source, lat, lon):
+        """
+        캐시 유효 여부와 관계없이 API(source)를 다시 요청해 캐시를 갱신합니다.
+        같은 키의 일반 조회가 동시에 들어오면 이 요청 결과를 함께 사용합니다.
+        """
+        key = self.cache.make_key(source, lat, lon, self.units, self.lang)
+        return self._singleflight.do(key, self._load, key, True)
+
+    def _fetch_source(self, source, lat, lon):
+        """API(source) 하나의 파싱된 응답을 캐시를 거쳐 (레코드, 경과 시간)으로 가져옵니다."""
+        key = self.cache.make_key(source, lat, lon, self.units, self.lang)
+        record = self.cache.get(key)
+        if record is not MISSING:
+            _count_response_hit()
+            return record, None
+        _count_response_miss()
+
+        stale = self.cache.get_stale(key)
+        if stale is MISSING and self.timeout is None:
+            return self._singleflight.do(key, self._load, key), None
+
+        # 요청은 스레드 풀에서 실행하고 정해진 시간만 기다림 (시간이 지나도 요청은 계속 진행되어 캐시를 채움)
+        wait = self.timeout if stale is MISSING else self.stale_timeout
+        future, started = self._load_async(key)
+        if stale is MISSING:
+            # 대신할 데이터가 없으면 스레드 풀 대기열에서 기다린 시간은 제한 시간에 넣지 않음 (요청 시작부터 측정)
+            while not (started.wait(0.1) or future.done()):
+                pass
+        try:
+            return future.result(timeout=wait), None
+        except Exception as e:
+            if stale is MISSING:
+                if isinstance(e, FutureTimeoutError):
+                    raise TimeoutError(f"날씨 응답 대기 시간 초과 ({wait}초)") from None
+                raise
+            record, age = stale
+            with self._lock:
+                self.stale_served += 1
+            inc('cache_requests_total', cache='response', result='stale')
+            reason = f"{wait}초 안에 응답 없음" if isinstance(e, FutureTimeoutError) else e
+            print(f"날씨 조회 지연/오류로 {age:.0f}초 전 데이터를 사용합니다: {reason}")
+            return record, age
+
+    def _load_async(self, key):
+        """
+        같은 키의 요청이 진행 중이면 그 요청을, 아니면 새로 시작한 요청을 반환합니다.
+
+        Returns:
+            tuple: (Future, 요청이 스레드 풀에서 실행되기 시작하면 설정되는 Event)
+        """
+        with self._lock:
+            pending = self._pending.get(key)
+            if pending is not None:
+                return pending
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="weather-engine"
+                )
+            started = threading.Event()
+
+            def run():
+                started.set()
+                return self._singleflight.do(key, self._load, key)
+
+            future = submit_in_context(self._executor, run)
+            pending = self._pending[key] = (future, started)
+        future.add_done_callback(lambda _: self._forget(key, future))
+        return pending
+
+    def _forget(self, key, future):
+        with self._lock:
+            pending = self._pending.get(key)
+            if pending is not None and pending[0] is future:
+                del self._pending[key]
+
+    def close(self):
+        """요청 스레드 풀을 정리합니다. (진행 중인 요청은 기다리지 않음)"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    def _load(self, key, force=False):
+        """캐시 키에 해당하는 데이터를 요청하고 파싱해서 캐시에 저장합니다."""
+        # 병합 대기 중 다른 호출이 이미 캐시를 채웠을 수 있음 (강제 갱신이 아닐 때만 재사용)
+        if not force:
+            record = self.cache.peek(key)
+            if record is not MISSING:
+                return record
+
+        source, rounded_lat, rounded_lon, units, lang = key
+        params = {
+            'lat': rounded_lat,
+            'lon': rounded_lon,
+            'appid': self.api_key,
+            'units': units,
+            'lang': lang
+        }
+        if source == ONECALL:
+            url = self.onecall_url
+            params['exclude'] = ONECALL_EXCLUDE
+        else:
+            url = f"{self.base_url}/{source}"
+        data = self.transport.get_json(url, params)
+        with span('parse', source=source):
+            record = self.parsers[source](data)
+        self.cache.set(key, record)
+        return record
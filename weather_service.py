@@ -0,0 +1,366 @@
+"""
+날씨 HTTP 서비스 모듈
+Streamlit 화면 없이 WeatherAPI의 한글 지역 검색과 날씨 조회를 JSON HTTP API로 제공합니다.
+
+    python -m weather_api serve --port 8080
+
+    GET  /current?q=강남구            현재 날씨 (또는 ?lat=37.5&lon=127.0)
+    GET  /forecast?q=부산             5일 예보 (3시간 간격 목록)
+    GET  /autocomplete?q=해운&limit=5  지역 자동완성
+    GET  /batch?q=서울&q=부산          여러 지역 현재 날씨 (&forecast=1이면 예보 포함)
+    POST /batch                       {"queries": ["서울", "부산"], "forecast": false}
+    GET  /health, /metrics            상태 확인, Prometheus 메트릭
+
+하나의 WeatherAPI(연결 풀, 지오코딩/응답 캐시, 키 풀, 호출 한도)를 모든 요청이 공유합니다.
+요청 처리는 asyncio 이벤트 루프에서 하고, 외부 API를 기다리는 조회만 스레드 풀에서 실행합니다.
+같은 요청의 JSON 응답은 짧게 보관해 캐시 적중 시 스레드 풀을 거치지 않고 바로 응답합니다.
+"""
+import argparse
+import asyncio
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from urllib.parse import parse_qs, urlsplit
+
+import requests
+
+from cache import TTLCache, MISSING
+from forecast_parser import forecast_records
+from http_client import error_summary
+from metrics import METRICS, bind, inc, span, submit_in_context
+from weather_api import WeatherAPI
+from korean_locations import get_popular_korean_locations
+from config import (
+    OPENWEATHER_API_KEY, OPENWEATHER_API_KEYS, PREFETCH_ENABLED,
+    SERVICE_HOST, SERVICE_PORT, SERVICE_MAX_WORKERS, SERVICE_CACHE_SIZE, SERVICE_CACHE_TTL,
+    SERVICE_BATCH_MAX, SERVICE_MAX_BODY, SERVICE_KEEPALIVE_TIMEOUT
+)
+
+MAX_HEADER_SIZE = 16 * 1024  # 요청 줄 + 헤더 최대 크기 (바이트)
+
+# JSON 응답 캐시 카운터 (캐시 적중은 초당 수천 번 지나는 경로라 레이블을 미리 정해 둠)
+_count_service_hit = bind('cache_requests_total', cache='service', result='hit')
+_count_service_miss = bind('cache_requests_total', cache='service', result='miss')
+
+
+class ServiceError(Exception):
+    """요청을 처리할 수 없는 경우 (HTTP 상태 코드와 함께 JSON 오류로 응답)"""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+def _json_body(data):
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+class WeatherService:
+    """
+    asyncio 기반 HTTP/1.1 서버입니다. (keep-alive 지원)
+
+    - api: 공유할 WeatherAPI 인스턴스
+    - max_workers: 외부 API 조회용 스레드 풀 크기
+    - cache_ttl: JSON 응답 보관 시간 (초, 0이면 보관하지 않음). 지난 데이터로 대신한 응답은 보관하지 않음
+    """
+
+    def __init__(self, api, host=SERVICE_HOST, port=SERVICE_PORT, max_workers=SERVICE_MAX_WORKERS,
+                 cache_size=SERVICE_CACHE_SIZE, cache_ttl=SERVICE_CACHE_TTL, batch_max=SERVICE_BATCH_MAX):
+        self.api = api
+        self.host = host
+        self.port = port
+        self.batch_max = batch_max
+        self.cache_ttl = cache_ttl
+        self.response_cache = TTLCache(maxsize=cache_size, ttl=cache_ttl) if cache_ttl else None
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="weather-service")
+        self._server = None
+        self._routes = {
+            ('GET', '/current'): self._current,
+            ('GET', '/forecast'): self._forecast,
+            ('GET', '/autocomplete'): self._autocomplete,
+            ('GET', '/batch'): self._batch,
+            ('POST', '/batch'): self._batch,
+        }
+
+    async def start(self):
+        """서버를 시작합니다. port가 0이면 빈 포트를 골라 self.port에 기록합니다."""
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self.port,
+                                                  limit=MAX_HEADER_SIZE)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def serve_forever(self):
+        if self._server is None:
+            await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        self._executor.shutdown(wait=False)
+
+    @property
+    def base_url(self):
+        return f"http://{self.host}:{self.port}"
+
+    async def _handle_connection(self, reader, writer):
+        try:
+            while True:
+                try:
+                    head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), SERVICE_KEEPALIVE_TIMEOUT)
+                except (asyncio.IncompleteReadError, asyncio.TimeoutError, ConnectionError):
+                    break
+                except asyncio.LimitOverrunError:
+                    await self._write(writer, HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE,
+                                      _json_body({'error': "요청 헤더가 너무 깁니다."}), keep_alive=False)
+                    break
+
+                try:
+                    method, target, version, headers = self._parse_head(head)
+                    length = int(headers.get('content-length', 0))
+                    if length > SERVICE_MAX_BODY:
+                        raise ServiceError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "요청 본문이 너무 깁니다.")
+                    body = await reader.readexactly(length) if length else b''
+                except ServiceError as e:
+                    await self._write(writer, e.status, _json_body({'error': str(e)}), keep_alive=False)
+                    break
+                except (ValueError, asyncio.IncompleteReadError):
+                    await self._write(writer, HTTPStatus.BAD_REQUEST,
+                                      _json_body({'error': "잘못된 HTTP 요청입니다."}), keep_alive=False)
+                    break
+
+                keep_alive = (version == 'HTTP/1.1' and headers.get('connection', '').lower() != 'close')
+                status, payload, content_type = await self.handle(method, target, body)
+                await self._write(writer, status, payload, content_type, keep_alive)
+                if not keep_alive:
+                    break
+        except ConnectionError:
+            pass  # 클라이언트가 연결을 먼저 끊은 경우
+        finally:
+            writer.close()
+
+    @staticmethod
+    def _parse_head(head):
+        lines = head.decode('latin-1').split('\r\n')
+        method, target, version = lines[0].split(' ')
+        headers = {}
+        for line in lines[1:]:
+            if line:
+                name, _, value = line.partition(':')
+                headers[name.strip().lower()] = value.strip()
+        return method, target, version, headers
+
+    @staticmethod
+    async def _write(writer, status, payload, content_type='application/json; charset=utf-8', keep_alive=True):
+        status = HTTPStatus(status)
+        head = (f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+                f"Content-Type: {content_type}\r\n"
+                f"Content-Length: {len(payload)}\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+        writer.write(head.encode('latin-1') + payload)
+        await writer.drain()
+
+    async def handle(self, method, target, body=b''):
+        """
+        요청 하나를 처리합니다.
+
+        Returns:
+            tuple: (상태 코드, 응답 본문 bytes, Content-Type)
+        """
+        url = urlsplit(target)
+        path = url.path.rstrip('/') or '/'
+        if method == 'GET' and path == '/health':
+            return HTTPStatus.OK, _json_body({'status': 'ok'}), 'application/json; charset=utf-8'
+        if method == 'GET' and path == '/metrics':
+            return HTTPStatus.OK, METRICS.to_prometheus().encode('utf-8'), 'text/plain; version=0.0.4'
+
+        handler = self._routes.get((method, path))
+        if handler is None:
+            status = (HTTPStatus.METHOD_NOT_ALLOWED if any(route[1] == path for route in self._routes)
+                      else HTTPStatus.NOT_FOUND)
+            inc('service_requests_total', endpoint='other', status=status.value)
+            return status, _json_body({'error': status.phrase}), 'application/json; charset=utf-8'
+
+        cache_key = (path, url.query) if method == 'GET' else None
+        if cache_key is not None and self.response_cache is not None:
+            payload = self.response_cache.get(cache_key)
+            if payload is not MISSING:
+                inc('service_requests_total', endpoint=path, status=200)
+                _count_service_hit()
+                return HTTPStatus.OK, payload, 'application/json; charset=utf-8'
+
+        with span('service', endpoint=path) as attrs:
+            try:
+                params = parse_qs(url.query)
+                if body:
+                    params['json'] = json.loads(body)
+                data, cacheable = await handler(params)
+                status = HTTPStatus.OK
+            except ServiceError as e:
+                status, data, cacheable = e.status, {'error': str(e)}, False
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                status, data, cacheable = HTTPStatus.BAD_REQUEST, {'error': "JSON 본문을 읽을 수 없습니다."}, False
+            except Exception as e:
+                # 요청 URL(API 키 포함)이 담긴 자세한 오류는 로그에만 남기고 응답에는 요약만 담음
+                print(f"날씨 서비스 요청 처리 중 오류 발생: {e}")
+                if isinstance(e, TimeoutError):
+                    status, message = HTTPStatus.GATEWAY_TIMEOUT, "날씨 서버 응답 대기 시간 초과"
+                elif isinstance(e, requests.RequestException):
+                    status, message = HTTPStatus.BAD_GATEWAY, f"날씨 서버 요청 실패: {error_summary(e)}"
+                else:
+                    status, message = HTTPStatus.BAD_GATEWAY, "날씨 조회 중 오류가 발생했습니다."
+                data, cacheable = {'error': message}, False
+            attrs['status'] = int(status)
+
+        payload = _json_body(data)
+        inc('service_requests_total', endpoint=path, status=int(status))
+        if cache_key is not None and self.response_cache is not None:
+            _count_service_miss()
+            if cacheable:
+                self.response_cache.set(cache_key, payload)
+        return status, payload, 'application/json; charset=utf-8'
+
+    async def _call(self, func, *args):
+        """외부 API를 기다릴 수 있는 조회를 스레드 풀에서 실행합니다. (트레이스 유지)"""
+        return await asyncio.wrap_future(submit_in_context(self._executor, func, *args))
+
+    @staticmethod
+    def _param(params, name, default=None):
+        values = params.get(name)
+        return values[0].strip() if values else default
+
+    def _location(self, params):
+        """?q=지역명 또는 ?lat=..&lon=.. 에서 조회 위치를 꺼냅니다."""
+        query = self._param(params, 'q')
+        if query:
+            return query, None
+        lat, lon = self._param(params, 'lat'), self._param(params, 'lon')
+        if lat is None or lon is None:
+            raise ServiceError(HTTPStatus.BAD_REQUEST, "q 또는 lat, lon 파라미터가 필요합니다.")
+        try:
+            return None, (float(lat), float(lon))
+        except ValueError:
+            raise ServiceError(HTTPStatus.BAD_REQUEST, "lat, lon은 숫자여야 합니다.")
+
+    def _coordinates(self, query):
+        coordinates = self.api._resolve_coordinates(query)
+        if coordinates is None:
+            raise ServiceError(HTTPStatus.NOT_FOUND, f"'{query}' 지역을 찾을 수 없습니다.")
+        return coordinates
+
+    def _current_sync(self, query, coords):
+        if coords is not None:
+            return self.api._current_weather_at(*coords)
+        lat, lon, country = self._coordinates(query)
+        return self.api._current_weather_at(lat, lon, country, query)
+
+    def _forecast_sync(self, query, coords):
+        """(조회한 좌표, 예보 목록, 지난 데이터로 대신한 경우 경과 시간(초) 또는 None)"""
+        lat, lon = coords if coords is not None else self._coordinates(query)[:2]
+        return (lat, lon), *self._forecast_payload(self.api._forecast_at(lat, lon, as_frame=True))
+
+    @staticmethod
+    def _forecast_payload(frame):
+        if frame is None:
+            return None, None
+        return forecast_records(frame), frame.attrs.get('stale_seconds')
+
+    async def _current(self, params):
+        data = await self._call(self._current_sync, *self._location(params))
+        return data, data.get('stale_seconds') is None
+
+    async def _forecast(self, params):
+        query, coords = self._location(params)
+        coords, records, stale_seconds = await self._call(self._forecast_sync, query, coords)
+        data = {'query': query, 'coordinates': coords, 'forecast': records, 'stale_seconds': stale_seconds}
+        return data, stale_seconds is None
+
+    async def _autocomplete(self, params):
+        query = self._param(params, 'q', '')
+        if not query:
+            return {'query': query, 'results': []}, True
+        try:
+            limit = int(self._param(params, 'limit', 5))
+        except ValueError:
+            limit = 0
+        if not 1 <= limit <= 20:
+            raise ServiceError(HTTPStatus.BAD_REQUEST, "limit은 1~20 사이의 정수여야 합니다.")
+        results = await self._call(self.api.search_locations, query, limit)
+        return {'query': query, 'results': results}, True
+
+    async def _batch(self, params):
+        body = params.get('json')
+        if body is not None:
+            if not isinstance(body, dict) or not isinstance(body.get('queries'), list):
+                raise ServiceError(HTTPStatus.BAD_REQUEST, "본문은 {\"queries\": [...]} 형식이어야 합니다.")
+            if not all(isinstance(query, str) for query in body['queries']):
+                raise ServiceError(HTTPStatus.BAD_REQUEST, "queries에는 지역명 문자열만 넣을 수 있습니다.")
+            queries = [query.strip() for query in body['queries'] if query.strip()]
+            with_forecast = bool(body.get('forecast'))
+        else:
+            queries = [query.strip() for query in params.get('q', []) if query.strip()]
+            with_forecast = self._param(params, 'forecast', '0') not in ('0', 'false', '')
+        if not queries:
+            raise ServiceError(HTTPStatus.BAD_REQUEST, "조회할 지역(queries 또는 q)이 필요합니다.")
+        if len(queries) > self.batch_max:
+            raise ServiceError(HTTPStatus.BAD_REQUEST, f"한 번에 최대 {self.batch_max}개 지역까지 조회할 수 있습니다.")
+        items = await self._call(self._batch_sync, queries, with_forecast)
+        return {'results': items}, False
+
+    def _batch_sync(self, queries, with_forecast):
+        if with_forecast:
+            items = []
+            for item in self.api.get_weather_bundle_many(queries, as_frame=True):
+                current, frame = item['result'] if item['result'] is not None else (None, None)
+                forecast, stale_seconds = self._forecast_payload(frame)
+                items.append({'query': item['query'], 'current': current, 'forecast': forecast,
+                              'forecast_stale_seconds': stale_seconds, 'error': item['error']})
+        else:
+            items = [{'query': item['query'], 'current': item['result'], 'error': item['error']}
+                     for item in self.api.get_current_weather_many(queries)]
+        # 완료 순서가 아닌 요청한 순서로 반환
+        order = {query: i for i, query in reversed(list(enumerate(queries)))}
+        return sorted(items, key=lambda item: order[item['query']])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="날씨 HTTP 서비스 (Streamlit 없이 JSON API 제공)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    serve_parser = commands.add_parser("serve", help="HTTP 서비스 실행")
+    serve_parser.add_argument("--host", default=SERVICE_HOST)
+    serve_parser.add_argument("--port", type=int, default=SERVICE_PORT)
+    serve_parser.add_argument("--workers", type=int, default=SERVICE_MAX_WORKERS, help="외부 API 조회 스레드 수")
+    serve_parser.add_argument("--cache-ttl", type=float, default=SERVICE_CACHE_TTL, help="JSON 응답 보관 시간 (초)")
+    serve_parser.add_argument("--no-prefetch", action="store_true", help="인기 지역 미리 갱신 끄기")
+
+    args = parser.parse_args(argv)
+
+    api_keys = OPENWEATHER_API_KEYS or [os.getenv("OPENWEATHER_API_KEY", OPENWEATHER_API_KEY)]
+    api = WeatherAPI(api_keys)
+    if PREFETCH_ENABLED and not args.no_prefetch:
+        api.start_prefetch(get_popular_korean_locations())
+    service = WeatherService(api, args.host, args.port, max_workers=args.workers, cache_ttl=args.cache_ttl)
+
+    async def run():
+        await service.start()
+        print(f"날씨 서비스 실행 중: {service.base_url} (API 키 {len(api.key_pool)}개)")
+        try:
+            await service.serve_forever()
+        finally:
+            await service.close()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        api.close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())